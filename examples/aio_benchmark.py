@@ -0,0 +1,124 @@
+import asyncio
+import time
+from typing import Annotated, Callable, List, Type
+
+from bytex import Structure
+from bytex.aio import RecordProtocol, connect, serve
+from bytex.length_encodings import Prefix
+from bytex.types import U8, U16, U32, U64
+
+HOST = "127.0.0.1"
+
+
+class Tick(Structure):
+    kind: U8
+    symbol: U16
+    sequence: U32
+    price: U64
+
+
+class Chunk(Structure):
+    sequence: U32
+    payload: Annotated[bytes, Prefix(U32)]
+
+
+def echo(record: Structure, protocol: RecordProtocol[Structure]) -> None:
+    protocol.send(record)
+
+
+async def echo_stream(
+    structure_class: Type[Structure],
+    reader: asyncio.StreamReader,
+    writer: asyncio.StreamWriter,
+) -> None:
+    async for record in structure_class.astream(reader):
+        await record.awrite(writer, drain=False)
+        await writer.drain()
+
+    writer.close()
+
+
+async def protocol_round_trip(records: List[Structure], batch: int) -> None:
+    structure_class = type(records[0])
+    server = await serve(echo, structure_class, HOST, 0)
+    port = server.sockets[0].getsockname()[1]
+    loop = asyncio.get_running_loop()
+    replies: "asyncio.Future[None]" = loop.create_future()
+    pending = 0
+
+    def count(record: Structure, protocol: RecordProtocol[Structure]) -> None:
+        nonlocal pending
+        pending -= 1
+        if not pending:
+            replies.set_result(None)
+
+    async with server:
+        client = await connect(count, structure_class, HOST, port)
+        for start in range(0, len(records), batch):
+            sent = records[start : start + batch]
+            pending, replies = len(sent), loop.create_future()
+            client.send_many(sent)
+            await replies
+
+        client.close()
+        await client.wait_closed()
+
+
+async def stream_round_trip(records: List[Structure], batch: int) -> None:
+    structure_class = type(records[0])
+    server = await asyncio.start_server(
+        lambda reader, writer: echo_stream(structure_class, reader, writer), HOST, 0
+    )
+    port = server.sockets[0].getsockname()[1]
+
+    async with server:
+        reader, writer = await asyncio.open_connection(HOST, port)
+        for start in range(0, len(records), batch):
+            for record in records[start : start + batch]:
+                await record.awrite(writer, drain=False)
+            await writer.drain()
+            for _ in range(min(batch, len(records) - start)):
+                await structure_class.aparse(reader)
+
+        writer.close()
+        await writer.wait_closed()
+
+
+def measure(
+    name: str,
+    round_trip: Callable[[List[Structure], int], "asyncio.Future[None]"],
+    records: List[Structure],
+    batch: int,
+) -> None:
+    start = time.perf_counter()
+    asyncio.run(round_trip(records, batch))  # type: ignore[arg-type]
+    elapsed = time.perf_counter() - start
+
+    size = len(records[0].dump())
+    print(
+        f"{name:<10} {size:>7} B {len(records) / elapsed:>12,.0f} msgs/s "
+        f"{len(records) * size / elapsed / 2**20:>8,.1f} MiB/s"
+    )
+
+
+def main() -> None:
+    """
+    Echoes records through a loopback server, `batch` records in flight at a time,
+    and reports the round trips per second of `RecordProtocol` against asyncio
+    streams with `aparse`/`awrite`.
+    """
+    small: List[Structure] = [
+        Tick(kind=1, symbol=index % 500, sequence=index, price=index * 3)
+        for index in range(100_000)
+    ]
+    large: List[Structure] = [
+        Chunk(sequence=index, payload=bytes(64 * 1024)) for index in range(1_000)
+    ]
+
+    for records, batch in ((small, 1_000), (large, 16)):
+        measure("protocol", protocol_round_trip, records, batch)  # type: ignore[arg-type]
+        measure("streams", stream_round_trip, records, batch)  # type: ignore[arg-type]
+
+
+if __name__ == "__main__":
+    main()
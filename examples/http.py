@@ -3,7 +3,7 @@ import socket
 from datetime import datetime
 from typing import Annotated, List
 
-from bytex import Endianness, Structure
+from bytex import Endianness, StreamParser, Structure
 from bytex.length_encodings import Terminator
 from bytex.types import Data
 
@@ -39,6 +39,7 @@ def build_request() -> HTTPRequest:
             HTTPHeader(key="User-Agent", value="Structure"),
             HTTPHeader(key="Accept", value="*/*"),
             HTTPHeader(key="Date", value=str(datetime.now())),
+            HTTPHeader(key="Connection", value="close"),
         ],
     )
 
@@ -47,11 +48,14 @@ def main():
     request = build_request()
     raw_request = request.dump(endianness=Endianness.BIG)
 
+    parser = StreamParser(HTTPResponse, endianness=Endianness.BIG)
+
     with socket.create_connection((HOST, 80)) as sock:
         sock.sendall(raw_request)
-        raw_response = sock.recv(4096)
+        while chunk := sock.recv(4096):
+            parser.feed(chunk)
 
-    response = HTTPResponse.parse(raw_response, endianness=Endianness.BIG)
+    (response,) = parser.close()
 
     print(f"status: {response.status_code} {response.status}")
     print("headers:")
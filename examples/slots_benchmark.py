@@ -0,0 +1,82 @@
+import time
+import tracemalloc
+from typing import List, Tuple, Type
+
+from bytex import Structure
+from bytex.types import U8, U16, U32
+
+COUNT = 100_000
+
+
+class Point(Structure):
+    x: U16
+    y: U16
+
+
+class Reading(Structure):
+    sensor: U8
+    sequence: U32
+    point: Point
+
+
+class SlottedPoint(Structure, slots=True):
+    x: U16
+    y: U16
+
+
+class SlottedReading(Structure, slots=True):
+    sensor: U8
+    sequence: U32
+    point: SlottedPoint
+
+
+def parse_records(structure_class: Type[Structure], data: bytes) -> List[Structure]:
+    size = len(data) // COUNT
+    return [
+        structure_class.parse(data[offset : offset + size])
+        for offset in range(0, len(data), size)
+    ]
+
+
+def measure(structure_class: Type[Structure], data: bytes) -> Tuple[float, float]:
+    """
+    Returns the bytes allocated per parsed record still referenced, and the time it
+    takes to parse one.
+    """
+    tracemalloc.start()
+    records = parse_records(structure_class, data)
+    allocated, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del records
+
+    start = time.perf_counter()
+    parse_records(structure_class, data)
+    elapsed = time.perf_counter() - start
+
+    return allocated / COUNT, elapsed / COUNT
+
+
+def main() -> None:
+    """
+    Parses the same records into a default and a `slots=True` structure and reports
+    the memory each instance takes up, nested structure included.
+    """
+    data = b"".join(
+        Reading(
+            sensor=index % 256, sequence=index, point=Point(x=index % 65536, y=1)
+        ).dump()
+        for index in range(COUNT)
+    )
+
+    for name, structure_class in (
+        ("default", Reading),
+        ("slots", SlottedReading),
+    ):
+        per_record, per_parse = measure(structure_class, data)
+        print(
+            f"{name:<10} {per_record:>7,.0f} B/record {per_parse * 1e6:>7.2f} us/parse"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,15 +1,37 @@
-from bytex.bits import BitBuffer, Bits, from_bits, to_bits
+from bytex.bits import BitBuffer, BitReader, Bits, BitWriter, from_bits, to_bits
 from bytex.endianness import Endianness
 from bytex.sign import Sign
 from bytex.structure import Structure
 from bytex.structure_enum.structure_enum import StructureEnum
+from bytex.stream import StreamParser
+from bytex.struct_array import (
+    RecordFile,
+    StructArray,
+    column,
+    column_histogram,
+    column_max,
+    column_min,
+    column_sum,
+    open_records,
+)
 
 __all__ = [
     "Structure",
     "StructureEnum",
+    "StructArray",
+    "RecordFile",
+    "open_records",
+    "StreamParser",
+    "column",
+    "column_sum",
+    "column_min",
+    "column_max",
+    "column_histogram",
     "Sign",
     "Endianness",
     "BitBuffer",
+    "BitReader",
+    "BitWriter",
     "Bits",
     "to_bits",
     "from_bits",
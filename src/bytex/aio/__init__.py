@@ -0,0 +1,5 @@
+from bytex.aio.client import connect
+from bytex.aio.protocol import Handler, RecordProtocol
+from bytex.aio.server import serve
+
+__all__ = ["serve", "connect", "RecordProtocol", "Handler"]
@@ -0,0 +1,34 @@
+import asyncio
+from typing import Any, Optional, Type, TypeVar
+
+from bytex.aio.protocol import Handler, RecordProtocol
+from bytex.endianness import Endianness
+from bytex.structure._structure import _Structure
+
+S = TypeVar("S", bound=_Structure)
+
+
+async def connect(
+    handler: Optional[Handler[S]],
+    structure_class: Type[S],
+    host: str,
+    port: int,
+    endianness: Endianness = Endianness.LITTLE,
+    validate: bool = False,
+    **kwargs: Any,
+) -> RecordProtocol[S]:
+    """
+    Opens a TCP connection exchanging `structure_class` records, see
+    `RecordProtocol`. Without a `handler` the records received are read with
+    `receive`. Extra keyword arguments are passed to `loop.create_connection`.
+    """
+    loop = asyncio.get_running_loop()
+
+    _, protocol = await loop.create_connection(
+        lambda: RecordProtocol(structure_class, handler, endianness, validate),
+        host,
+        port,
+        **kwargs,
+    )
+
+    return protocol
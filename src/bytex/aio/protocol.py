@@ -0,0 +1,240 @@
+import asyncio
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Generic,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Type,
+    TypeVar,
+    cast,
+)
+
+from bytex.endianness import Endianness
+from bytex.stream import StreamParser
+from bytex.structure._structure import _Structure
+
+S = TypeVar("S", bound=_Structure)
+
+# Queued for `receive` once the connection is lost.
+_CLOSED = object()
+
+
+class RecordProtocol(asyncio.Protocol, Generic[S]):
+    """
+    An `asyncio.Protocol` that parses `structure_class` records out of the data a
+    connection receives as it arrives, and calls `handler` with every record and the
+    protocol itself, through which it can `send` records back. A handler returning an
+    awaitable is run as a task. Without a handler records are queued for `receive`.
+
+    Records sent during one iteration of the event loop are coalesced into a single
+    `transport.write`. While the transport's write buffer is full the connection
+    stops reading, so a peer that does not read its replies cannot make them pile up.
+
+    A handler raising or data that cannot be parsed aborts the connection, the error
+    is raised by `wait_closed`.
+    """
+
+    def __init__(
+        self,
+        structure_class: Type[S],
+        handler: Optional["Handler[S]"] = None,
+        endianness: Endianness = Endianness.LITTLE,
+        validate: bool = False,
+    ) -> None:
+        self._parser = StreamParser(structure_class, endianness, validate)
+        self._handler = handler
+        self._endianness = endianness
+        self._transport: Optional[asyncio.Transport] = None
+        self._outgoing: List[bytes] = []
+        self._flush_scheduled = False
+        self._paused = False
+        self._drain_waiters: List[asyncio.Future[None]] = []
+        self._tasks: Set[asyncio.Future[Any]] = set()
+        self._received: Optional[asyncio.Queue[Any]] = None
+        self._closed: Optional[asyncio.Future[None]] = None
+        self._error: Optional[BaseException] = None
+
+    @property
+    def structure_class(self) -> Type[S]:
+        return self._parser.structure_class
+
+    @property
+    def transport(self) -> Optional[asyncio.Transport]:
+        return self._transport
+
+    def connection_made(self, transport: asyncio.BaseTransport) -> None:
+        self._transport = cast(asyncio.Transport, transport)
+        self._closed = asyncio.get_event_loop().create_future()
+        if self._handler is None:
+            self._received = asyncio.Queue()
+
+    def data_received(self, data: bytes) -> None:
+        try:
+            records = self._parser.feed(data)
+        except Exception as e:  # noqa: BLE001
+            self._abort(e)
+            return
+
+        self._dispatch(records)
+
+    def connection_lost(self, exc: Optional[Exception]) -> None:
+        if exc is None and self._error is None:
+            try:
+                self._dispatch(self._parser.close())
+            except Exception as e:  # noqa: BLE001
+                self._error = e
+        elif self._error is None:
+            self._error = exc
+
+        self._outgoing.clear()
+        self._wake_drain_waiters()
+        if self._received is not None:
+            self._received.put_nowait(_CLOSED)
+
+        assert self._closed is not None
+        self._closed.set_result(None)
+
+    def pause_writing(self) -> None:
+        self._paused = True
+        if self._transport is not None:
+            self._transport.pause_reading()
+
+    def resume_writing(self) -> None:
+        self._paused = False
+        if self._transport is not None:
+            self._transport.resume_reading()
+
+        self._wake_drain_waiters()
+
+    def send(self, record: _Structure) -> None:
+        """
+        Queues `record` to be written along with the other records sent during this
+        iteration of the event loop.
+        """
+        self._check_open()
+        self._outgoing.append(record.dump(endianness=self._endianness))
+        self._schedule_flush()
+
+    def send_many(self, records: Iterable[_Structure]) -> None:
+        self._check_open()
+        self._outgoing.extend(
+            record.dump(endianness=self._endianness) for record in records
+        )
+        self._schedule_flush()
+
+    async def drain(self) -> None:
+        """
+        Writes the records sent so far, and waits until the transport's write buffer
+        has room again if it is full.
+        """
+        self._flush()
+
+        if self._paused and not self.is_closing():
+            waiter = asyncio.get_event_loop().create_future()
+            self._drain_waiters.append(waiter)
+            await waiter
+
+        if self._error is not None:
+            raise self._error
+
+    async def receive(self) -> S:
+        """
+        Waits for the next record received, for a protocol without a handler. Raises
+        `ConnectionError` once the connection is lost and every record was received.
+        """
+        if self._received is None:
+            raise RuntimeError("Records are passed to the handler, not received")
+
+        record = await self._received.get()
+        if record is _CLOSED:
+            self._received.put_nowait(_CLOSED)
+            raise ConnectionError("The connection is closed") from self._error
+
+        return cast(S, record)
+
+    def close(self) -> None:
+        """
+        Writes the records sent so far and closes the connection.
+        """
+        self._flush()
+        if self._transport is not None:
+            self._transport.close()
+
+    def is_closing(self) -> bool:
+        return self._transport is None or self._transport.is_closing()
+
+    async def wait_closed(self) -> None:
+        """
+        Waits until the connection is lost, and raises the error it was aborted with.
+        """
+        assert self._closed is not None
+        await asyncio.shield(self._closed)
+
+        if self._error is not None:
+            raise self._error
+
+    def _dispatch(self, records: List[S]) -> None:
+        for record in records:
+            if self._received is not None:
+                self._received.put_nowait(record)
+                continue
+
+            assert self._handler is not None
+            try:
+                result = self._handler(record, self)
+            except Exception as e:  # noqa: BLE001
+                self._abort(e)
+                return
+
+            if result is not None:
+                task = asyncio.ensure_future(result)
+                self._tasks.add(task)
+                task.add_done_callback(self._task_done)
+
+    def _task_done(self, task: "asyncio.Future[Any]") -> None:
+        self._tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            self._abort(cast(Exception, task.exception()))
+
+    def _check_open(self) -> None:
+        if self.is_closing():
+            raise ConnectionError("Cannot send on a closed connection")
+
+    def _schedule_flush(self) -> None:
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            asyncio.get_event_loop().call_soon(self._flush)
+
+    def _flush(self) -> None:
+        self._flush_scheduled = False
+        if not self._outgoing or self.is_closing():
+            return
+
+        assert self._transport is not None
+        if len(self._outgoing) == 1:
+            self._transport.write(self._outgoing[0])
+        else:
+            self._transport.write(b"".join(self._outgoing))
+
+        self._outgoing.clear()
+
+    def _abort(self, error: Exception) -> None:
+        if self._error is None:
+            self._error = error
+
+        if self._transport is not None:
+            self._transport.abort()
+
+    def _wake_drain_waiters(self) -> None:
+        for waiter in self._drain_waiters:
+            if not waiter.done():
+                waiter.set_result(None)
+
+        self._drain_waiters.clear()
+
+
+Handler = Callable[[S, RecordProtocol[S]], Optional[Awaitable[None]]]
@@ -0,0 +1,32 @@
+import asyncio
+from typing import Any, Optional, Type, TypeVar
+
+from bytex.aio.protocol import Handler, RecordProtocol
+from bytex.endianness import Endianness
+from bytex.structure._structure import _Structure
+
+S = TypeVar("S", bound=_Structure)
+
+
+async def serve(
+    handler: Handler[S],
+    structure_class: Type[S],
+    host: Optional[str] = None,
+    port: Optional[int] = None,
+    endianness: Endianness = Endianness.LITTLE,
+    validate: bool = False,
+    **kwargs: Any,
+) -> asyncio.Server:
+    """
+    Starts a TCP server calling `handler` with every `structure_class` record its
+    connections receive, see `RecordProtocol`. Extra keyword arguments are passed to
+    `loop.create_server`.
+    """
+    loop = asyncio.get_running_loop()
+
+    return await loop.create_server(
+        lambda: RecordProtocol(structure_class, handler, endianness, validate),
+        host,
+        port,
+        **kwargs,
+    )
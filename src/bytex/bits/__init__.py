@@ -1,5 +1,7 @@
 from bytex.bits.bit_buffer import BitBuffer
-from bytex.bits.types import Bits
+from bytex.bits.bit_reader import BitReader
+from bytex.bits.bit_writer import BitWriter
+from bytex.bits.types import BinaryFile, Bits, Buffer, WritableBuffer
 from bytex.bits.utils import (
     bits_to_string,
     from_bits,
@@ -11,11 +13,16 @@ from bytex.bits.utils import (
 
 __all__ = [
     "BitBuffer",
+    "BitReader",
+    "BitWriter",
     "is_subsequence",
     "to_bits",
     "from_bits",
     "to_binary",
     "Bits",
+    "Buffer",
+    "WritableBuffer",
+    "BinaryFile",
     "bits_to_string",
     "string_to_bits",
 ]
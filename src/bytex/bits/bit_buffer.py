@@ -1,56 +1,40 @@
 from __future__ import annotations
 
-from typing import List
+from bytex.bits.bit_reader import BitReader
+from bytex.bits.types import Bits, Buffer
+from bytex.bits.utils import from_bits
 
-from bytex.bits.utils import from_bits, to_bits
-from bytex.errors import InsufficientDataError
 
-Bits = List[bool]
+class BitBuffer(BitReader):
+    """
+    A `BitReader` that owns its data and can be appended to.
+    """
 
-
-class BitBuffer:
     def __init__(self) -> None:
-        self._bits: Bits = []
+        self._data: bytearray = bytearray()
+        self._offset = 0
+        self._end = 0
 
     def write(self, bits: Bits) -> None:
-        if len(bits) < 8:
-            self._bits.extend(bits)
-        else:
-            for i in range(0, len(bits), 8):
-                chunk = bits[i : i + 8]
-                self._bits.extend(chunk)
-
-    def read(self, count: int) -> Bits:
-        if count > len(self._bits):
-            raise InsufficientDataError(
-                f"Cannot read {count} bits, only {len(self._bits)} available"
-            )
-
-        result = self._bits[:count]
-        self._bits = self._bits[count:]
-        return result
+        index = 0
 
-    def peek(self, count: int) -> Bits:
-        if count > len(self._bits):
-            raise InsufficientDataError(
-                f"Cannot peek {count} bits, only {len(self._bits)} available"
-            )
+        if self._end % 8 == 0:
+            aligned_count = len(bits) - len(bits) % 8
+            self._data += from_bits(bits[:aligned_count])
+            self._end += aligned_count
+            index = aligned_count
 
-        return self._bits[:count]
-
-    def to_bits(self) -> Bits:
-        return list(self._bits)
-
-    def to_bytes(self) -> bytes:
-        return from_bits(self._bits)
+        for bit in bits[index:]:
+            if self._end % 8 == 0:
+                self._data.append(0)
+            if bit:
+                self._data[-1] |= 0x80 >> (self._end % 8)
+            self._end += 1
 
     @classmethod
-    def from_bytes(cls, data: bytes) -> BitBuffer:
+    def from_bytes(cls, data: Buffer) -> BitBuffer:
         bit_buffer = cls()
-        bits = to_bits(data)
-        bit_buffer.write(bits)
+        bit_buffer._data += data
+        bit_buffer._end = len(bit_buffer._data) * 8
 
         return bit_buffer
-
-    def __len__(self) -> int:
-        return len(self._bits)
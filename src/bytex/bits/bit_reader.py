@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+from typing import Optional
+
+from bytex.bits.types import Bits, Buffer
+from bytex.bits.utils import (
+    as_byte_view,
+    from_bits,
+    int_to_bits,
+    read_bytes,
+    read_int,
+)
+from bytex.errors import AlignmentError, InsufficientDataError
+
+
+class BitReader:
+    """
+    A read cursor over a bytes-like object.
+
+    The reader keeps a reference to the original data and a bit offset into it, so
+    reading, peeking and skipping never copy the unread remainder of the buffer.
+    """
+
+    def __init__(
+        self,
+        data: Buffer = b"",
+        bit_offset: int = 0,
+        bit_count: Optional[int] = None,
+    ) -> None:
+        self._data: Buffer = as_byte_view(data)
+        self._offset = bit_offset
+        self._end = len(self._data) * 8 if bit_count is None else bit_offset + bit_count
+
+        if not 0 <= self._offset <= self._end <= len(self._data) * 8:
+            raise InsufficientDataError(
+                f"Invalid bit range [{self._offset}, {self._end}) "
+                f"for a buffer of {len(self._data) * 8} bits"
+            )
+
+    @property
+    def offset(self) -> int:
+        return self._offset
+
+    @property
+    def end(self) -> int:
+        return self._end
+
+    @property
+    def data(self) -> Buffer:
+        return self._data
+
+    def is_aligned(self) -> bool:
+        return self._offset % 8 == 0
+
+    def read(self, count: int) -> Bits:
+        bits = self.peek(count)
+        self._offset += count
+        return bits
+
+    def peek(self, count: int) -> Bits:
+        self._ensure(count, action="peek")
+        return int_to_bits(read_int(self._data, self._offset, count), count)
+
+    def skip(self, count: int) -> None:
+        self._ensure(count, action="skip")
+        self._offset += count
+
+    def read_int(self, count: int) -> int:
+        value = self.peek_int(count)
+        self._offset += count
+        return value
+
+    def peek_int(self, count: int) -> int:
+        self._ensure(count, action="peek")
+        return read_int(self._data, self._offset, count)
+
+    def read_bytes(self, count: int) -> memoryview:
+        """
+        Reads `count` whole bytes. When the reader is byte aligned the result is a
+        slice of the underlying data and no bytes are copied.
+        """
+        self._ensure(8 * count, action="read")
+
+        result = memoryview(read_bytes(self._data, self._offset, count))
+        self._offset += 8 * count
+
+        return result
+
+    def to_bits(self) -> Bits:
+        return int_to_bits(read_int(self._data, self._offset, len(self)), len(self))
+
+    def to_bytes(self) -> bytes:
+        if len(self) % 8 != 0:
+            raise AlignmentError("Number of bits must be a multiple of 8")
+
+        if self.is_aligned():
+            return bytes(self._data[self._offset >> 3 : self._end >> 3])
+
+        return from_bits(self.to_bits())
+
+    def _ensure(self, count: int, action: str) -> None:
+        if count > len(self):
+            raise InsufficientDataError(
+                f"Cannot {action} {count} bits, only {len(self)} available"
+            )
+
+    def __len__(self) -> int:
+        return self._end - self._offset
@@ -0,0 +1,121 @@
+from typing import Optional
+
+from bytex.bits.types import Bits, Buffer, WritableBuffer
+from bytex.bits.utils import bits_to_int, int_to_bits
+from bytex.errors import AlignmentError, InsufficientSpaceError
+
+
+class BitWriter:
+    """
+    An append-only bit sink.
+
+    Whole bytes are flushed straight into a byte buffer, while the trailing sub-byte
+    bits are kept in an integer accumulator until they complete a byte. By default
+    the writer owns a growing `bytearray`. Given a caller-owned `buffer` it writes
+    into it in place starting at byte `offset`, and never resizes it.
+    """
+
+    def __init__(
+        self, buffer: Optional[WritableBuffer] = None, offset: int = 0
+    ) -> None:
+        self._buffer: WritableBuffer
+        self._limit: Optional[int]
+
+        if buffer is None:
+            self._buffer = bytearray()
+            self._limit = None
+            offset = 0
+        else:
+            self._buffer = buffer
+            self._limit = len(buffer)
+
+            if not 0 <= offset <= self._limit:
+                raise InsufficientSpaceError(
+                    f"Invalid offset {offset} for a buffer of {self._limit} bytes"
+                )
+
+        self._start = offset
+        self._position = offset
+        self._accumulator = 0
+        self._pending = 0
+
+    @property
+    def position(self) -> int:
+        """
+        The offset in the buffer right after the last whole byte written.
+        """
+        return self._position
+
+    def write(self, bits: Bits) -> None:
+        if bits:
+            self.write_int(bits_to_int(bits), len(bits))
+
+    def write_int(self, value: int, count: int) -> None:
+        """
+        Writes `value` as a `count` bits wide unsigned integer, MSB first.
+
+        `value` must fit in `count` bits.
+        """
+        if self._pending == 0 and count % 8 == 0:
+            self._flush(value.to_bytes(count >> 3, "big"))
+            return
+
+        self._accumulator = (self._accumulator << count) | value
+        self._pending += count
+
+        if self._pending >= 8:
+            remainder = self._pending & 7
+            self._flush(
+                (self._accumulator >> remainder).to_bytes(self._pending >> 3, "big")
+            )
+            self._accumulator &= (1 << remainder) - 1
+            self._pending = remainder
+
+    def write_bytes(self, data: Buffer) -> None:
+        if self._pending == 0:
+            self._flush(data)
+        else:
+            self.write_int(int.from_bytes(data, "big"), 8 * len(data))
+
+    def is_aligned(self) -> bool:
+        return self._pending == 0
+
+    def to_bits(self) -> Bits:
+        written = self._buffer[self._start : self._position]
+
+        return int_to_bits(
+            int.from_bytes(written, "big"), 8 * len(written)
+        ) + int_to_bits(self._accumulator, self._pending)
+
+    def to_bytes(self) -> bytes:
+        if self._pending:
+            raise AlignmentError("Number of bits must be a multiple of 8")
+
+        if self._limit is None:
+            return bytes(self._buffer)
+
+        return bytes(self._buffer[self._start : self._position])
+
+    def getbuffer(self) -> memoryview:
+        """
+        A view of the bytes written, without copying them. While it is alive a writer
+        owning its buffer cannot grow.
+        """
+        if self._pending:
+            raise AlignmentError("Number of bits must be a multiple of 8")
+
+        return memoryview(self._buffer)[self._start : self._position]
+
+    def _flush(self, data: Buffer) -> None:
+        end = self._position + len(data)
+        if self._limit is not None and end > self._limit:
+            raise InsufficientSpaceError(
+                f"Cannot write {len(data)} bytes at offset {self._position} "
+                f"of a {self._limit} bytes buffer"
+            )
+
+        self._buffer[self._position : end] = data
+        self._position = end
+
+    def __len__(self) -> int:
+        return 8 * (self._position - self._start) + self._pending
@@ -1,4 +1,5 @@
-from typing import TYPE_CHECKING, List
+import io
+from typing import TYPE_CHECKING, List, Union
 
 # Use `typing_extensions` only in `TYPE_CHECKING` mode to not require the `typing_extensions` module
 
@@ -6,5 +7,11 @@ if TYPE_CHECKING:
     from typing_extensions import TypeAlias
 
     Bits: TypeAlias = List[bool]
+    Buffer: TypeAlias = Union[bytes, bytearray, memoryview]
+    WritableBuffer: TypeAlias = Union[bytearray, memoryview]
+    BinaryFile: TypeAlias = Union[io.RawIOBase, io.BufferedIOBase]
 else:
     Bits = List[bool]
+    Buffer = Union[bytes, bytearray, memoryview]
+    WritableBuffer = Union[bytearray, memoryview]
+    BinaryFile = Union[io.RawIOBase, io.BufferedIOBase]
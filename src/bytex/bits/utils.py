@@ -1,43 +1,164 @@
 from typing import Union
 
-from bytex.bits.types import Bits
+from bytex.bits.types import Bits, Buffer
 from bytex.endianness import Endianness
-from bytex.errors import AlignmentError
+from bytex.errors import AlignmentError, InsufficientDataError
 
 
 def to_bits(data: Union[str, bytes], endianness: Endianness = Endianness.BIG) -> Bits:
     if isinstance(data, str):
         data = data.encode()
 
-    bits: Bits = []
-
-    for byte in data:
-        for i in range(8):
-            bits.append(bool((byte >> (7 - i)) & 1))
-
     if endianness == Endianness.LITTLE:
-        bits = swap_endianness(bits)
+        data = data[::-1]
 
-    return bits
+    return int_to_bits(int.from_bytes(data, "big"), 8 * len(data))
 
 
 def from_bits(bits: Bits, endianness: Endianness = Endianness.BIG) -> bytes:
     if len(bits) % 8 != 0:
         raise AlignmentError("Number of bits must be a multiple of 8")
 
+    result = bits_to_int(bits).to_bytes(len(bits) >> 3, "big")
     if endianness == Endianness.LITTLE:
-        bits = swap_endianness(bits)
+        result = result[::-1]
+
+    return result
+
+
+def as_byte_view(data: Buffer) -> memoryview:
+    """
+    Returns a flat, unsigned-byte `memoryview` over `data` without copying it.
+    """
+    view = memoryview(data)
+    if view.format != "B" or view.ndim != 1:
+        view = view.cast("B")
+
+    return view
+
+
+def read_int(data: Buffer, bit_offset: int, bit_count: int) -> int:
+    """
+    Reads `bit_count` bits starting at `bit_offset` (MSB first) as an unsigned integer.
+
+    Only the bytes spanned by the requested bits are touched, so the cost does not depend
+    on the size of `data`.
+    """
+    if bit_count == 0:
+        return 0
+
+    start = bit_offset >> 3
+    end = (bit_offset + bit_count + 7) >> 3
+    value = int.from_bytes(data[start:end], "big")
+    trailing = (end << 3) - bit_offset - bit_count
+
+    return (value >> trailing) & ((1 << bit_count) - 1)
+
+
+def read_bytes(data: Buffer, bit_offset: int, length: int) -> Buffer:
+    """
+    Reads `length` whole bytes starting at `bit_offset`.
+
+    When `bit_offset` is byte aligned the result is a slice of `data`, which does not
+    copy anything if `data` is a `memoryview`.
+    """
+    if bit_offset % 8 == 0:
+        start = bit_offset >> 3
+        return data[start : start + length]
+
+    return read_int(data, bit_offset, 8 * length).to_bytes(length, "big")
+
+
+def ensure_available(data: Buffer, bit_offset: int, count: int) -> None:
+    available = 8 * len(data) - bit_offset
+    if count > available:
+        raise InsufficientDataError(
+            f"Cannot read {count} bits, only {available} available"
+        )
+
+
+# The initial number of bytes `find_terminator` copies and searches at once, doubled
+# every time the terminator is not found.
+FIND_WINDOW = 256
+
+
+def find_terminator(
+    data: Buffer, bit_offset: int, bit_end: int, terminator: Bits, step: int = 8
+) -> int:
+    """
+    Returns the offset of the first `terminator` that starts a whole number of `step`
+    bits after `bit_offset` and ends by `bit_end`.
+
+    Whole-byte terminators and steps are searched for with `bytes.find` over windows
+    of growing size, so the cost is linear in the distance to the terminator and
+    nothing past it is copied. Other terminators are compared at every step.
+    """
+    if len(terminator) % 8 != 0 or step % 8 != 0:
+        return _scan_terminator(data, bit_offset, bit_end, terminator, step)
+
+    needle = from_bits(terminator)
+    stride = step >> 3
+    available = (bit_end - bit_offset) >> 3
+    start, window = 0, FIND_WINDOW
+
+    while True:
+        stop = min(start + window, available)
+        chunk = bytes(read_bytes(data, bit_offset + 8 * start, stop - start))
+
+        index = chunk.find(needle)
+        while index != -1:
+            if (start + index) % stride == 0:
+                return bit_offset + 8 * (start + index)
+            index = chunk.find(needle, index + 1)
+
+        if stop == available:
+            raise InsufficientDataError(
+                f"Terminator {needle!r} not found in the {available} bytes available"
+            )
 
-    result = bytearray()
-    for i in range(0, len(bits), 8):
-        chunk = bits[i : i + 8]
-        value = 0
-        for j, bit in enumerate(chunk):
-            if bit:
-                value |= 1 << (7 - j)
-        result.append(value)
+        start = max(start, stop - len(needle) + 1)
+        window *= 2
 
-    return bytes(result)
+
+def _scan_terminator(
+    data: Buffer, bit_offset: int, bit_end: int, terminator: Bits, step: int
+) -> int:
+    length = len(terminator)
+    value = bits_to_int(terminator)
+
+    while bit_offset + length <= bit_end:
+        if read_int(data, bit_offset, length) == value:
+            return bit_offset
+        bit_offset += step
+
+    raise InsufficientDataError(
+        f"Terminator {bits_to_string(terminator)} not found in the bits available"
+    )
+
+
+def contains_terminator(value: bytes, terminator: Bits) -> bool:
+    """
+    Whether `value` contains `terminator` where a decoder would stop at it: at a byte
+    boundary for whole-byte terminators, at any bit otherwise.
+    """
+    if len(terminator) % 8 == 0:
+        return from_bits(terminator) in value
+
+    return bits_to_string(terminator) in bits_to_string(to_bits(value))
+
+
+def int_to_bits(value: int, bit_count: int) -> Bits:
+    if bit_count == 0:
+        return []
+
+    return [bit == "1" for bit in format(value, f"0{bit_count}b")]
+
+
+def bits_to_int(bits: Bits) -> int:
+    if not bits:
+        return 0
+
+    return int("".join("1" if bit else "0" for bit in bits), 2)
 
 
 def to_binary(bits: Bits) -> str:
@@ -84,20 +205,18 @@ def is_subsequence(sub: Bits, full: Bits) -> bool:
 
 
 def swap_endianness(bits: Bits) -> Bits:
-    swapped: Bits = []
-    n = len(bits)
-
-    remainder = n % 8
-    if remainder:
-        head = bits[:remainder]
-        swapped.extend(head)
-        bits = bits[remainder:]
+    """
+    Reverses the order of the whole bytes in `bits`, the leading `len(bits) % 8`
+    bits are moved to the end.
+    """
+    remainder = len(bits) % 8
+    head, body = bits[:remainder], bits[remainder:]
 
-    for i in range(0, len(bits), 8):
-        byte = bits[i : i + 8]
-        swapped = byte + swapped
+    swapped: Bits = []
+    for i in range(len(body) - 8, -1, -8):
+        swapped.extend(body[i : i + 8])
 
-    return swapped
+    return swapped + head
 
 
 def bits_to_string(bits: Bits) -> str:
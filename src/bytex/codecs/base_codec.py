@@ -1,7 +1,8 @@
 from abc import ABC, abstractmethod
-from typing import Generic, TypeVar
+from typing import Generic, Optional, Tuple, TypeVar
 
-from bytex.bits import BitBuffer, Bits
+from bytex.bits import BitReader, Bits, BitWriter, Buffer
+from bytex.bits.utils import ensure_available
 from bytex.endianness import Endianness
 
 T = TypeVar("T")
@@ -14,9 +15,69 @@ class BaseCodec(ABC, Generic[T]):
         raise NotImplementedError
 
     @abstractmethod
-    def deserialize(self, bit_buffer: BitBuffer, endianness: Endianness) -> T:
+    def deserialize(self, bit_buffer: BitReader, endianness: Endianness) -> T:
         raise NotImplementedError
 
     @abstractmethod
     def validate(self, value: T) -> None:
         raise NotImplementedError
+
+    def get_fixed_bit_size(self) -> Optional[int]:
+        """
+        Returns the number of bits every value of this codec occupies, or `None` if
+        the size depends on the value.
+        """
+        return None
+
+    def get_bit_size(self, value: T) -> int:
+        """
+        Returns the number of bits `value` occupies once encoded.
+
+        The default serializes `value` unless the codec has a fixed size, codecs
+        whose encoded size is cheap to compute override it.
+        """
+        bit_size = self.get_fixed_bit_size()
+        if bit_size is not None:
+            return bit_size
+
+        return len(self.serialize(value, endianness=Endianness.BIG))
+
+    def encode_into(self, value: T, writer: BitWriter, endianness: Endianness) -> None:
+        """
+        Writes `value` into `writer`.
+
+        Codecs may override this to write integers and bytes directly instead of
+        going through `serialize`'s per-bit list.
+        """
+        writer.write(self.serialize(value, endianness=endianness))
+
+    def decode_from(
+        self, data: Buffer, bit_offset: int, endianness: Endianness
+    ) -> Tuple[T, int]:
+        """
+        Decodes a value starting `bit_offset` bits into `data`, returning it together
+        with the bit offset right after it.
+
+        Codecs may override this to decode straight from the underlying bytes, the
+        default adapts `deserialize` through a `BitReader`.
+        """
+        reader = BitReader(data, bit_offset=bit_offset)
+        value = self.deserialize(reader, endianness=endianness)
+
+        return value, reader.offset
+
+    def skip_from(self, data: Buffer, bit_offset: int, endianness: Endianness) -> int:
+        """
+        Returns the bit offset right after the value starting `bit_offset` bits into
+        `data`, without decoding the value when its size is known up front.
+
+        The default relies on the codec's fixed size, or decodes the value. Codecs
+        whose encoded size can be read off cheaply, like a length prefix, override
+        it.
+        """
+        bit_size = self.get_fixed_bit_size()
+        if bit_size is None:
+            return self.decode_from(data, bit_offset, endianness)[1]
+
+        ensure_available(data, bit_offset, bit_size)
+        return bit_offset + bit_size
@@ -1,7 +1,10 @@
 from abc import ABC, abstractmethod
-from typing import Generic, TypeVar
+from typing import Any, Generic, Sequence, TypeVar
 
+from bytex.bits import Buffer
+from bytex.bits.utils import ensure_available
 from bytex.codecs.base_codec import BaseCodec
+from bytex.endianness import Endianness
 
 T = TypeVar("T")
 
@@ -11,3 +14,37 @@ class BaseListCodec(BaseCodec, ABC, Generic[T]):
     @abstractmethod
     def get_inner_codec(self) -> BaseCodec:
         raise NotImplementedError
+
+
+def get_items_bit_size(item_codec: BaseCodec, items: Sequence[Any]) -> int:
+    """
+    Returns the number of bits `items` occupy once encoded one after the other with
+    `item_codec`.
+    """
+    item_bit_size = item_codec.get_fixed_bit_size()
+    if item_bit_size is not None:
+        return item_bit_size * len(items)
+
+    return sum(item_codec.get_bit_size(item) for item in items)
+
+
+def skip_items(
+    item_codec: BaseCodec,
+    data: Buffer,
+    bit_offset: int,
+    count: int,
+    endianness: Endianness,
+) -> int:
+    """
+    Returns the bit offset right after `count` back to back `item_codec` items
+    starting `bit_offset` bits into `data`.
+    """
+    item_bit_size = item_codec.get_fixed_bit_size()
+    if item_bit_size is not None:
+        ensure_available(data, bit_offset, item_bit_size * count)
+        return bit_offset + item_bit_size * count
+
+    for _ in range(count):
+        bit_offset = item_codec.skip_from(data, bit_offset, endianness)
+
+    return bit_offset
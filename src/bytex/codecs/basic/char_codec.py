@@ -1,6 +1,7 @@
 from dataclasses import dataclass
+from typing import Optional, Tuple
 
-from bytex.bits import BitBuffer, Bits
+from bytex.bits import BitReader, Bits, BitWriter, Buffer
 from bytex.codecs.base_codec import BaseCodec
 from bytex.codecs.basic.integer_codec import IntegerCodec
 from bytex.endianness import Endianness
@@ -10,6 +11,16 @@ from bytex.sign import Sign
 U8_CODEC = IntegerCodec(bit_count=8, sign=Sign.UNSIGNED)
 
 
+def encode_chars(value: str) -> bytes:
+    """
+    Encodes `value` the way serializing it char by char with `CharCodec` would.
+    """
+    try:
+        return value.encode("latin-1")
+    except UnicodeEncodeError:
+        return bytes(ord(char) & 0xFF for char in value)
+
+
 @dataclass(frozen=True)
 class CharCodec(BaseCodec[str]):
     def validate(self, value: str) -> None:
@@ -25,8 +36,23 @@ class CharCodec(BaseCodec[str]):
 
         return U8_CODEC.validate(ord(value))
 
+    def get_fixed_bit_size(self) -> Optional[int]:
+        return U8_CODEC.bit_count
+
     def serialize(self, value: str, endianness: Endianness) -> Bits:
         return U8_CODEC.serialize(ord(value), endianness=endianness)
 
-    def deserialize(self, bit_buffer: BitBuffer, endianness: Endianness) -> str:
+    def encode_into(
+        self, value: str, writer: BitWriter, endianness: Endianness
+    ) -> None:
+        U8_CODEC.encode_into(ord(value), writer, endianness=endianness)
+
+    def decode_from(
+        self, data: Buffer, bit_offset: int, endianness: Endianness
+    ) -> Tuple[str, int]:
+        value, bit_offset = U8_CODEC.decode_from(data, bit_offset, endianness)
+
+        return chr(value), bit_offset
+
+    def deserialize(self, bit_buffer: BitReader, endianness: Endianness) -> str:
         return chr(U8_CODEC.deserialize(bit_buffer, endianness=endianness))
@@ -1,23 +1,69 @@
 from dataclasses import dataclass
+from typing import Tuple
 
-from bytex.bits import BitBuffer, Bits, from_bits, to_bits
+from bytex.bits import BitReader, Bits, BitWriter, Buffer, to_bits
+from bytex.bits.utils import read_bytes
 from bytex.codecs.base_codec import BaseCodec
+from bytex.codecs.byte_view import finish_bytes, is_bytes_value
 from bytex.endianness import Endianness
-from bytex.errors import ValidationError
+from bytex.errors import AlignmentError, ValidationError
 
 
 @dataclass(frozen=True)
-class DataCodec(BaseCodec[bytes]):
-    def validate(self, value: bytes) -> None:
-        if not isinstance(value, bytes):
+class DataCodec(BaseCodec[Buffer]):
+    """
+    The rest of the data. With `as_view=True` the value is a `memoryview` over the
+    parsed buffer instead of a copy, unless it has to be reversed for a little
+    endian structure.
+    """
+
+    as_view: bool = False
+
+    def validate(self, value: Buffer) -> None:
+        if not is_bytes_value(value, self.as_view):
             raise ValidationError(
                 f"Invalid value, a {self.__class__.__name__}'s value must be of type '{str(bytes)}'"
             )
 
-    def serialize(self, value: bytes, endianness: Endianness) -> Bits:
-        return to_bits(value, endianness=endianness)
+    def get_bit_size(self, value: Buffer) -> int:
+        return 8 * len(value)
+
+    def serialize(self, value: Buffer, endianness: Endianness) -> Bits:
+        return to_bits(bytes(value), endianness=endianness)
+
+    def encode_into(
+        self, value: Buffer, writer: BitWriter, endianness: Endianness
+    ) -> None:
+        if endianness == Endianness.LITTLE:
+            value = bytes(value[::-1])
+
+        writer.write_bytes(value)
+
+    def decode_from(
+        self, data: Buffer, bit_offset: int, endianness: Endianness
+    ) -> Tuple[Buffer, int]:
+        bit_count = 8 * len(data) - bit_offset
+        if bit_count % 8 != 0:
+            raise AlignmentError("Number of bits must be a multiple of 8")
+
+        value = read_bytes(data, bit_offset, bit_count >> 3)
+        if endianness == Endianness.LITTLE:
+            value = bytes(value[::-1])
+
+        return finish_bytes(value, self.as_view), bit_offset + bit_count
+
+    def skip_from(self, data: Buffer, bit_offset: int, endianness: Endianness) -> int:
+        if (8 * len(data) - bit_offset) % 8 != 0:
+            raise AlignmentError("Number of bits must be a multiple of 8")
+
+        return 8 * len(data)
+
+    def deserialize(self, bit_buffer: BitReader, endianness: Endianness) -> Buffer:
+        if len(bit_buffer) % 8 != 0:
+            raise AlignmentError("Number of bits must be a multiple of 8")
 
-    def deserialize(self, bit_buffer: BitBuffer, endianness: Endianness) -> bytes:
-        bits = bit_buffer.read(len(bit_buffer))
+        value: Buffer = bit_buffer.read_bytes(len(bit_buffer) >> 3)
+        if endianness == Endianness.LITTLE:
+            value = bytes(value[::-1])
 
-        return from_bits(bits, endianness=endianness)
+        return finish_bytes(value, self.as_view)
@@ -1,7 +1,9 @@
 from dataclasses import dataclass
+from typing import Optional, Tuple
 
 from bytex import endianness
-from bytex.bits import BitBuffer, Bits
+from bytex.bits import BitReader, Bits, BitWriter, Buffer
+from bytex.bits.utils import ensure_available
 from bytex.codecs.base_codec import BaseCodec
 from bytex.errors import ValidationError
 
@@ -14,10 +16,26 @@ class FlagCodec(BaseCodec[bool]):
                 f"Invalid value, a {self.__class__.__name__}'s value must be of type '{str(bool)}'"
             )
 
+    def get_fixed_bit_size(self) -> Optional[int]:
+        return 1
+
     def serialize(self, value: bool, endianness: endianness.Endianness) -> Bits:
         return [value]
 
+    def encode_into(
+        self, value: bool, writer: BitWriter, endianness: endianness.Endianness
+    ) -> None:
+        writer.write_int(int(value), 1)
+
+    def decode_from(
+        self, data: Buffer, bit_offset: int, endianness: endianness.Endianness
+    ) -> Tuple[bool, int]:
+        ensure_available(data, bit_offset, 1)
+        value = bool((data[bit_offset >> 3] >> (7 - (bit_offset & 7))) & 1)
+
+        return value, bit_offset + 1
+
     def deserialize(
-        self, bit_buffer: BitBuffer, endianness: endianness.Endianness
+        self, bit_buffer: BitReader, endianness: endianness.Endianness
     ) -> bool:
         return bit_buffer.read(1)[0]
@@ -1,7 +1,8 @@
 from dataclasses import dataclass
+from typing import Literal, Optional, Tuple
 
-from bytex.bits import BitBuffer, Bits
-from bytex.bits.utils import swap_endianness
+from bytex.bits import BitReader, Bits, BitWriter, Buffer
+from bytex.bits.utils import ensure_available, int_to_bits, read_int
 from bytex.codecs.base_codec import BaseCodec
 from bytex.endianness import Endianness
 from bytex.errors import ValidationError
@@ -39,33 +40,92 @@ class IntegerCodec(BaseCodec[int]):
                 f"range [{minimum}, {maximum}]"
             )
 
+    def get_fixed_bit_size(self) -> Optional[int]:
+        return self.bit_count
+
     def serialize(self, value: int, endianness: Endianness) -> Bits:
-        bits: Bits = []
+        return int_to_bits(self.to_wire(value, endianness), self.bit_count)
+
+    def encode_into(
+        self, value: int, writer: BitWriter, endianness: Endianness
+    ) -> None:
+        if self.bit_count % 8 == 0:
+            writer.write_bytes(
+                value.to_bytes(
+                    self.bit_count >> 3,
+                    _byteorder(endianness),
+                    signed=self.sign == Sign.SIGNED,
+                )
+            )
+        else:
+            writer.write_int(self.to_wire(value, endianness), self.bit_count)
+
+    def decode_from(
+        self, data: Buffer, bit_offset: int, endianness: Endianness
+    ) -> Tuple[int, int]:
+        ensure_available(data, bit_offset, self.bit_count)
+        end = bit_offset + self.bit_count
+
+        if bit_offset % 8 == 0 and self.bit_count % 8 == 0:
+            value = int.from_bytes(
+                data[bit_offset >> 3 : end >> 3],
+                _byteorder(endianness),
+                signed=self.sign == Sign.SIGNED,
+            )
+            return value, end
+
+        return (
+            self.from_wire(read_int(data, bit_offset, self.bit_count), endianness),
+            end,
+        )
+
+    def deserialize(self, bit_buffer: BitReader, endianness: Endianness) -> int:
+        if bit_buffer.is_aligned() and self.bit_count % 8 == 0:
+            return int.from_bytes(
+                bit_buffer.read_bytes(self.bit_count >> 3),
+                _byteorder(endianness),
+                signed=self.sign == Sign.SIGNED,
+            )
 
-        if self.sign == Sign.SIGNED and value < 0:
-            value = (1 << self.bit_count) + value
+        return self.from_wire(bit_buffer.read_int(self.bit_count), endianness)
 
-        for i in reversed(range(self.bit_count)):
-            bits.append(bool((value >> i) & 1))
+    def to_wire(self, value: int, endianness: Endianness) -> int:
+        """
+        Returns the unsigned integer whose `bit_count` bits (MSB first) are the
+        serialized form of `value`.
 
-        if endianness == Endianness.LITTLE:
-            bits = swap_endianness(bits)
+        In little endian the whole bytes are written least significant first and the
+        `bit_count % 8` most significant bits come last.
+        """
+        wire = value & ((1 << self.bit_count) - 1)
 
-        return bits
+        if endianness == Endianness.LITTLE and self.bit_count > 8:
+            remainder = self.bit_count % 8
+            byte_count = self.bit_count >> 3
+            low = wire & ((1 << (8 * byte_count)) - 1)
+            swapped = int.from_bytes(low.to_bytes(byte_count, "little"), "big")
+            wire = (swapped << remainder) | (wire >> (8 * byte_count))
 
-    def deserialize(self, bit_buffer: BitBuffer, endianness: Endianness) -> int:
-        bits = bit_buffer.read(self.bit_count)
+        return wire
 
-        if endianness == Endianness.LITTLE:
-            bits = swap_endianness(bits)
+    def from_wire(self, wire: int, endianness: Endianness) -> int:
+        """
+        The inverse of `to_wire`.
+        """
+        value = wire
 
-        value = 0
-        for bit in bits:
-            value = (value << 1) | int(bit)
+        if endianness == Endianness.LITTLE and self.bit_count > 8:
+            remainder = self.bit_count % 8
+            byte_count = self.bit_count >> 3
+            swapped = wire >> remainder
+            low = int.from_bytes(swapped.to_bytes(byte_count, "big"), "little")
+            value = ((wire & ((1 << remainder) - 1)) << (8 * byte_count)) | low
 
-        if self.sign == Sign.SIGNED:
-            sign_bit = 1 << (self.bit_count - 1)
-            if value & sign_bit:
-                value -= 1 << self.bit_count
+        if self.sign == Sign.SIGNED and value >> (self.bit_count - 1):
+            value -= 1 << self.bit_count
 
         return value
+
+
+def _byteorder(endianness: Endianness) -> Literal["little", "big"]:
+    return "little" if endianness == Endianness.LITTLE else "big"
@@ -1,7 +1,7 @@
 from dataclasses import dataclass
-from typing import Type
+from typing import Optional, Tuple, Type
 
-from bytex.bits import BitBuffer, Bits
+from bytex.bits import BitReader, Bits, BitWriter, Buffer
 from bytex.codecs.base_codec import BaseCodec
 from bytex.endianness import Endianness
 from bytex.errors import ValidationError
@@ -12,10 +12,35 @@ from bytex.structure._structure import _Structure
 class StructureCodec(BaseCodec[_Structure]):
     structure_class: Type[_Structure]
 
+    def get_fixed_bit_size(self) -> Optional[int]:
+        return self.structure_class.bit_size()
+
+    def get_bit_size(self, value: _Structure) -> int:
+        return value.dumped_bit_size()
+
     def serialize(self, value: _Structure, endianness: Endianness) -> Bits:
         return value.dump_bits(endianness=endianness)
 
-    def deserialize(self, bit_buffer: BitBuffer, endianness: Endianness) -> _Structure:
+    def encode_into(
+        self, value: _Structure, writer: BitWriter, endianness: Endianness
+    ) -> None:
+        value.encode_into(writer, endianness=endianness)
+
+    def decode_from(
+        self, data: Buffer, bit_offset: int, endianness: Endianness
+    ) -> Tuple[_Structure, int]:
+        return self.structure_class.decode_from(data, bit_offset, endianness)
+
+    def skip_from(self, data: Buffer, bit_offset: int, endianness: Endianness) -> int:
+        if self.get_fixed_bit_size() is not None:
+            return super().skip_from(data, bit_offset, endianness)
+
+        for field in self.structure_class.__bytex_fields__.values():
+            bit_offset = field.codec.skip_from(data, bit_offset, endianness)
+
+        return bit_offset
+
+    def deserialize(self, bit_buffer: BitReader, endianness: Endianness) -> _Structure:
         return self.structure_class.parse_bits(bit_buffer, endianness=endianness)
 
     def validate(self, value: _Structure) -> None:
@@ -0,0 +1,31 @@
+from typing import Any
+
+from bytex.bits import Buffer
+from bytex.codecs.base_codec import BaseCodec
+
+
+def is_view_codec(codec: BaseCodec) -> bool:
+    """
+    Whether `codec` is a bytes codec created with `as_view=True`.
+    """
+    return getattr(codec, "as_view", False) is True
+
+
+def is_bytes_value(value: Any, as_view: bool) -> bool:
+    """
+    Whether `value` can be held by a bytes codec, codecs created with `as_view=True`
+    also hold `memoryview`s.
+    """
+    return isinstance(value, bytes) or (as_view and isinstance(value, memoryview))
+
+
+def finish_bytes(chunk: Buffer, as_view: bool) -> Buffer:
+    """
+    Converts a decoded chunk into what a bytes codec returns: a copy of it, or a
+    `memoryview` over it when `as_view` is set.
+
+    A view over a slice of the parsed buffer copies nothing, but keeps the whole
+    buffer alive (and a `bytearray` locked against resizing) for as long as it is
+    referenced.
+    """
+    return memoryview(chunk) if as_view else bytes(chunk)
@@ -1,7 +1,7 @@
 from dataclasses import dataclass
-from typing import Type
+from typing import Optional, Tuple, Type
 
-from bytex.bits import BitBuffer, Bits
+from bytex.bits import BitReader, Bits, BitWriter, Buffer
 from bytex.codecs.base_codec import BaseCodec
 from bytex.endianness import Endianness
 from bytex.errors import ParsingError, ValidationError
@@ -19,14 +19,35 @@ class EnumCodec(BaseCodec[_StructureEnum]):
                 f"Invalid value, a {self.__class__.__name__}'s value must be of type '{str(_StructureEnum)}'"
             )
 
+    def get_fixed_bit_size(self) -> Optional[int]:
+        return self.item_codec.get_fixed_bit_size()
+
+    def get_bit_size(self, value: _StructureEnum) -> int:
+        return self.item_codec.get_bit_size(value.value)
+
     def serialize(self, value: _StructureEnum, endianness: Endianness) -> Bits:
         return self.item_codec.serialize(value.value, endianness=endianness)
 
+    def encode_into(
+        self, value: _StructureEnum, writer: BitWriter, endianness: Endianness
+    ) -> None:
+        self.item_codec.encode_into(value.value, writer, endianness=endianness)
+
+    def decode_from(
+        self, data: Buffer, bit_offset: int, endianness: Endianness
+    ) -> Tuple[_StructureEnum, int]:
+        value, bit_offset = self.item_codec.decode_from(data, bit_offset, endianness)
+
+        return self._to_member(value), bit_offset
+
     def deserialize(
-        self, bit_buffer: BitBuffer, endianness: Endianness
+        self, bit_buffer: BitReader, endianness: Endianness
     ) -> _StructureEnum:
         value = self.item_codec.deserialize(bit_buffer, endianness=endianness)
 
+        return self._to_member(value)
+
+    def _to_member(self, value: object) -> _StructureEnum:
         try:
             return self.enum(value)
         except ValueError as e:
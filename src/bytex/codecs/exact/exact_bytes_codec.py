@@ -1,36 +1,44 @@
 from dataclasses import dataclass
+from typing import Optional, Tuple
 
-from bytex.bits import BitBuffer, Bits, from_bits
+from bytex.bits import BitReader, Bits, BitWriter, Buffer, to_bits
+from bytex.bits.utils import ensure_available, read_bytes
 from bytex.codecs.base_codec import BaseCodec
-from bytex.codecs.basic.integer_codec import IntegerCodec
+from bytex.codecs.byte_view import finish_bytes, is_bytes_value
 from bytex.endianness import Endianness
 from bytex.errors import ValidationError
-from bytex.sign import Sign
-
-U8_CODEC = IntegerCodec(bit_count=8, sign=Sign.UNSIGNED)
-EMPTY_BYTE = U8_CODEC.serialize(0, endianness=Endianness.BIG)
 
 
 @dataclass(frozen=True)
-class ExactBytesCodec(BaseCodec[bytes]):
+class ExactBytesCodec(BaseCodec[Buffer]):
     length: int
+    as_view: bool = False
+
+    def get_fixed_bit_size(self) -> Optional[int]:
+        return 8 * self.length
+
+    def serialize(self, value: Buffer, endianness: Endianness) -> Bits:
+        return to_bits(bytes(value))
 
-    def serialize(self, value: bytes, endianness: Endianness) -> Bits:
-        bits = []
+    def encode_into(
+        self, value: Buffer, writer: BitWriter, endianness: Endianness
+    ) -> None:
+        writer.write_bytes(value)
 
-        for char in value:
-            bits += U8_CODEC.serialize(char, endianness=endianness)
+    def decode_from(
+        self, data: Buffer, bit_offset: int, endianness: Endianness
+    ) -> Tuple[Buffer, int]:
+        length = self.length
+        ensure_available(data, bit_offset, 8 * length)
+        value = finish_bytes(read_bytes(data, bit_offset, length), self.as_view)
 
-        return bits
+        return value, bit_offset + 8 * length
 
-    def deserialize(self, bit_buffer: BitBuffer, endianness: Endianness) -> bytes:
-        return from_bits(
-            bit_buffer.read(U8_CODEC.bit_count * self.length), endianness=Endianness.BIG
-        )
+    def deserialize(self, bit_buffer: BitReader, endianness: Endianness) -> Buffer:
+        return finish_bytes(bit_buffer.read_bytes(self.length), self.as_view)
 
-    def validate(self, value: bytes) -> None:
-        if not isinstance(value, bytes):
-            print("What!", value)
+    def validate(self, value: Buffer) -> None:
+        if not is_bytes_value(value, self.as_view):
             raise ValidationError(
                 f"Invalid value, a {self.__class__.__name__}'s value must be of type '{str(bytes)}'"
             )
@@ -1,9 +1,21 @@
+import array
 from dataclasses import dataclass
-from typing import Generic, Sequence, TypeVar
+from typing import Generic, List, Optional, Sequence, Tuple, TypeVar, cast
 
-from bytex.bits import BitBuffer, Bits
+from bytex.bits import BitReader, Bits, BitWriter, Buffer, to_bits
 from bytex.codecs.base_codec import BaseCodec
-from bytex.codecs.base_list_codec import BaseListCodec
+from bytex.codecs.base_list_codec import (
+    BaseListCodec,
+    get_items_bit_size,
+    skip_items,
+)
+from bytex.codecs.integer_array import (
+    decode_integers,
+    encode_integers,
+    finish_integers,
+    get_array_typecode,
+    read_integers,
+)
 from bytex.endianness import Endianness
 from bytex.errors import ValidationError
 
@@ -14,13 +26,34 @@ T = TypeVar("T")
 class ExactListCodec(BaseListCodec[Sequence[T]], Generic[T]):
     item_codec: BaseCodec[T]
     length: int
+    as_array: bool = False
+
+    def __post_init__(self) -> None:
+        if self.as_array and get_array_typecode(self.item_codec) is None:
+            raise ValidationError(
+                "Invalid `as_array`, only lists of 8, 16, 32 or 64 bit integers can be arrays"
+            )
 
     def get_inner_codec(self) -> BaseCodec:
         return self.item_codec
 
+    def get_fixed_bit_size(self) -> Optional[int]:
+        item_bit_size = self.item_codec.get_fixed_bit_size()
+        if item_bit_size is None:
+            return None
+
+        return item_bit_size * self.length
+
+    def get_bit_size(self, value: Sequence[T]) -> int:
+        return get_items_bit_size(self.item_codec, value)
+
     def serialize(self, value: Sequence[T], endianness: Endianness) -> Bits:
         self.validate(value)
 
+        data = encode_integers(self.item_codec, value, endianness)
+        if data is not None:
+            return to_bits(data)
+
         bits = []
 
         for item in value:
@@ -28,14 +61,56 @@ class ExactListCodec(BaseListCodec[Sequence[T]], Generic[T]):
 
         return bits
 
-    def deserialize(self, bit_buffer: BitBuffer, endianness: Endianness) -> Sequence[T]:
-        return [
-            self.item_codec.deserialize(bit_buffer, endianness=endianness)
-            for _ in range(self.length)
-        ]
+    def encode_into(
+        self, value: Sequence[T], writer: BitWriter, endianness: Endianness
+    ) -> None:
+        self.validate(value)
+
+        data = encode_integers(self.item_codec, value, endianness)
+        if data is not None:
+            writer.write_bytes(data)
+            return
+
+        for item in value:
+            self.item_codec.encode_into(item, writer, endianness=endianness)
+
+    def decode_from(
+        self, data: Buffer, bit_offset: int, endianness: Endianness
+    ) -> Tuple[Sequence[T], int]:
+        length = self.length
+        decoded = decode_integers(
+            self.item_codec, data, bit_offset, length, endianness, self.as_array
+        )
+        if decoded is not None:
+            return cast(Tuple[Sequence[T], int], decoded)
+
+        items = []
+
+        for _ in range(length):
+            item, bit_offset = self.item_codec.decode_from(data, bit_offset, endianness)
+            items.append(item)
+
+        return self._finish(items), bit_offset
+
+    def skip_from(self, data: Buffer, bit_offset: int, endianness: Endianness) -> int:
+        return skip_items(self.item_codec, data, bit_offset, self.length, endianness)
+
+    def deserialize(self, bit_buffer: BitReader, endianness: Endianness) -> Sequence[T]:
+        bulk = read_integers(
+            self.item_codec, bit_buffer, self.length, endianness, self.as_array
+        )
+        if bulk is not None:
+            return cast(Sequence[T], bulk)
+
+        return self._finish(
+            [
+                self.item_codec.deserialize(bit_buffer, endianness=endianness)
+                for _ in range(self.length)
+            ]
+        )
 
     def validate(self, value: Sequence[T]) -> None:
-        if not isinstance(value, Sequence):
+        if not isinstance(value, (Sequence, array.array)):
             raise ValidationError(
                 f"{self.__class__.__name__} expects a sequence of items."
             )
@@ -44,3 +119,9 @@ class ExactListCodec(BaseListCodec[Sequence[T]], Generic[T]):
             raise ValidationError(
                 f"Invalid value, a {self.__class__.__name__}'s value must be of length `length` - {self.length} items"
             )
+
+    def _finish(self, items: List[T]) -> Sequence[T]:
+        if not self.as_array:
+            return items
+
+        return cast(Sequence[T], finish_integers(self.item_codec, items, True))
@@ -1,11 +1,19 @@
+import array
 from dataclasses import dataclass
-from typing import Annotated, List
+from typing import Annotated, Optional, Sequence, Tuple
 
-from bytex.bits import BitBuffer, Bits
+from bytex.bits import BitReader, Bits, BitWriter, Buffer, to_bits
 from bytex.codecs.base_codec import BaseCodec
 from bytex.codecs.base_list_codec import BaseListCodec
 from bytex.codecs.basic.char_codec import CharCodec
 from bytex.codecs.basic.integer_codec import IntegerCodec
+from bytex.codecs.integer_array import (
+    decode_integers,
+    encode_integers,
+    finish_integers,
+    get_array_typecode,
+    read_integers,
+)
 from bytex.endianness import Endianness
 from bytex.errors import ValidationError
 
@@ -13,16 +21,30 @@ CHAR_CODEC = CharCodec()
 
 
 @dataclass(frozen=True)
-class FixedIntegersCodec(BaseListCodec[List[Annotated[int, IntegerCodec]]]):
+class FixedIntegersCodec(BaseListCodec[Sequence[Annotated[int, IntegerCodec]]]):
     integer_codec: IntegerCodec
     length: int
+    as_array: bool = False
+
+    def __post_init__(self) -> None:
+        if self.as_array and get_array_typecode(self.integer_codec) is None:
+            raise ValidationError(
+                "Invalid `as_array`, only lists of 8, 16, 32 or 64 bit integers can be arrays"
+            )
 
     def get_inner_codec(self) -> BaseCodec:
         return self.integer_codec
 
+    def get_fixed_bit_size(self) -> Optional[int]:
+        return self.integer_codec.bit_count * self.length
+
     def serialize(
-        self, value: List[Annotated[int, IntegerCodec]], endianness: Endianness
+        self, value: Sequence[Annotated[int, IntegerCodec]], endianness: Endianness
     ) -> Bits:
+        data = self._encode(value, endianness)
+        if data is not None:
+            return to_bits(data)
+
         bits = []
 
         for integer in value:
@@ -33,23 +55,79 @@ class FixedIntegersCodec(BaseListCodec[List[Annotated[int, IntegerCodec]]]):
 
         return bits
 
+    def encode_into(
+        self,
+        value: Sequence[Annotated[int, IntegerCodec]],
+        writer: BitWriter,
+        endianness: Endianness,
+    ) -> None:
+        data = self._encode(value, endianness)
+        if data is not None:
+            writer.write_bytes(data)
+            return
+
+        for integer in value:
+            self.integer_codec.encode_into(integer, writer, endianness=endianness)
+
+        for _ in range(self.length - len(value)):
+            self.integer_codec.encode_into(0, writer, endianness=endianness)
+
+    def decode_from(
+        self, data: Buffer, bit_offset: int, endianness: Endianness
+    ) -> Tuple[Sequence[Annotated[int, IntegerCodec]], int]:
+        decoded = decode_integers(
+            self.integer_codec, data, bit_offset, self.length, endianness, self.as_array
+        )
+        if decoded is not None:
+            return decoded
+
+        length = self.length
+        items = []
+
+        for _ in range(length):
+            item, bit_offset = self.integer_codec.decode_from(
+                data, bit_offset, endianness
+            )
+            items.append(item)
+
+        return finish_integers(self.integer_codec, items, self.as_array), bit_offset
+
     def deserialize(
-        self, bit_buffer: BitBuffer, endianness: Endianness
-    ) -> List[Annotated[int, IntegerCodec]]:
-        return [
+        self, bit_buffer: BitReader, endianness: Endianness
+    ) -> Sequence[Annotated[int, IntegerCodec]]:
+        items = read_integers(
+            self.integer_codec, bit_buffer, self.length, endianness, self.as_array
+        )
+        if items is not None:
+            return items
+
+        items = [
             self.integer_codec.deserialize(bit_buffer, endianness=endianness)
             for _ in range(self.length)
         ]
 
-    def validate(self, value: List[Annotated[int, IntegerCodec]]) -> None:
-        if not isinstance(value, list) or (
+        return finish_integers(self.integer_codec, items, self.as_array)
+
+    def validate(self, value: Sequence[Annotated[int, IntegerCodec]]) -> None:
+        if not isinstance(value, (list, array.array)) or (
             len(value) and not isinstance(value[0], int)
         ):
             raise ValidationError(
-                f"Invalid value, a {self.__class__.__name__}'s value must be of type 'List[Annotated[int, IntegerCodec]]'"
+                f"Invalid value, a {self.__class__.__name__}'s value must be of type 'Sequence[Annotated[int, IntegerCodec]]'"
             )
 
         if len(value) > self.length:
             raise ValidationError(
                 f"Invalid value, a {self.__class__.__name__}'s value must include up to `length` - {self.length} items"
             )
+
+    def _encode(
+        self, value: Sequence[Annotated[int, IntegerCodec]], endianness: Endianness
+    ) -> Optional[bytes]:
+        data = encode_integers(self.integer_codec, value, endianness)
+        if data is None:
+            return None
+
+        return data + bytes(
+            (self.integer_codec.bit_count >> 3) * (self.length - len(value))
+        )
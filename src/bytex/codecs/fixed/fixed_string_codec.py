@@ -1,34 +1,41 @@
 from dataclasses import dataclass
+from typing import Optional, Tuple
 
-from bytex.bits import BitBuffer, Bits, from_bits
+from bytex.bits import BitReader, Bits, BitWriter, Buffer, to_bits
+from bytex.bits.utils import ensure_available, read_bytes
 from bytex.codecs.base_codec import BaseCodec
-from bytex.codecs.basic.char_codec import CharCodec
+from bytex.codecs.basic.char_codec import encode_chars
 from bytex.endianness import Endianness
 from bytex.errors import ValidationError
 
-CHAR_CODEC = CharCodec()
-EMPTY_CHAR = CHAR_CODEC.serialize("\0", endianness=Endianness.BIG)
-
 
 @dataclass(frozen=True)
 class FixedStringCodec(BaseCodec[str]):
     length: int
 
+    def get_fixed_bit_size(self) -> Optional[int]:
+        return 8 * self.length
+
     def serialize(self, value: str, endianness: Endianness) -> Bits:
-        bits = []
+        return to_bits(encode_chars(value).ljust(self.length, b"\x00"))
 
-        for char in value:
-            bits += CHAR_CODEC.serialize(char, endianness=endianness)
+    def encode_into(
+        self, value: str, writer: BitWriter, endianness: Endianness
+    ) -> None:
+        writer.write_bytes(encode_chars(value))
+        writer.write_bytes(bytes(self.length - len(value)))
 
-        for _ in range(self.length - len(value)):
-            bits += EMPTY_CHAR
+    def decode_from(
+        self, data: Buffer, bit_offset: int, endianness: Endianness
+    ) -> Tuple[str, int]:
+        length = self.length
+        ensure_available(data, bit_offset, 8 * length)
+        value = bytes(read_bytes(data, bit_offset, length)).decode()
 
-        return bits
+        return value, bit_offset + 8 * length
 
-    def deserialize(self, bit_buffer: BitBuffer, endianness: Endianness) -> str:
-        return from_bits(
-            bit_buffer.read(8 * self.length), endianness=Endianness.BIG
-        ).decode()
+    def deserialize(self, bit_buffer: BitReader, endianness: Endianness) -> str:
+        return bytes(bit_buffer.read_bytes(self.length)).decode()
 
     def validate(self, value: str) -> None:
         if not isinstance(value, str):
@@ -0,0 +1,181 @@
+import array
+import sys
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+from bytex.bits import BitReader, Buffer
+from bytex.bits.utils import ensure_available
+from bytex.codecs.base_codec import BaseCodec
+from bytex.codecs.basic.integer_codec import IntegerCodec, _byteorder
+from bytex.endianness import Endianness
+from bytex.errors import ValidationError
+from bytex.sign import Sign
+
+NATIVE_ENDIANNESS = Endianness.LITTLE if sys.byteorder == "little" else Endianness.BIG
+ARRAY_TYPECODES: Dict[int, str] = {
+    array.array(typecode).itemsize: typecode for typecode in "lqihb"
+}
+
+Integers = Union[List[int], "array.array[int]"]
+
+
+def is_bulk_codec(codec: BaseCodec) -> bool:
+    """
+    Whether a list of `codec` items is a plain run of whole-byte integers that can be
+    converted in one go instead of item by item.
+    """
+    return type(codec) is IntegerCodec and codec.bit_count % 8 == 0
+
+
+def is_array_codec(codec: BaseCodec) -> bool:
+    """
+    Whether `codec` is a list codec created with `as_array=True`.
+    """
+    return getattr(codec, "as_array", False) is True
+
+
+def get_array_typecode(codec: BaseCodec) -> Optional[str]:
+    """
+    Returns the `array.array` typecode holding `codec` items, or `None` if there is
+    no typecode of their width.
+    """
+    if not is_bulk_codec(codec):
+        return None
+
+    assert isinstance(codec, IntegerCodec)
+    typecode = ARRAY_TYPECODES.get(codec.bit_count >> 3)
+    if typecode is None:
+        return None
+
+    return typecode if codec.sign == Sign.SIGNED else typecode.upper()
+
+
+def to_integer_array(codec: BaseCodec, values: Sequence[int]) -> "array.array[int]":
+    typecode = get_array_typecode(codec)
+    assert typecode is not None
+
+    if isinstance(values, array.array) and values.typecode == typecode:
+        return values
+
+    try:
+        return array.array(typecode, values)
+    except (OverflowError, TypeError) as e:
+        raise ValidationError(
+            f"Invalid value, cannot store {values!r} in an integer array of typecode "
+            f"'{typecode}'"
+        ) from e
+
+
+def decode_integers(
+    codec: BaseCodec,
+    data: Buffer,
+    bit_offset: int,
+    count: int,
+    endianness: Endianness,
+    as_array: bool,
+) -> Optional[Tuple[Integers, int]]:
+    """
+    Decodes `count` back to back `codec` items in one go, or returns `None` if they
+    must be decoded item by item.
+    """
+    if bit_offset % 8 != 0 or not is_bulk_codec(codec):
+        return None
+
+    assert isinstance(codec, IntegerCodec)
+    bit_count = count * codec.bit_count
+    ensure_available(data, bit_offset, bit_count)
+    start = bit_offset >> 3
+    chunk = data[start : start + (bit_count >> 3)]
+
+    return _from_bytes(codec, chunk, endianness, as_array), bit_offset + bit_count
+
+
+def read_integers(
+    codec: BaseCodec,
+    bit_buffer: BitReader,
+    count: int,
+    endianness: Endianness,
+    as_array: bool,
+) -> Optional[Integers]:
+    """
+    The `BitReader` counterpart of `decode_integers`.
+    """
+    if not bit_buffer.is_aligned() or not is_bulk_codec(codec):
+        return None
+
+    assert isinstance(codec, IntegerCodec)
+    chunk = bit_buffer.read_bytes(count * (codec.bit_count >> 3))
+
+    return _from_bytes(codec, chunk, endianness, as_array)
+
+
+def encode_integers(
+    codec: BaseCodec, values: Sequence[Any], endianness: Endianness
+) -> Optional[bytes]:
+    """
+    Encodes back to back `codec` items in one go, or returns `None` if they must be
+    encoded item by item.
+    """
+    if not is_bulk_codec(codec):
+        return None
+
+    assert isinstance(codec, IntegerCodec)
+    try:
+        return _to_bytes(codec, values, endianness)
+    except OverflowError as e:
+        raise ValidationError(
+            f"Invalid value, cannot store {values!r} in {codec.bit_count}-bit "
+            f"{codec.sign.name.lower()} integers"
+        ) from e
+
+
+def finish_integers(codec: BaseCodec, values: List[Any], as_array: bool) -> Integers:
+    """
+    Converts items decoded one by one into what a codec returns.
+    """
+    return to_integer_array(codec, values) if as_array else values
+
+
+def _to_bytes(
+    codec: IntegerCodec, values: Sequence[Any], endianness: Endianness
+) -> bytes:
+    typecode = get_array_typecode(codec)
+
+    if typecode is None:
+        width = codec.bit_count >> 3
+        byteorder = _byteorder(endianness)
+        signed = codec.sign == Sign.SIGNED
+        return b"".join(
+            value.to_bytes(width, byteorder, signed=signed) for value in values
+        )
+
+    swap = endianness is not NATIVE_ENDIANNESS and codec.bit_count > 8
+    if isinstance(values, array.array) and values.typecode == typecode and not swap:
+        return values.tobytes()
+
+    items = array.array(typecode, values)
+    if swap:
+        items.byteswap()
+
+    return items.tobytes()
+
+
+def _from_bytes(
+    codec: IntegerCodec, chunk: Buffer, endianness: Endianness, as_array: bool
+) -> Integers:
+    typecode = get_array_typecode(codec)
+
+    if typecode is None:
+        width = codec.bit_count >> 3
+        byteorder = _byteorder(endianness)
+        signed = codec.sign == Sign.SIGNED
+        return [
+            int.from_bytes(chunk[index : index + width], byteorder, signed=signed)
+            for index in range(0, len(chunk), width)
+        ]
+
+    values = array.array(typecode)
+    values.frombytes(chunk)
+    if endianness is not NATIVE_ENDIANNESS and values.itemsize > 1:
+        values.byteswap()
+
+    return values if as_array else values.tolist()
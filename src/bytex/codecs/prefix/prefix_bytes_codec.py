@@ -1,37 +1,62 @@
 from dataclasses import dataclass
+from typing import Tuple
 
-from bytex.bits import BitBuffer, Bits, from_bits
+from bytex.bits import BitReader, Bits, BitWriter, Buffer, to_bits
+from bytex.bits.utils import ensure_available, read_bytes
 from bytex.codecs.base_codec import BaseCodec
 from bytex.codecs.basic.integer_codec import IntegerCodec
+from bytex.codecs.byte_view import finish_bytes, is_bytes_value
 from bytex.endianness import Endianness
 from bytex.errors import ValidationError
-from bytex.sign import Sign
-
-U8_CODEC = IntegerCodec(bit_count=8, sign=Sign.UNSIGNED)
 
 
 @dataclass(frozen=True)
-class PrefixBytesCodec(BaseCodec[bytes]):
+class PrefixBytesCodec(BaseCodec[Buffer]):
     prefix_codec: IntegerCodec
+    as_view: bool = False
+
+    def get_bit_size(self, value: Buffer) -> int:
+        return self.prefix_codec.bit_count + 8 * len(value)
 
-    def serialize(self, value: bytes, endianness: Endianness) -> Bits:
+    def serialize(self, value: Buffer, endianness: Endianness) -> Bits:
         length = len(value)
 
         self.prefix_codec.validate(length)
         bits = self.prefix_codec.serialize(length, endianness=endianness)
 
-        for num in value:
-            bits += U8_CODEC.serialize(num, endianness=endianness)
+        return bits + to_bits(bytes(value))
+
+    def encode_into(
+        self, value: Buffer, writer: BitWriter, endianness: Endianness
+    ) -> None:
+        length = len(value)
+
+        self.prefix_codec.validate(length)
+        self.prefix_codec.encode_into(length, writer, endianness=endianness)
+        writer.write_bytes(value)
+
+    def decode_from(
+        self, data: Buffer, bit_offset: int, endianness: Endianness
+    ) -> Tuple[Buffer, int]:
+        length, bit_offset = self.prefix_codec.decode_from(data, bit_offset, endianness)
+        ensure_available(data, bit_offset, 8 * length)
+        value = finish_bytes(read_bytes(data, bit_offset, length), self.as_view)
+
+        return value, bit_offset + 8 * length
+
+    def skip_from(self, data: Buffer, bit_offset: int, endianness: Endianness) -> int:
+        length, bit_offset = self.prefix_codec.decode_from(data, bit_offset, endianness)
+        ensure_available(data, bit_offset, 8 * length)
 
-        return bits
+        return bit_offset + 8 * length
 
-    def deserialize(self, bit_buffer: BitBuffer, endianness: Endianness) -> bytes:
+    def deserialize(self, bit_buffer: BitReader, endianness: Endianness) -> Buffer:
         length = self.prefix_codec.deserialize(bit_buffer, endianness=endianness)
 
-        return from_bits(bit_buffer.read(8 * length), endianness=Endianness.BIG)
+        return finish_bytes(bit_buffer.read_bytes(length), self.as_view)
 
-    def validate(self, value: bytes) -> None:
-        if not isinstance(value, bytes):
+    def validate(self, value: Buffer) -> None:
+        if not is_bytes_value(value, self.as_view):
             raise ValidationError(
                 f"Invalid value, a {self.__class__.__name__}'s value must be of type '{str(str)}'"
             )
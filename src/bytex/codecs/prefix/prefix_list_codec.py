@@ -1,10 +1,22 @@
+import array
 from dataclasses import dataclass
-from typing import Generic, Sequence, TypeVar
+from typing import Generic, List, Sequence, Tuple, TypeVar, cast
 
-from bytex.bits import BitBuffer, Bits
+from bytex.bits import BitReader, Bits, BitWriter, Buffer, to_bits
 from bytex.codecs.base_codec import BaseCodec
-from bytex.codecs.base_list_codec import BaseListCodec
+from bytex.codecs.base_list_codec import (
+    BaseListCodec,
+    get_items_bit_size,
+    skip_items,
+)
 from bytex.codecs.basic.integer_codec import IntegerCodec
+from bytex.codecs.integer_array import (
+    decode_integers,
+    encode_integers,
+    finish_integers,
+    get_array_typecode,
+    read_integers,
+)
 from bytex.endianness import Endianness
 from bytex.errors import ValidationError
 
@@ -15,30 +27,97 @@ T = TypeVar("T")
 class PrefixListCodec(BaseListCodec[Sequence[T]], Generic[T]):
     prefix_codec: IntegerCodec
     item_codec: BaseCodec[T]
+    as_array: bool = False
+
+    def __post_init__(self) -> None:
+        if self.as_array and get_array_typecode(self.item_codec) is None:
+            raise ValidationError(
+                "Invalid `as_array`, only lists of 8, 16, 32 or 64 bit integers can be arrays"
+            )
 
     def get_inner_codec(self) -> BaseCodec:
         return self.item_codec
 
+    def get_bit_size(self, value: Sequence[T]) -> int:
+        return self.prefix_codec.bit_count + get_items_bit_size(self.item_codec, value)
+
     def serialize(self, value: Sequence[T], endianness: Endianness) -> Bits:
         length = len(value)
 
         self.prefix_codec.validate(length)
         bits = self.prefix_codec.serialize(length, endianness=endianness)
 
+        data = encode_integers(self.item_codec, value, endianness)
+        if data is not None:
+            return bits + to_bits(data)
+
         for num in value:
             bits += self.item_codec.serialize(num, endianness=endianness)
 
         return bits
 
-    def deserialize(self, bit_buffer: BitBuffer, endianness: Endianness) -> Sequence[T]:
+    def encode_into(
+        self, value: Sequence[T], writer: BitWriter, endianness: Endianness
+    ) -> None:
+        length = len(value)
+
+        self.prefix_codec.validate(length)
+        self.prefix_codec.encode_into(length, writer, endianness=endianness)
+
+        data = encode_integers(self.item_codec, value, endianness)
+        if data is not None:
+            writer.write_bytes(data)
+            return
+
+        for item in value:
+            self.item_codec.encode_into(item, writer, endianness=endianness)
+
+    def decode_from(
+        self, data: Buffer, bit_offset: int, endianness: Endianness
+    ) -> Tuple[Sequence[T], int]:
+        length, bit_offset = self.prefix_codec.decode_from(data, bit_offset, endianness)
+        decoded = decode_integers(
+            self.item_codec, data, bit_offset, length, endianness, self.as_array
+        )
+        if decoded is not None:
+            return cast(Tuple[Sequence[T], int], decoded)
+
+        items = []
+
+        for _ in range(length):
+            item, bit_offset = self.item_codec.decode_from(data, bit_offset, endianness)
+            items.append(item)
+
+        return self._finish(items), bit_offset
+
+    def skip_from(self, data: Buffer, bit_offset: int, endianness: Endianness) -> int:
+        length, bit_offset = self.prefix_codec.decode_from(data, bit_offset, endianness)
+
+        return skip_items(self.item_codec, data, bit_offset, length, endianness)
+
+    def deserialize(self, bit_buffer: BitReader, endianness: Endianness) -> Sequence[T]:
         length = self.prefix_codec.deserialize(bit_buffer, endianness=endianness)
-        return [
-            self.item_codec.deserialize(bit_buffer, endianness=endianness)
-            for _ in range(length)
-        ]
+        bulk = read_integers(
+            self.item_codec, bit_buffer, length, endianness, self.as_array
+        )
+        if bulk is not None:
+            return cast(Sequence[T], bulk)
+
+        return self._finish(
+            [
+                self.item_codec.deserialize(bit_buffer, endianness=endianness)
+                for _ in range(length)
+            ]
+        )
 
     def validate(self, value: Sequence[T]) -> None:
-        if not isinstance(value, Sequence):
+        if not isinstance(value, (Sequence, array.array)):
             raise ValidationError(
                 f"{self.__class__.__name__} expects a sequence of items."
             )
+
+    def _finish(self, items: List[T]) -> Sequence[T]:
+        if not self.as_array:
+            return items
+
+        return cast(Sequence[T], finish_integers(self.item_codec, items, True))
@@ -1,36 +1,58 @@
 from dataclasses import dataclass
+from typing import Tuple
 
-from bytex.bits import BitBuffer, Bits, from_bits
+from bytex.bits import BitReader, Bits, BitWriter, Buffer, to_bits
+from bytex.bits.utils import ensure_available, read_bytes
 from bytex.codecs.base_codec import BaseCodec
-from bytex.codecs.basic.char_codec import CharCodec
+from bytex.codecs.basic.char_codec import encode_chars
 from bytex.codecs.basic.integer_codec import IntegerCodec
 from bytex.endianness import Endianness
 from bytex.errors import ValidationError
 
-CHAR_CODEC = CharCodec()
-
 
 @dataclass(frozen=True)
 class PrefixStringCodec(BaseCodec[str]):
     prefix_codec: IntegerCodec
 
+    def get_bit_size(self, value: str) -> int:
+        return self.prefix_codec.bit_count + 8 * len(value)
+
     def serialize(self, value: str, endianness: Endianness) -> Bits:
         length = len(value)
 
         self.prefix_codec.validate(length)
         bits = self.prefix_codec.serialize(length, endianness=endianness)
 
-        for char in value:
-            bits += CHAR_CODEC.serialize(char, endianness=endianness)
+        return bits + to_bits(encode_chars(value))
+
+    def encode_into(
+        self, value: str, writer: BitWriter, endianness: Endianness
+    ) -> None:
+        length = len(value)
+
+        self.prefix_codec.validate(length)
+        self.prefix_codec.encode_into(length, writer, endianness=endianness)
+        writer.write_bytes(encode_chars(value))
+
+    def decode_from(
+        self, data: Buffer, bit_offset: int, endianness: Endianness
+    ) -> Tuple[str, int]:
+        length, bit_offset = self.prefix_codec.decode_from(data, bit_offset, endianness)
+        ensure_available(data, bit_offset, 8 * length)
+        value = bytes(read_bytes(data, bit_offset, length)).decode()
+
+        return value, bit_offset + 8 * length
+
+    def skip_from(self, data: Buffer, bit_offset: int, endianness: Endianness) -> int:
+        length, bit_offset = self.prefix_codec.decode_from(data, bit_offset, endianness)
+        ensure_available(data, bit_offset, 8 * length)
 
-        return bits
+        return bit_offset + 8 * length
 
-    def deserialize(self, bit_buffer: BitBuffer, endianness: Endianness) -> str:
+    def deserialize(self, bit_buffer: BitReader, endianness: Endianness) -> str:
         length = self.prefix_codec.deserialize(bit_buffer, endianness=endianness)
 
-        return from_bits(
-            bit_buffer.read(8 * length), endianness=Endianness.BIG
-        ).decode()
+        return bytes(bit_buffer.read_bytes(length)).decode()
 
     def validate(self, value: str) -> None:
         if not isinstance(value, str):
@@ -1,42 +1,50 @@
 from dataclasses import dataclass
+from typing import Tuple
 
-from bytex.bits import BitBuffer, Bits, from_bits
-from bytex.bits.utils import is_subsequence, to_bits
+from bytex.bits import BitReader, Bits, BitWriter, Buffer, from_bits, to_bits
+from bytex.bits.utils import contains_terminator, find_terminator, read_bytes
 from bytex.codecs.base_codec import BaseCodec
-from bytex.codecs.basic.integer_codec import IntegerCodec
 from bytex.endianness import Endianness
 from bytex.errors import ValidationError
-from bytex.sign import Sign
-
-U8_CODEC = IntegerCodec(bit_count=8, sign=Sign.UNSIGNED)
 
 
 @dataclass(frozen=True)
 class TerminatedBytesCodec(BaseCodec[bytes]):
     terminator: Bits
 
+    def get_bit_size(self, value: bytes) -> int:
+        return 8 * len(value) + len(self.terminator)
+
     def serialize(self, value: bytes, endianness: Endianness) -> Bits:
-        bits = []
+        return to_bits(value) + self.terminator
 
-        for char in value:
-            bits += U8_CODEC.serialize(char, endianness=endianness)
+    def encode_into(
+        self, value: bytes, writer: BitWriter, endianness: Endianness
+    ) -> None:
+        writer.write_bytes(value)
+        writer.write(self.terminator)
 
-        bits += self.terminator
+    def decode_from(
+        self, data: Buffer, bit_offset: int, endianness: Endianness
+    ) -> Tuple[bytes, int]:
+        end = find_terminator(data, bit_offset, 8 * len(data), self.terminator)
+        value = bytes(read_bytes(data, bit_offset, (end - bit_offset) >> 3))
 
-        return bits
+        return value, end + len(self.terminator)
 
-    def deserialize(self, bit_buffer: BitBuffer, endianness: Endianness) -> bytes:
-        result = bytearray()
+    def skip_from(self, data: Buffer, bit_offset: int, endianness: Endianness) -> int:
+        end = find_terminator(data, bit_offset, 8 * len(data), self.terminator)
 
-        while True:
-            peek_data = bit_buffer.peek(len(self.terminator))
-            if peek_data == self.terminator:
-                bit_buffer.read(len(self.terminator))
-                break
+        return end + len(self.terminator)
 
-            result.append(U8_CODEC.deserialize(bit_buffer, endianness=endianness))
+    def deserialize(self, bit_buffer: BitReader, endianness: Endianness) -> bytes:
+        end = find_terminator(
+            bit_buffer.data, bit_buffer.offset, bit_buffer.end, self.terminator
+        )
+        value = bytes(bit_buffer.read_bytes((end - bit_buffer.offset) >> 3))
+        bit_buffer.skip(len(self.terminator))
 
-        return bytes(result)
+        return value
 
     def validate(self, value: bytes) -> None:
         if not isinstance(value, bytes):
@@ -44,9 +52,7 @@ class TerminatedBytesCodec(BaseCodec[bytes]):
                 f"Invalid value, a {self.__class__.__name__}'s value must be of type '{type(bytes)}'"
             )
 
-        bits = to_bits(value)
-
-        if is_subsequence(self.terminator, bits):
+        if contains_terminator(value, self.terminator):
             raise ValidationError(
                 f"Invalid value, a {self.__class__.__name__}'s value cannot contain it's own "
                 f"terminator - {from_bits(self.terminator)!r}"
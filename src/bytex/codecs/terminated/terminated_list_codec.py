@@ -1,8 +1,11 @@
 from dataclasses import dataclass
-from typing import Generic, Sequence, TypeVar
+from typing import Generic, List, Sequence, Tuple, TypeVar, cast
 
-from bytex.bits import BitBuffer, Bits
+from bytex.bits import BitReader, Bits, BitWriter, Buffer
+from bytex.bits.utils import bits_to_int, ensure_available, find_terminator, read_int
 from bytex.codecs.base_codec import BaseCodec
+from bytex.codecs.base_list_codec import get_items_bit_size
+from bytex.codecs.integer_array import decode_integers, read_integers
 from bytex.endianness import Endianness
 from bytex.errors import ValidationError
 
@@ -14,6 +17,9 @@ class TerminatedListCodec(BaseCodec[Sequence[T]], Generic[T]):
     item_codec: BaseCodec[T]
     terminator: Bits
 
+    def get_bit_size(self, value: Sequence[T]) -> int:
+        return get_items_bit_size(self.item_codec, value) + len(self.terminator)
+
     def serialize(self, value: Sequence[T], endianness: Endianness) -> Bits:
         self.validate(value)
 
@@ -26,13 +32,68 @@ class TerminatedListCodec(BaseCodec[Sequence[T]], Generic[T]):
 
         return bits
 
-    def deserialize(self, bit_buffer: BitBuffer, endianness: Endianness) -> Sequence[T]:
+    def encode_into(
+        self, value: Sequence[T], writer: BitWriter, endianness: Endianness
+    ) -> None:
+        self.validate(value)
+
+        for item in value:
+            self.item_codec.encode_into(item, writer, endianness=endianness)
+
+        writer.write(self.terminator)
+
+    def decode_from(
+        self, data: Buffer, bit_offset: int, endianness: Endianness
+    ) -> Tuple[Sequence[T], int]:
+        item_size = self.item_codec.get_fixed_bit_size()
+        if item_size:
+            return self._decode_fixed_items(data, bit_offset, endianness, item_size)
+
+        terminator = bits_to_int(self.terminator)
+        terminator_length = len(self.terminator)
         items = []
 
         while True:
-            peeked_data = bit_buffer.peek(len(self.terminator))
-            if peeked_data == self.terminator:
-                bit_buffer.read(len(self.terminator))
+            ensure_available(data, bit_offset, terminator_length)
+            if read_int(data, bit_offset, terminator_length) == terminator:
+                bit_offset += terminator_length
+                break
+
+            item, bit_offset = self.item_codec.decode_from(data, bit_offset, endianness)
+            items.append(item)
+
+        return items, bit_offset
+
+    def skip_from(self, data: Buffer, bit_offset: int, endianness: Endianness) -> int:
+        item_size = self.item_codec.get_fixed_bit_size()
+        if item_size:
+            end = find_terminator(
+                data, bit_offset, 8 * len(data), self.terminator, step=item_size
+            )
+            return end + len(self.terminator)
+
+        terminator = bits_to_int(self.terminator)
+        terminator_length = len(self.terminator)
+
+        while True:
+            ensure_available(data, bit_offset, terminator_length)
+            if read_int(data, bit_offset, terminator_length) == terminator:
+                return bit_offset + terminator_length
+
+            bit_offset = self.item_codec.skip_from(data, bit_offset, endianness)
+
+    def deserialize(self, bit_buffer: BitReader, endianness: Endianness) -> Sequence[T]:
+        item_size = self.item_codec.get_fixed_bit_size()
+        if item_size:
+            return self._read_fixed_items(bit_buffer, endianness, item_size)
+
+        terminator = bits_to_int(self.terminator)
+        terminator_length = len(self.terminator)
+        items = []
+
+        while True:
+            if bit_buffer.peek_int(terminator_length) == terminator:
+                bit_buffer.skip(terminator_length)
                 break
 
             items.append(self.item_codec.deserialize(bit_buffer, endianness=endianness))
@@ -44,3 +105,60 @@ class TerminatedListCodec(BaseCodec[Sequence[T]], Generic[T]):
             raise ValidationError(
                 f"{self.__class__.__name__} expects a sequence of items."
             )
+
+    def _decode_fixed_items(
+        self, data: Buffer, bit_offset: int, endianness: Endianness, item_size: int
+    ) -> Tuple[Sequence[T], int]:
+        """
+        Items of a fixed size can only be followed by the terminator at a whole number
+        of items, so it is found first and the items are decoded in one go.
+        """
+        end = find_terminator(
+            data, bit_offset, 8 * len(data), self.terminator, step=item_size
+        )
+        count = (end - bit_offset) // item_size
+
+        decoded = decode_integers(
+            self.item_codec, data, bit_offset, count, endianness, as_array=False
+        )
+        if decoded is not None:
+            items = cast(List[T], decoded[0])
+        else:
+            items = []
+            for _ in range(count):
+                item, bit_offset = self.item_codec.decode_from(
+                    data, bit_offset, endianness
+                )
+                items.append(item)
+
+        return items, end + len(self.terminator)
+
+    def _read_fixed_items(
+        self, bit_buffer: BitReader, endianness: Endianness, item_size: int
+    ) -> Sequence[T]:
+        """
+        The `BitReader` counterpart of `_decode_fixed_items`.
+        """
+        end = find_terminator(
+            bit_buffer.data,
+            bit_buffer.offset,
+            bit_buffer.end,
+            self.terminator,
+            step=item_size,
+        )
+        count = (end - bit_buffer.offset) // item_size
+
+        values = read_integers(
+            self.item_codec, bit_buffer, count, endianness, as_array=False
+        )
+        if values is not None:
+            items = cast(List[T], values)
+        else:
+            items = [
+                self.item_codec.deserialize(bit_buffer, endianness=endianness)
+                for _ in range(count)
+            ]
+
+        bit_buffer.skip(len(self.terminator))
+
+        return items
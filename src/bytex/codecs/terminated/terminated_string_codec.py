@@ -1,41 +1,51 @@
 from dataclasses import dataclass
+from typing import Tuple
 
-from bytex.bits import BitBuffer, Bits, from_bits
-from bytex.bits.utils import is_subsequence, to_bits
+from bytex.bits import BitReader, Bits, BitWriter, Buffer, from_bits, to_bits
+from bytex.bits.utils import contains_terminator, find_terminator, read_bytes
 from bytex.codecs.base_codec import BaseCodec
-from bytex.codecs.basic.char_codec import CharCodec
+from bytex.codecs.basic.char_codec import encode_chars
 from bytex.endianness import Endianness
 from bytex.errors import ValidationError
 
-CHAR_CODEC = CharCodec()
-
 
 @dataclass(frozen=True)
 class TerminatedStringCodec(BaseCodec[str]):
     terminator: Bits
 
+    def get_bit_size(self, value: str) -> int:
+        return 8 * len(value) + len(self.terminator)
+
     def serialize(self, value: str, endianness: Endianness) -> Bits:
-        bits = []
+        return to_bits(encode_chars(value)) + self.terminator
 
-        for char in value:
-            bits += CHAR_CODEC.serialize(char, endianness=endianness)
+    def encode_into(
+        self, value: str, writer: BitWriter, endianness: Endianness
+    ) -> None:
+        writer.write_bytes(encode_chars(value))
+        writer.write(self.terminator)
 
-        bits += self.terminator
+    def decode_from(
+        self, data: Buffer, bit_offset: int, endianness: Endianness
+    ) -> Tuple[str, int]:
+        end = find_terminator(data, bit_offset, 8 * len(data), self.terminator)
+        value = bytes(read_bytes(data, bit_offset, (end - bit_offset) >> 3))
 
-        return bits
+        return value.decode("latin-1"), end + len(self.terminator)
 
-    def deserialize(self, bit_buffer: BitBuffer, endianness: Endianness) -> str:
-        result = str()
+    def skip_from(self, data: Buffer, bit_offset: int, endianness: Endianness) -> int:
+        end = find_terminator(data, bit_offset, 8 * len(data), self.terminator)
 
-        while True:
-            peek_data = bit_buffer.peek(len(self.terminator))
-            if peek_data == self.terminator:
-                bit_buffer.read(len(self.terminator))
-                break
+        return end + len(self.terminator)
 
-            result += CHAR_CODEC.deserialize(bit_buffer, endianness=endianness)
+    def deserialize(self, bit_buffer: BitReader, endianness: Endianness) -> str:
+        end = find_terminator(
+            bit_buffer.data, bit_buffer.offset, bit_buffer.end, self.terminator
+        )
+        value = bytes(bit_buffer.read_bytes((end - bit_buffer.offset) >> 3))
+        bit_buffer.skip(len(self.terminator))
 
-        return result
+        return value.decode("latin-1")
 
     def validate(self, value: str) -> None:
         if not isinstance(value, str):
@@ -43,9 +53,7 @@ class TerminatedStringCodec(BaseCodec[str]):
                 f"Invalid value, a {self.__class__.__name__}'s value must be of type '{str(str)}'"
             )
 
-        bits = to_bits(value)
-
-        if is_subsequence(self.terminator, bits):
+        if contains_terminator(encode_chars(value), self.terminator):
             raise ValidationError(
                 f"Invalid value, a {self.__class__.__name__}'s value cannot contain it's own "
                 f"terminator - {from_bits(self.terminator).decode()}"
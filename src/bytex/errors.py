@@ -26,5 +26,13 @@ class InsufficientDataError(ParsingError):
     pass
 
 
+class InsufficientSpaceError(StructureError):
+    pass
+
+
 class UninitializedAccessError(StructureError):
     pass
+
+
+class FrameSizeError(StructureError):
+    pass
@@ -2,6 +2,7 @@ from typing import Any, List, Optional, Protocol
 
 from bytex.codecs.base_codec import BaseCodec
 from bytex.codecs.base_list_codec import BaseListCodec
+from bytex.codecs.integer_array import is_array_codec, to_integer_array
 from bytex.errors import UninitializedAccessError
 
 
@@ -49,8 +50,48 @@ class Field:
         return instance.__dict__[self.name]
 
     def __set__(self, instance: Any, value: SupportsValidation) -> None:
+        instance.__dict__[self.name] = self._prepare(value)
+
+    def _prepare(self, value: SupportsValidation) -> SupportsValidation:
         if isinstance(value, list) and isinstance(self.codec, BaseListCodec):
-            value = ValidatedList(self.codec.get_inner_codec(), iterable=value)
+            if is_array_codec(self.codec):
+                value = to_integer_array(self.codec.get_inner_codec(), value)
+            else:
+                value = ValidatedList(self.codec.get_inner_codec(), iterable=value)
 
         self.codec.validate(value)
-        instance.__dict__[self.name] = value
+        return value
+
+
+class SlotField(Field):
+    """
+    A `Field` of a structure created with `slots=True`, whose value is stored in the
+    instance's `slot` slot instead of its `__dict__`.
+    """
+
+    def __init__(
+        self,
+        codec: BaseCodec[SupportsValidation],
+        name: str,
+        default: Optional[SupportsValidation] = None,
+    ) -> None:
+        super().__init__(codec=codec, name=name, default=default)
+        self.slot = f"_bytex_{name}"
+
+    def __get__(
+        self, instance: Optional[Any], owner: Optional[type] = None
+    ) -> SupportsValidation:
+        if instance is None:
+            raise UninitializedAccessError(
+                f"Cannot access the field `{self.name}` not from an instance"
+            )
+
+        try:
+            return getattr(instance, self.slot)
+        except AttributeError:
+            raise UninitializedAccessError(
+                f"Tried to access the field `{self.name}` before it was initialized"
+            ) from None
+
+    def __set__(self, instance: Any, value: SupportsValidation) -> None:
+        setattr(instance, self.slot, self._prepare(value))
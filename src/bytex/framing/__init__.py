@@ -0,0 +1,12 @@
+from bytex.framing.frame_parser import FrameParser
+from bytex.framing.framing import DEFAULT_MAX_FRAME_SIZE, Framing
+from bytex.framing.varint import Varint, decode_varint, encode_varint
+
+__all__ = [
+    "Framing",
+    "FrameParser",
+    "Varint",
+    "DEFAULT_MAX_FRAME_SIZE",
+    "encode_varint",
+    "decode_varint",
+]
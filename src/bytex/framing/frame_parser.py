@@ -0,0 +1,80 @@
+from typing import Generic, List
+
+from bytex.bits import Buffer
+from bytex.errors import InsufficientDataError, ParsingError
+from bytex.framing.framing import Framing, S
+
+
+class FrameParser(Generic[S]):
+    """
+    Parses frames out of data that arrives in chunks of any size into a receive
+    buffer.
+
+    Only the length prefix of a partially received frame is looked at again when
+    more data arrives, and every record is decoded straight from a view over the
+    buffer once its whole frame has arrived.
+    """
+
+    def __init__(self, framing: Framing[S]) -> None:
+        self._framing = framing
+        self._buffer = bytearray()
+        self._start = 0
+        self._closed = False
+
+    @property
+    def framing(self) -> Framing[S]:
+        return self._framing
+
+    @property
+    def pending(self) -> int:
+        """
+        The number of bytes received that are not part of a returned record yet.
+        """
+        return len(self._buffer) - self._start
+
+    def feed(self, chunk: Buffer) -> List[S]:
+        """
+        Adds `chunk` to the data received so far and returns the records of the frames
+        it completes.
+        """
+        if self._closed:
+            raise ParsingError("Cannot feed a closed frame parser")
+
+        self._append(chunk)
+
+        with memoryview(self._buffer) as view:
+            payloads, consumed = self._framing.split(view[self._start :])
+            records = [self._framing.parse_frame(payload) for payload in payloads]
+            del payloads
+
+        self._start += consumed
+
+        return records
+
+    def close(self) -> None:
+        """
+        Marks the end of the stream. Raises `InsufficientDataError` if it ends in the
+        middle of a frame.
+        """
+        self._closed = True
+
+        if self.pending:
+            raise InsufficientDataError(
+                f"The stream ended in the middle of a frame, {self.pending} bytes left"
+            )
+
+    def _append(self, chunk: Buffer) -> None:
+        # Records holding views of their frame lock the buffer against resizing, it is
+        # then replaced instead, leaving them the old one.
+        if 2 * self._start >= len(self._buffer):
+            try:
+                del self._buffer[: self._start]
+            except BufferError:
+                self._buffer = self._buffer[self._start :]
+
+            self._start = 0
+
+        try:
+            self._buffer += chunk
+        except BufferError:
+            self._buffer = self._buffer + chunk
@@ -0,0 +1,174 @@
+from typing import Generic, Iterable, List, Optional, Tuple, Type, TypeVar, Union
+
+from bytex.bits import Buffer
+from bytex.bits.utils import as_byte_view
+from bytex.codecs.basic.integer_codec import _byteorder
+from bytex.endianness import Endianness
+from bytex.errors import FrameSizeError, ParsingError, StructureCreationError
+from bytex.framing.varint import Varint, decode_varint, encode_varint
+from bytex.length_encodings import Prefix
+from bytex.sign import Sign
+from bytex.structure._structure import _Structure
+from bytex.types import U32
+
+S = TypeVar("S", bound=_Structure)
+
+DEFAULT_MAX_FRAME_SIZE = 1 << 24
+
+
+class Framing(Generic[S]):
+    """
+    Wraps `structure_class` records in frames: each record is preceded by the length
+    of its encoding, as an integer `Prefix` or a `Varint`.
+
+    Frames are split out of a receive buffer as views over it, without copying, and a
+    frame longer than `max_frame_size` bytes is rejected as soon as its prefix is
+    read, before any of it is buffered.
+    """
+
+    def __init__(
+        self,
+        structure_class: Type[S],
+        prefix: Union[Prefix, Varint] = Prefix(U32),
+        endianness: Endianness = Endianness.LITTLE,
+        max_frame_size: int = DEFAULT_MAX_FRAME_SIZE,
+        validate: bool = False,
+    ) -> None:
+        self._structure_class = structure_class
+        self._prefix = prefix
+        self._endianness = endianness
+        self._max_frame_size = max_frame_size
+        self._validate = validate
+        self._width: Optional[int] = None
+
+        if isinstance(prefix, Prefix):
+            codec = prefix.codec
+            if codec.bit_count % 8 != 0 or codec.sign != Sign.UNSIGNED:
+                raise StructureCreationError(
+                    "A frame length prefix must be an unsigned whole-byte integer, got "
+                    f"{codec!r}"
+                )
+
+            self._width = codec.bit_count >> 3
+            self._byteorder = _byteorder(endianness)
+            self._max_frame_size = min(max_frame_size, (1 << codec.bit_count) - 1)
+        elif not isinstance(prefix, Varint):
+            raise StructureCreationError(
+                f"A frame length prefix must be a `Prefix` or a `Varint`, got {prefix!r}"
+            )
+
+    @property
+    def structure_class(self) -> Type[S]:
+        return self._structure_class
+
+    @property
+    def endianness(self) -> Endianness:
+        return self._endianness
+
+    @property
+    def max_frame_size(self) -> int:
+        return self._max_frame_size
+
+    def dump(self, record: S) -> bytes:
+        """
+        Encodes `record` as a single frame.
+        """
+        return self.dump_many((record,))
+
+    def dump_many(self, records: Iterable[S]) -> bytes:
+        """
+        Encodes `records` as back to back frames in a single buffer, to be sent with a
+        single write.
+        """
+        parts: List[bytes] = []
+
+        for record in records:
+            payload = record.dump(endianness=self._endianness)
+            parts.append(self._encode_length(len(payload)))
+            parts.append(payload)
+
+        return b"".join(parts)
+
+    def split(self, buffer: Buffer) -> Tuple[List[memoryview], int]:
+        """
+        Splits the complete frames at the start of `buffer` into views of their
+        payloads, and returns them along with the number of bytes they take up. The
+        rest of `buffer` is the start of a frame that is yet to arrive in full.
+        """
+        view = as_byte_view(buffer)
+        payloads: List[memoryview] = []
+        offset = 0
+
+        while True:
+            length = self._decode_length(view, offset)
+            if length is None:
+                break
+
+            size, start = length
+            end = start + size
+            if end > len(view):
+                break
+
+            payloads.append(view[start:end])
+            offset = end
+
+        return payloads, offset
+
+    def parse_frame(self, payload: Buffer) -> S:
+        """
+        Parses the record a frame's payload holds, which must take up all of it.
+        """
+        view = as_byte_view(payload)
+        structure, bit_offset = self._structure_class.decode_from(
+            view, 0, self._endianness
+        )
+
+        remaining = 8 * len(view) - bit_offset
+        if remaining:
+            raise ParsingError(
+                f"Unexpected trailing data in frame: {remaining} bits left"
+            )
+
+        if self._validate:
+            structure.validate()
+
+        return structure
+
+    def parse_many(self, buffer: Buffer) -> Tuple[List[S], int]:
+        """
+        Parses the complete frames at the start of `buffer`, and returns their records
+        along with the number of bytes they take up.
+        """
+        payloads, consumed = self.split(buffer)
+
+        return [self.parse_frame(payload) for payload in payloads], consumed
+
+    def _encode_length(self, size: int) -> bytes:
+        if size > self._max_frame_size:
+            raise FrameSizeError(
+                f"Cannot frame a {size} bytes record, the maximum is "
+                f"{self._max_frame_size}"
+            )
+
+        if self._width is None:
+            return encode_varint(size)
+
+        return size.to_bytes(self._width, self._byteorder)
+
+    def _decode_length(
+        self, view: memoryview, offset: int
+    ) -> Optional[Tuple[int, int]]:
+        if self._width is None:
+            return decode_varint(view, offset, self._max_frame_size)
+
+        start = offset + self._width
+        if start > len(view):
+            return None
+
+        size = int.from_bytes(view[offset:start], self._byteorder)
+        if size > self._max_frame_size:
+            raise FrameSizeError(
+                f"Frame length {size} exceeds the maximum of {self._max_frame_size}"
+            )
+
+        return size, start
@@ -0,0 +1,63 @@
+from typing import Optional, Tuple
+
+from bytex.bits import Buffer
+from bytex.errors import FrameSizeError, ValidationError
+
+# Enough 7-bit groups for any 64-bit length.
+MAX_VARINT_LENGTH = 10
+
+
+class Varint:
+    """
+    A length prefix encoded as an unsigned LEB128 varint: 7 bits per byte, least
+    significant first, with the high bit set on every byte but the last.
+    """
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}()"
+
+
+def encode_varint(value: int) -> bytes:
+    if value < 0:
+        raise ValidationError(f"Invalid value, a varint cannot hold {value}")
+
+    encoded = bytearray()
+    while value > 0x7F:
+        encoded.append((value & 0x7F) | 0x80)
+        value >>= 7
+    encoded.append(value)
+
+    return bytes(encoded)
+
+
+def decode_varint(data: Buffer, offset: int, maximum: int) -> Optional[Tuple[int, int]]:
+    """
+    Decodes the varint starting `offset` bytes into `data` and returns it along with
+    the offset right after it, or `None` if `data` ends in the middle of it.
+
+    Raises `FrameSizeError` as soon as the value is known to exceed `maximum`, or
+    the varint runs longer than the 7-bit groups `maximum` needs, so a corrupt or
+    overlong prefix is rejected without waiting for the rest of it.
+    """
+    length = min(max(-(-maximum.bit_length() // 7), 1), MAX_VARINT_LENGTH)
+    value = 0
+    shift = 0
+
+    for index in range(offset, min(len(data), offset + length)):
+        byte = data[index]
+        value |= (byte & 0x7F) << shift
+        if value > maximum:
+            raise FrameSizeError(f"Frame length exceeds the maximum of {maximum}")
+
+        if not byte & 0x80:
+            return value, index + 1
+
+        shift += 7
+
+    if len(data) - offset >= length:
+        raise FrameSizeError(
+            f"Frame length prefix is longer than the {length} bytes a length of up "
+            f"to {maximum} takes"
+        )
+
+    return None
@@ -7,6 +7,8 @@ from bytex.errors import StructureCreationError
 @dataclass
 class Fixed(BaseLengthEncoding):
     length: int
+    as_array: bool = False
+    as_view: bool = False
 
     def __post_init__(self) -> None:
         if self.length < 0:
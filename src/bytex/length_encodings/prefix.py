@@ -7,7 +7,9 @@ from bytex.length_encodings.base_length_encoding import BaseLengthEncoding
 
 
 class Prefix(BaseLengthEncoding):
-    def __init__(self, size: Any) -> None:
+    def __init__(
+        self, size: Any, as_array: bool = False, as_view: bool = False
+    ) -> None:
         base_type, codec = extract_type_and_value(size)
 
         if base_type is not int or not isinstance(codec, IntegerCodec):
@@ -16,3 +18,5 @@ class Prefix(BaseLengthEncoding):
             )
 
         self.codec = codec
+        self.as_array = as_array
+        self.as_view = as_view
@@ -0,0 +1,3 @@
+from bytex.stream.stream_parser import StreamParser
+
+__all__ = ["StreamParser"]
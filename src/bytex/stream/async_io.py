@@ -0,0 +1,96 @@
+import asyncio
+from typing import AsyncIterator, Optional, Type, TypeVar
+
+from bytex.endianness import Endianness
+from bytex.errors import InsufficientDataError, ParsingError
+from bytex.stream.measure import END_OF_STREAM, Need, measure_structure
+from bytex.structure._structure import _Structure
+
+S = TypeVar("S", bound=_Structure)
+
+
+async def read_record(
+    structure_class: Type[S],
+    reader: asyncio.StreamReader,
+    endianness: Endianness,
+    validate: bool,
+) -> Optional[S]:
+    """
+    Reads a single `structure_class` record from `reader`, or returns `None` if the
+    stream ends before it starts.
+
+    Only the record's own bytes are read: fixed-size and length-prefixed parts with
+    `readexactly`, terminated parts with `readuntil` and a trailing `Data` field with
+    `read` until the end of the stream.
+    """
+    buffer = bytearray()
+    measurement = measure_structure(structure_class, buffer, 0, endianness)
+
+    try:
+        need = next(measurement)
+        while True:
+            await _fill(reader, buffer, need)
+            need = measurement.send(None)
+    except StopIteration:
+        pass
+    except asyncio.IncompleteReadError as e:
+        if not buffer and not e.partial:
+            return None
+
+        raise InsufficientDataError(
+            f"The stream ended in the middle of a '{structure_class.__name__}' record, "
+            f"{len(buffer) + len(e.partial)} bytes read"
+        ) from e
+
+    if not buffer:
+        raise ParsingError(
+            f"Cannot read '{structure_class.__name__}' records from a stream, they "
+            "take up no data"
+        )
+
+    structure, _ = structure_class.decode_from(buffer, 0, endianness)
+    if validate:
+        structure.validate()
+
+    return structure
+
+
+async def iter_records(
+    structure_class: Type[S],
+    reader: asyncio.StreamReader,
+    endianness: Endianness,
+    validate: bool,
+) -> AsyncIterator[S]:
+    """
+    Reads back to back `structure_class` records from `reader` until the stream ends.
+    """
+    while True:
+        structure = await read_record(structure_class, reader, endianness, validate)
+        if structure is None:
+            return
+
+        yield structure
+
+
+async def _fill(reader: asyncio.StreamReader, buffer: bytearray, need: Need) -> None:
+    if need.bit_end == END_OF_STREAM:
+        buffer += await reader.read()
+        return
+
+    missing = ((need.bit_end + 7) >> 3) - len(buffer)
+    if missing <= 0:
+        return
+
+    # A terminator that may start in data already read is completed byte by byte,
+    # reading up to the next occurrence could read past it.
+    terminator = need.terminator
+    if terminator is None or need.bit_end - 8 * len(terminator) < 8 * len(buffer):
+        buffer += await reader.readexactly(missing)
+        return
+
+    try:
+        buffer += await reader.readuntil(terminator)
+    except asyncio.LimitOverrunError as e:
+        # The terminator is further away than the reader is willing to buffer, the
+        # data before it is taken as is and searched again.
+        buffer += await reader.readexactly(max(e.consumed, 1))
@@ -0,0 +1,231 @@
+import io
+from typing import Iterator, Optional, Tuple, Type, TypeVar
+
+from bytex.bits import BinaryFile, BitWriter
+from bytex.endianness import Endianness
+from bytex.errors import AlignmentError, InsufficientDataError, ParsingError
+from bytex.stream.measure import (
+    END_OF_STREAM,
+    Need,
+    is_delimited,
+    measure_structure,
+)
+from bytex.structure._structure import _Structure
+
+S = TypeVar("S", bound=_Structure)
+
+
+def read_record(
+    structure_class: Type[S],
+    fp: BinaryFile,
+    buffer: bytearray,
+    endianness: Endianness,
+    validate: bool,
+    delimited: bool,
+) -> Optional[S]:
+    """
+    Reads a single `structure_class` record from the binary file `fp` into `buffer`,
+    or returns `None` if the file ends before it starts. `delimited` is whether the
+    structure `is_delimited`.
+
+    Only the record's own bytes are read. A fixed-size record is read with
+    `readinto` straight into `buffer`, which is reused as is from record to record.
+    A delimited record that is already buffered ahead in `fp` is decoded from there.
+    Otherwise the parts of the record are read one after the other as they are
+    measured, terminated parts up to the terminator when `fp` can be peeked into and
+    a trailing `Data` field until the end of the file.
+    """
+    structure: Optional[S] = None
+
+    bit_size = structure_class.bit_size()
+    if bit_size is not None:
+        size = (bit_size + 7) >> 3
+        if len(buffer) != size:
+            buffer[:] = bytes(size)
+
+        with memoryview(buffer) as view:
+            count = _readinto(fp, view)
+
+        complete = count == size
+    else:
+        peeked = _decode_peeked(structure_class, fp, endianness) if delimited else None
+        if peeked is not None:
+            structure, count = peeked
+            complete = True
+        else:
+            complete, count = _read_measured(structure_class, fp, buffer, endianness)
+
+    if not complete:
+        if not count:
+            return None
+
+        raise InsufficientDataError(
+            f"The file ended in the middle of a '{structure_class.__name__}' record, "
+            f"{count} bytes read"
+        )
+
+    if not count:
+        raise ParsingError(
+            f"Cannot read '{structure_class.__name__}' records from a file, they take "
+            "up no data"
+        )
+
+    if structure is None:
+        structure, _ = structure_class.decode_from(buffer, 0, endianness)
+
+    if validate:
+        structure.validate()
+
+    return structure
+
+
+def iter_records(
+    structure_class: Type[S],
+    fp: BinaryFile,
+    endianness: Endianness,
+    validate: bool,
+) -> Iterator[S]:
+    """
+    Reads back to back `structure_class` records from `fp` until the file ends.
+    """
+    buffer = bytearray()
+    delimited = is_delimited(structure_class)
+
+    while True:
+        structure = read_record(
+            structure_class, fp, buffer, endianness, validate, delimited
+        )
+        if structure is None:
+            return
+
+        yield structure
+
+
+def write_record(structure: _Structure, fp: BinaryFile, endianness: Endianness) -> int:
+    """
+    Encodes `structure` and writes it to `fp` straight from the encoding buffer.
+    Returns the number of bytes written.
+    """
+    writer = BitWriter()
+    structure.encode_into(writer, endianness=endianness)
+
+    if not writer.is_aligned():
+        raise AlignmentError(
+            "Cannot dump a structure whose bit size is not a multiple of 8"
+        )
+
+    written = 0
+    with writer.getbuffer() as view:
+        while written < len(view):
+            count = fp.write(view[written:])
+            if count is None:
+                raise BlockingIOError("Cannot write to a non-blocking file")
+
+            written += count
+
+    return written
+
+
+def _decode_peeked(
+    structure_class: Type[S], fp: BinaryFile, endianness: Endianness
+) -> Optional[Tuple[S, int]]:
+    peeked = _peek(fp)
+    if not peeked:
+        return None
+
+    try:
+        structure, bit_end = structure_class.decode_from(peeked, 0, endianness)
+    except InsufficientDataError:
+        return None
+
+    size = (bit_end + 7) >> 3
+    if fp.seekable():
+        fp.seek(size, io.SEEK_CUR)
+    else:
+        fp.read(size)
+
+    return structure, size
+
+
+def _read_measured(
+    structure_class: Type[S],
+    fp: BinaryFile,
+    buffer: bytearray,
+    endianness: Endianness,
+) -> Tuple[bool, int]:
+    """
+    Reads a record into `buffer` part by part, returns whether all of it was read
+    and the number of bytes read.
+    """
+    del buffer[:]
+    measurement = measure_structure(structure_class, buffer, 0, endianness)
+
+    try:
+        need = next(measurement)
+        while _fill(fp, buffer, need):
+            need = measurement.send(None)
+    except StopIteration:
+        return True, len(buffer)
+
+    return False, len(buffer)
+
+
+def _fill(fp: BinaryFile, buffer: bytearray, need: Need) -> bool:
+    """
+    Reads what `need` asks for into `buffer`, returns whether all of it was read.
+    """
+    if need.bit_end == END_OF_STREAM:
+        buffer += fp.read()
+        return True
+
+    missing = ((need.bit_end + 7) >> 3) - len(buffer)
+    if missing <= 0:
+        return True
+
+    # Reading up to the next terminator is only safe once the terminator cannot start
+    # in data already read, the same as with `StreamReader.readuntil`.
+    terminator = need.terminator
+    if terminator is not None and need.bit_end - 8 * len(terminator) >= 8 * len(buffer):
+        peeked = _peek(fp)
+        index = peeked.find(terminator)
+        missing = max(missing, index + len(terminator) if index != -1 else len(peeked))
+
+    while missing > 0:
+        chunk = fp.read(missing)
+        if not chunk:
+            return False
+
+        buffer += chunk
+        missing -= len(chunk)
+
+    return True
+
+
+def _peek(fp: BinaryFile) -> bytes:
+    """
+    Returns some of the data ahead in `fp` without consuming it, if possible.
+    """
+    peek = getattr(fp, "peek", None)
+    if peek is not None:
+        return bytes(peek(1))
+
+    if not fp.seekable():
+        return b""
+
+    peeked = fp.read(io.DEFAULT_BUFFER_SIZE)
+    fp.seek(-len(peeked), io.SEEK_CUR)
+
+    return peeked
+
+
+def _readinto(fp: BinaryFile, view: memoryview) -> int:
+    count = 0
+
+    while count < len(view):
+        read = fp.readinto(view[count:])
+        if not read:
+            break
+
+        count += read
+
+    return count
@@ -0,0 +1,315 @@
+import sys
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generator,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+)
+
+from bytex.bits import Bits
+from bytex.bits.utils import bits_to_int, find_terminator, from_bits, read_int
+from bytex.codecs import (
+    BaseCodec,
+    DataCodec,
+    ExactListCodec,
+    PrefixBytesCodec,
+    PrefixListCodec,
+    PrefixStringCodec,
+    StructureCodec,
+    TerminatedBytesCodec,
+    TerminatedListCodec,
+    TerminatedStringCodec,
+)
+from bytex.endianness import Endianness
+from bytex.errors import InsufficientDataError
+from bytex.structure._structure import _Structure
+
+# Yielded by a measurement that only ends with the stream, like one of a `Data` field.
+END_OF_STREAM = sys.maxsize
+
+
+class Need(NamedTuple):
+    """
+    What a measurement needs before it can go on: the data must reach `bit_end`.
+
+    While searching for a whole-byte `terminator` that may start anywhere from
+    `bit_end - 8 * len(terminator)` on, the data can be read up to the terminator's
+    next occurrence instead.
+    """
+
+    bit_end: int
+    terminator: Optional[bytes] = None
+
+
+# A measurement yields what it needs and returns the bit offset the measured value
+# ends at. It reads `data` while suspended in between, so `data` may grow but must
+# not be moved.
+Measurement = Generator[Need, None, int]
+
+
+def measure_structure(
+    structure_class: Type[_Structure],
+    data: bytearray,
+    bit_offset: int,
+    endianness: Endianness,
+) -> Measurement:
+    """
+    Measures a `structure_class` record starting `bit_offset` bits into `data`, which
+    is filled in as the measurement goes.
+
+    Every part of the record is only looked at once: fixed-size parts are stepped
+    over, length prefixes are read once they arrive and terminators are searched for
+    in the newly arrived data alone.
+    """
+    return _measure(StructureCodec(structure_class), data, bit_offset, endianness)
+
+
+def is_delimited(structure_class: Type[_Structure]) -> bool:
+    """
+    Whether a `structure_class` record's end follows from its own bytes alone, so it
+    decodes the same from any buffer that holds all of it. A `Data` field, which takes
+    up the rest of the buffer, or a codec the measurement knows nothing about makes
+    it not.
+    """
+    return _is_delimited(StructureCodec(structure_class))
+
+
+def _is_delimited(codec: BaseCodec) -> bool:
+    if codec.get_fixed_bit_size() is not None:
+        return True
+
+    if type(codec) not in _MEASURES or isinstance(codec, DataCodec):
+        return False
+
+    if isinstance(codec, StructureCodec):
+        return all(
+            _is_delimited(field.codec)
+            for field in codec.structure_class.__bytex_fields__.values()
+        )
+
+    item_codec = getattr(codec, "item_codec", None)
+
+    return item_codec is None or _is_delimited(item_codec)
+
+
+def _measure(
+    codec: BaseCodec, data: bytearray, bit_offset: int, endianness: Endianness
+) -> Measurement:
+    bit_size = codec.get_fixed_bit_size()
+    if bit_size is not None:
+        yield Need(bit_offset + bit_size)
+        return bit_offset + bit_size
+
+    # Subclasses of the codecs below may be laid out differently, only exact types
+    # are measured part by part.
+    measure = _MEASURES.get(type(codec), _retry)
+
+    return (yield from measure(codec, data, bit_offset, endianness))
+
+
+def _measure_structure(
+    codec: StructureCodec, data: bytearray, bit_offset: int, endianness: Endianness
+) -> Measurement:
+    # Fixed-size fields are only stepped over, they are read along with whatever
+    # comes after them.
+    for field in codec.structure_class.__bytex_fields__.values():
+        bit_size = field.codec.get_fixed_bit_size()
+        if bit_size is None:
+            bit_offset = yield from _measure(field.codec, data, bit_offset, endianness)
+        else:
+            bit_offset += bit_size
+
+    yield Need(bit_offset)
+    return bit_offset
+
+
+def _measure_prefix_bytes(
+    codec: Union[PrefixBytesCodec, PrefixStringCodec],
+    data: bytearray,
+    bit_offset: int,
+    endianness: Endianness,
+) -> Measurement:
+    length, bit_offset = yield from _decode(
+        codec.prefix_codec, data, bit_offset, endianness
+    )
+    yield Need(bit_offset + 8 * length)
+    return bit_offset + 8 * length
+
+
+def _measure_prefix_list(
+    codec: PrefixListCodec, data: bytearray, bit_offset: int, endianness: Endianness
+) -> Measurement:
+    length, bit_offset = yield from _decode(
+        codec.prefix_codec, data, bit_offset, endianness
+    )
+
+    return (
+        yield from _measure_items(
+            codec.item_codec, data, bit_offset, length, endianness
+        )
+    )
+
+
+def _measure_exact_list(
+    codec: ExactListCodec, data: bytearray, bit_offset: int, endianness: Endianness
+) -> Measurement:
+    return (
+        yield from _measure_items(
+            codec.item_codec, data, bit_offset, codec.length, endianness
+        )
+    )
+
+
+def _measure_terminated_bytes(
+    codec: Union[TerminatedBytesCodec, TerminatedStringCodec],
+    data: bytearray,
+    bit_offset: int,
+    endianness: Endianness,
+) -> Measurement:
+    return (yield from _find(data, bit_offset, codec.terminator, 8))
+
+
+def _measure_terminated_list(
+    codec: TerminatedListCodec,
+    data: bytearray,
+    bit_offset: int,
+    endianness: Endianness,
+) -> Measurement:
+    item_size = codec.item_codec.get_fixed_bit_size()
+    if item_size:
+        return (yield from _find(data, bit_offset, codec.terminator, item_size))
+
+    terminator = _to_int(codec.terminator)
+    terminator_length = len(codec.terminator)
+
+    while True:
+        yield Need(bit_offset + terminator_length)
+        if read_int(data, bit_offset, terminator_length) == terminator:
+            return bit_offset + terminator_length
+
+        bit_offset = yield from _measure(codec.item_codec, data, bit_offset, endianness)
+
+
+def _measure_data(
+    codec: DataCodec, data: bytearray, bit_offset: int, endianness: Endianness
+) -> Measurement:
+    yield Need(END_OF_STREAM)
+    return codec.skip_from(data, bit_offset, endianness)
+
+
+def _measure_items(
+    item_codec: BaseCodec,
+    data: bytearray,
+    bit_offset: int,
+    count: int,
+    endianness: Endianness,
+) -> Measurement:
+    item_size = item_codec.get_fixed_bit_size()
+    if item_size is not None:
+        yield Need(bit_offset + count * item_size)
+        return bit_offset + count * item_size
+
+    for _ in range(count):
+        bit_offset = yield from _measure(item_codec, data, bit_offset, endianness)
+
+    return bit_offset
+
+
+def _decode(
+    codec: BaseCodec, data: bytearray, bit_offset: int, endianness: Endianness
+) -> Generator[Need, None, Tuple[Any, int]]:
+    yield from _measure(codec, data, bit_offset, endianness)
+
+    return codec.decode_from(data, bit_offset, endianness)
+
+
+def _find(data: bytearray, bit_offset: int, terminator: Bits, step: int) -> Measurement:
+    length = len(terminator)
+    needle = None
+    if length % 8 == 0 and step % 8 == 0 and bit_offset % 8 == 0:
+        needle = _to_bytes(terminator)
+
+    while True:
+        available = 8 * len(data)
+        if needle is None:
+            try:
+                end = find_terminator(data, bit_offset, available, terminator, step)
+                return end + length
+            except InsufficientDataError:
+                pass
+        else:
+            index = data.find(needle, bit_offset >> 3)
+            while index != -1:
+                if (8 * index - bit_offset) % step == 0:
+                    return 8 * index + length
+
+                index = data.find(needle, index + 1)
+
+        # Only the offsets a terminator could still start at once more data arrives
+        # are searched again.
+        behind = available - length + 1 - bit_offset
+        if behind > 0:
+            bit_offset += -(-behind // step) * step
+
+        # Offsets at which the data already rules the terminator out are passed over
+        # as well, so what is needed next is a whole occurrence if possible.
+        if needle is not None:
+            while bit_offset < available and not needle.startswith(
+                data[bit_offset >> 3 :]
+            ):
+                bit_offset += step
+
+        yield Need(bit_offset + length, needle)
+
+
+def _retry(
+    codec: BaseCodec, data: bytearray, bit_offset: int, endianness: Endianness
+) -> Measurement:
+    # Codecs the measurement knows nothing about are skipped over from the start
+    # whenever more data arrives. The error is let go of before suspending, as its
+    # traceback can hold a view of `data` that would keep it from growing.
+    while True:
+        try:
+            return codec.skip_from(data, bit_offset, endianness)
+        except InsufficientDataError:
+            pass
+
+        yield Need(8 * len(data) + 8)
+
+
+_MEASURES: Dict[type, Callable[[Any, bytearray, int, Endianness], Measurement]] = {
+    StructureCodec: _measure_structure,
+    PrefixBytesCodec: _measure_prefix_bytes,
+    PrefixStringCodec: _measure_prefix_bytes,
+    PrefixListCodec: _measure_prefix_list,
+    ExactListCodec: _measure_exact_list,
+    TerminatedBytesCodec: _measure_terminated_bytes,
+    TerminatedStringCodec: _measure_terminated_bytes,
+    TerminatedListCodec: _measure_terminated_list,
+    DataCodec: _measure_data,
+}
+
+# Terminators are converted once, not every time a record is measured.
+_BYTES: Dict[Tuple[bool, ...], bytes] = {}
+_INTS: Dict[Tuple[bool, ...], int] = {}
+
+
+def _to_bytes(bits: Bits) -> bytes:
+    key = tuple(bits)
+    if key not in _BYTES:
+        _BYTES[key] = from_bits(bits)
+
+    return _BYTES[key]
+
+
+def _to_int(bits: Bits) -> int:
+    key = tuple(bits)
+    if key not in _INTS:
+        _INTS[key] = bits_to_int(bits)
+
+    return _INTS[key]
@@ -0,0 +1,162 @@
+from typing import Generic, List, Optional, Type, TypeVar
+
+from bytex.bits import Buffer
+from bytex.endianness import Endianness
+from bytex.errors import InsufficientDataError, ParsingError
+from bytex.stream.measure import (
+    END_OF_STREAM,
+    Measurement,
+    Need,
+    is_delimited,
+    measure_structure,
+)
+from bytex.structure._structure import _Structure
+
+S = TypeVar("S", bound=_Structure)
+
+
+class StreamParser(Generic[S]):
+    """
+    Parses back to back records out of data that arrives in chunks of any size, like
+    the data received from a socket.
+
+    The parser keeps its place inside a partially received record between chunks, so
+    every byte is looked at a bounded number of times no matter how the data is
+    split, and a record is decoded once, when all of it has arrived. Every record
+    starts on a byte boundary.
+
+    A record ending with a `Data` field takes up the rest of the stream, it is only
+    returned by `close`.
+    """
+
+    def __init__(
+        self,
+        structure_class: Type[S],
+        endianness: Endianness = Endianness.LITTLE,
+        validate: bool = False,
+    ) -> None:
+        self._structure_class = structure_class
+        self._endianness = endianness
+        self._validate = validate
+        self._delimited = is_delimited(structure_class)
+        self._buffer = bytearray()
+        self._start = 0
+        self._measurement: Optional[Measurement] = None
+        self._need = Need(0)
+        self._closed = False
+
+    @property
+    def structure_class(self) -> Type[S]:
+        return self._structure_class
+
+    @property
+    def pending(self) -> int:
+        """
+        The number of bytes received that are not part of a returned record yet.
+        """
+        return len(self._buffer) - self._start
+
+    def feed(self, chunk: Buffer) -> List[S]:
+        """
+        Adds `chunk` to the data received so far and returns the records it completes.
+        """
+        if self._closed:
+            raise ParsingError("Cannot feed a closed stream parser")
+
+        self._buffer += chunk
+
+        return self._parse()
+
+    def close(self) -> List[S]:
+        """
+        Marks the end of the stream and returns the records completed by it. Raises
+        `InsufficientDataError` if the stream ends in the middle of a record.
+        """
+        self._closed = True
+        records = self._parse()
+
+        if self.pending:
+            raise InsufficientDataError(
+                f"The stream ended in the middle of a '{self._structure_class.__name__}' "
+                f"record, {self.pending} bytes left"
+            )
+
+        return records
+
+    def _parse(self) -> List[S]:
+        records: List[S] = []
+
+        while self._can_resume():
+            if self._measurement is None:
+                self._compact()
+                self._decode_records(records)
+                if not self.pending:
+                    break
+
+                self._start_record()
+
+            assert self._measurement is not None
+            try:
+                self._need = next(self._measurement)
+            except StopIteration as stop:
+                structure, _ = self._structure_class.decode_from(
+                    self._buffer, 8 * self._start, self._endianness
+                )
+                records.append(self._finish_record(structure, stop.value))
+
+        return records
+
+    def _can_resume(self) -> bool:
+        if self._need.bit_end == END_OF_STREAM:
+            return self._closed
+
+        return self._need.bit_end <= 8 * len(self._buffer)
+
+    def _decode_records(self, records: List[S]) -> None:
+        # Records that have already arrived in full are decoded right away, back to
+        # back, measuring one first only pays off when it has not.
+        if not self._delimited:
+            return
+
+        decode_from = self._structure_class.decode_from
+        buffer = self._buffer
+        bit_offset = 8 * self._start
+        bit_end = 8 * len(buffer)
+
+        try:
+            while bit_offset < bit_end:
+                structure, record_end = decode_from(
+                    buffer, bit_offset, self._endianness
+                )
+                records.append(self._finish_record(structure, record_end))
+                bit_offset = 8 * self._start
+        except InsufficientDataError:
+            pass
+
+    def _compact(self) -> None:
+        # The buffer is only compacted in between records, as a measurement refers to
+        # it by offset. Waiting for half of it to be consumed keeps the copying linear.
+        if 2 * self._start >= len(self._buffer):
+            del self._buffer[: self._start]
+            self._start = 0
+
+    def _start_record(self) -> None:
+        self._measurement = measure_structure(
+            self._structure_class, self._buffer, 8 * self._start, self._endianness
+        )
+
+    def _finish_record(self, structure: S, record_end: int) -> S:
+        if record_end == 8 * self._start:
+            raise ParsingError(
+                f"Cannot parse a stream of '{self._structure_class.__name__}' records, "
+                "they take up no data"
+            )
+
+        if self._validate:
+            structure.validate()
+
+        self._start = (record_end + 7) >> 3
+        self._measurement = None
+        self._need = Need(0)
+
+        return structure
@@ -0,0 +1,20 @@
+from bytex.struct_array.column import (
+    column,
+    column_histogram,
+    column_max,
+    column_min,
+    column_sum,
+)
+from bytex.struct_array.record_file import RecordFile, open_records
+from bytex.struct_array.struct_array import StructArray
+
+__all__ = [
+    "StructArray",
+    "RecordFile",
+    "open_records",
+    "column",
+    "column_sum",
+    "column_min",
+    "column_max",
+    "column_histogram",
+]
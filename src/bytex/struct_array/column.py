@@ -0,0 +1,162 @@
+import array
+from collections import Counter
+from typing import Dict, Tuple, Type, Union
+
+from bytex.bits import Buffer
+from bytex.bits.utils import as_byte_view
+from bytex.codecs import IntegerCodec, StructureCodec
+from bytex.codecs.integer_array import ARRAY_TYPECODES, NATIVE_ENDIANNESS
+from bytex.endianness import Endianness
+from bytex.errors import StructureError, ValidationError
+from bytex.sign import Sign
+from bytex.struct_array.utils import check_length
+from bytex.structure._structure import _Structure
+
+MEMORYVIEW_FORMATS: Dict[int, str] = {1: "b", 2: "h", 4: "i", 8: "q"}
+
+Column = Union["array.array[int]", memoryview]
+
+
+def column(
+    buffer: Buffer,
+    structure_class: Type[_Structure],
+    field: str,
+    endianness: Endianness = Endianness.LITTLE,
+) -> Column:
+    """
+    Extracts the values of an integer field from every record in `buffer` without
+    parsing the records.
+
+    `field` names a byte-aligned 8, 16, 32 or 64 bit integer field of the fixed-size
+    `structure_class`, and may be a dotted path into nested structures. When the
+    field's byte order is native and its offset is aligned to its width, the result
+    is a strided `memoryview` over `buffer`, otherwise it is an `array.array` copy.
+    """
+    record_size = structure_class.size()
+    bit_offset, codec = _resolve_field(structure_class, field)
+    offset = bit_offset >> 3
+    width = codec.bit_count >> 3
+
+    view = as_byte_view(buffer)
+    check_length(structure_class, len(view))
+    end = len(view)
+    count = end // record_size
+
+    if codec.sign == Sign.UNSIGNED:
+        view_format = MEMORYVIEW_FORMATS[width].upper()
+        typecode = ARRAY_TYPECODES[width].upper()
+    else:
+        view_format = MEMORYVIEW_FORMATS[width]
+        typecode = ARRAY_TYPECODES[width]
+
+    if (width == 1 or endianness is NATIVE_ENDIANNESS) and (
+        offset % width == 0 and record_size % width == 0
+    ):
+        strided = view.cast(view_format)  # type: ignore[call-overload]
+        return strided[offset // width :: record_size // width]
+
+    data = bytearray(count * width)
+    for lane in range(width):
+        data[lane::width] = view[offset + lane : end : record_size]
+
+    values = array.array(typecode, data)
+    if endianness is not NATIVE_ENDIANNESS:
+        values.byteswap()
+
+    return values
+
+
+def column_sum(
+    buffer: Buffer,
+    structure_class: Type[_Structure],
+    field: str,
+    endianness: Endianness = Endianness.LITTLE,
+) -> int:
+    return sum(column(buffer, structure_class, field, endianness))
+
+
+def column_min(
+    buffer: Buffer,
+    structure_class: Type[_Structure],
+    field: str,
+    endianness: Endianness = Endianness.LITTLE,
+) -> int:
+    """
+    Raises `ValueError` if `buffer` holds no records, just like `min`.
+    """
+    return min(column(buffer, structure_class, field, endianness))
+
+
+def column_max(
+    buffer: Buffer,
+    structure_class: Type[_Structure],
+    field: str,
+    endianness: Endianness = Endianness.LITTLE,
+) -> int:
+    """
+    Raises `ValueError` if `buffer` holds no records, just like `max`.
+    """
+    return max(column(buffer, structure_class, field, endianness))
+
+
+def column_histogram(
+    buffer: Buffer,
+    structure_class: Type[_Structure],
+    field: str,
+    endianness: Endianness = Endianness.LITTLE,
+    bin_width: int = 1,
+) -> Dict[int, int]:
+    """
+    Counts the records per value of `field`. With a `bin_width` greater than 1,
+    values are grouped into bins keyed by their lower bound.
+    """
+    if bin_width <= 0:
+        raise ValidationError(
+            "Invalid `bin_width`, `bin_width` should be a positive number"
+        )
+
+    values = column(buffer, structure_class, field, endianness)
+    if bin_width == 1:
+        return dict(Counter(values))
+
+    return dict(Counter(value - value % bin_width for value in values))
+
+
+def _resolve_field(
+    structure_class: Type[_Structure], field: str
+) -> Tuple[int, IntegerCodec]:
+    bit_offset = 0
+    *parents, name = field.split(".")
+
+    for parent in parents:
+        codec = _get_codec(structure_class, parent)
+        if not isinstance(codec, StructureCodec):
+            raise StructureError(
+                f"'{structure_class.__name__}.{parent}' is not a nested structure"
+            )
+
+        bit_offset += structure_class.field_offsets()[parent]
+        structure_class = codec.structure_class
+
+    codec = _get_codec(structure_class, name)
+    bit_offset += structure_class.field_offsets()[name]
+
+    if (
+        not isinstance(codec, IntegerCodec)
+        or codec.bit_count not in (8, 16, 32, 64)
+        or bit_offset % 8 != 0
+    ):
+        raise StructureError(
+            f"'{field}' is not a byte-aligned 8, 16, 32 or 64 bit integer field"
+        )
+
+    return bit_offset, codec
+
+
+def _get_codec(structure_class: Type[_Structure], name: str) -> object:
+    try:
+        return structure_class.__bytex_fields__[name].codec
+    except KeyError:
+        raise StructureError(
+            f"'{structure_class.__name__}' has no field named '{name}'"
+        ) from None
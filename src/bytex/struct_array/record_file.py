@@ -0,0 +1,105 @@
+import mmap
+import os
+from types import TracebackType
+from typing import Generic, Iterator, Optional, Type, Union, overload
+
+from bytex.endianness import Endianness
+from bytex.struct_array.column import Column
+from bytex.struct_array.struct_array import S, StructArray
+from bytex.struct_array.utils import check_length
+
+
+class RecordFile(Generic[S]):
+    """
+    A read-only, random-access view of a file of back to back fixed-size records.
+
+    The file is memory mapped, so only the pages of the records actually accessed are
+    read from disk, and a record is decoded only when it is indexed or iterated over.
+    Slices are `StructArray` views over the mapping, closing the file while one is
+    still alive raises a `BufferError`.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, "os.PathLike[str]"],
+        structure_class: Type[S],
+        endianness: Endianness = Endianness.LITTLE,
+    ) -> None:
+        self._mmap: Optional[mmap.mmap] = None
+
+        with open(path, "rb") as file:
+            length = os.fstat(file.fileno()).st_size
+            check_length(structure_class, length)
+
+            if length > 0:
+                self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        self._records = StructArray.from_buffer(
+            structure_class,
+            memoryview(self._mmap) if self._mmap is not None else b"",
+            endianness,
+        )
+
+    @property
+    def structure_class(self) -> Type[S]:
+        return self._records.structure_class
+
+    @property
+    def endianness(self) -> Endianness:
+        return self._records.endianness
+
+    @overload
+    def __getitem__(self, index: int) -> S: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> StructArray[S]: ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[S, StructArray[S]]:
+        return self._records[index]
+
+    def __iter__(self) -> Iterator[S]:
+        return iter(self._records)
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def column(self, field: str) -> Column:
+        return self._records.column(field)
+
+    def close(self) -> None:
+        buffer = self._records.buffer
+        if isinstance(buffer, memoryview):
+            buffer.release()
+
+        self._close_mmap()
+
+    def _close_mmap(self) -> None:
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+
+    def __enter__(self) -> "RecordFile[S]":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return f"RecordFile({self.structure_class.__name__}, length={len(self)})"
+
+
+def open_records(
+    path: Union[str, "os.PathLike[str]"],
+    structure_class: Type[S],
+    endianness: Endianness = Endianness.LITTLE,
+) -> RecordFile[S]:
+    """
+    Memory maps the file at `path` as records of `structure_class` encoded with
+    `endianness`.
+    """
+    return RecordFile(path, structure_class, endianness)
@@ -0,0 +1,209 @@
+from typing import (
+    Generic,
+    Iterable,
+    Iterator,
+    Sized,
+    Type,
+    TypeVar,
+    Union,
+    overload,
+)
+
+from bytex.bits import Buffer, WritableBuffer
+from bytex.bits.utils import as_byte_view
+from bytex.endianness import Endianness
+from bytex.errors import StructureError, ValidationError
+from bytex.struct_array.column import Column, column
+from bytex.struct_array.utils import check_length, record_size
+from bytex.structure._structure import _Structure
+
+S = TypeVar("S", bound=_Structure)
+
+
+class StructArray(Generic[S]):
+    """
+    A list-like container of fixed-size records stored back to back in a single
+    buffer.
+
+    Records are encoded into the buffer on insertion and decoded on access, so an
+    array of N records takes up N times the structure's `size()` bytes. Contiguous
+    slices are views sharing the same buffer, a view cannot change its length and
+    while one is alive the array it was taken from cannot grow either.
+    """
+
+    def __init__(
+        self,
+        structure_class: Type[S],
+        records: Iterable[S] = (),
+        endianness: Endianness = Endianness.LITTLE,
+    ) -> None:
+        self._structure_class = structure_class
+        self._size = record_size(structure_class)
+        self._endianness = endianness
+        self._blank = bytes(self._size)
+        self._buffer: WritableBuffer = bytearray()
+
+        self.extend(records)
+
+    @classmethod
+    def from_buffer(
+        cls,
+        structure_class: Type[S],
+        buffer: Buffer,
+        endianness: Endianness = Endianness.LITTLE,
+    ) -> "StructArray[S]":
+        """
+        Wraps already encoded records without copying them. A `bytearray` is shared
+        and can still grow, any other buffer is wrapped as a fixed-length view.
+        """
+        array: StructArray[S] = cls(structure_class, endianness=endianness)
+        array._buffer = (
+            buffer if isinstance(buffer, bytearray) else as_byte_view(buffer)
+        )
+        check_length(structure_class, len(array._buffer))
+
+        return array
+
+    @property
+    def structure_class(self) -> Type[S]:
+        return self._structure_class
+
+    @property
+    def endianness(self) -> Endianness:
+        return self._endianness
+
+    @property
+    def buffer(self) -> WritableBuffer:
+        """
+        The underlying buffer, exposed without copying.
+        """
+        return self._buffer
+
+    def column(self, field: str) -> Column:
+        """
+        Extracts the values of an integer field from every record without decoding
+        the records, see `bytex.struct_array.column`.
+        """
+        return column(self._buffer, self._structure_class, field, self._endianness)
+
+    def append(self, record: S) -> None:
+        """
+        Encodes `record` straight into the end of the buffer.
+        """
+        buffer = self._resizable_buffer()
+        self._check(record)
+
+        offset = len(buffer)
+        buffer += self._blank
+
+        try:
+            record.pack_into(buffer, offset, self._endianness)
+        except BaseException:
+            del buffer[offset:]
+            raise
+
+    def extend(self, records: Iterable[S]) -> None:
+        buffer = self._resizable_buffer()
+
+        if (
+            isinstance(records, StructArray)
+            and records._structure_class is self._structure_class
+            and records._endianness is self._endianness
+        ):
+            buffer += records._buffer
+            return
+
+        if not isinstance(records, Sized):
+            for record in records:
+                self.append(record)
+            return
+
+        start = len(buffer)
+        buffer += bytes(self._size * len(records))
+
+        try:
+            offset = start
+            for record in records:
+                self._check(record)
+                record.pack_into(buffer, offset, self._endianness)
+                offset += self._size
+        except BaseException:
+            del buffer[start:]
+            raise
+
+    @overload
+    def __getitem__(self, index: int) -> S: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "StructArray[S]": ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[S, "StructArray[S]"]:
+        if isinstance(index, slice):
+            return self._slice(index)
+
+        offset = self._offset(index)
+        record, _ = self._structure_class.decode_from(
+            self._buffer, 8 * offset, self._endianness
+        )
+
+        return record
+
+    def __setitem__(self, index: int, record: S) -> None:
+        self._check(record)
+        record.pack_into(self._buffer, self._offset(index), self._endianness)
+
+    def __iter__(self) -> Iterator[S]:
+        decode_from = self._structure_class.decode_from
+        endianness = self._endianness
+
+        for offset in range(0, len(self._buffer), self._size):
+            record, _ = decode_from(self._buffer, 8 * offset, endianness)
+            yield record
+
+    def __len__(self) -> int:
+        return len(self._buffer) // self._size
+
+    def __bytes__(self) -> bytes:
+        return bytes(self._buffer)
+
+    def __buffer__(self, flags: int) -> memoryview:
+        return memoryview(self._buffer)
+
+    def __repr__(self) -> str:
+        return f"StructArray({self._structure_class.__name__}, length={len(self)})"
+
+    def _slice(self, index: slice) -> "StructArray[S]":
+        start, stop, step = index.indices(len(self))
+        view = memoryview(self._buffer)
+
+        if step == 1:
+            data: Buffer = view[start * self._size : max(start, stop) * self._size]
+        else:
+            data = bytearray()
+            for i in range(start, stop, step):
+                data += view[i * self._size : (i + 1) * self._size]
+
+        return StructArray.from_buffer(self._structure_class, data, self._endianness)
+
+    def _offset(self, index: int) -> int:
+        length = len(self)
+        if index < 0:
+            index += length
+
+        if not 0 <= index < length:
+            raise IndexError("StructArray index out of range")
+
+        return index * self._size
+
+    def _check(self, record: S) -> None:
+        if not isinstance(record, self._structure_class):
+            raise ValidationError(
+                f"Invalid value, a '{self._structure_class.__name__}' StructArray "
+                f"can only hold '{self._structure_class.__name__}' records"
+            )
+
+    def _resizable_buffer(self) -> bytearray:
+        if not isinstance(self._buffer, bytearray):
+            raise StructureError("Cannot change the length of a StructArray view")
+
+        return self._buffer
@@ -0,0 +1,24 @@
+from typing import Type
+
+from bytex.errors import StructureError
+from bytex.structure._structure import _Structure
+
+
+def record_size(structure_class: Type[_Structure]) -> int:
+    size = structure_class.size()
+    if size == 0:
+        raise StructureError(
+            f"'{structure_class.__name__}' takes up no data, it cannot be laid out as records"
+        )
+
+    return size
+
+
+def check_length(structure_class: Type[_Structure], length: int) -> None:
+    size = record_size(structure_class)
+
+    if length % size != 0:
+        raise StructureError(
+            f"{length} bytes do not hold a whole number of {size} bytes "
+            f"'{structure_class.__name__}' records"
+        )
@@ -1,14 +1,38 @@
 from __future__ import annotations
 
-from typing import Any
+import asyncio
+from typing import (
+    Any,
+    AsyncIterator,
+    ClassVar,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    overload,
+)
 
 from typing_extensions import Self
 
-from bytex.bits import BitBuffer, Bits
+from bytex.bits import (
+    BinaryFile,
+    BitReader,
+    Bits,
+    BitWriter,
+    Buffer,
+    WritableBuffer,
+)
 from bytex.endianness import Endianness
 
 
 class _Structure:
+    __slots__ = ()
+
+    __bytex_fields__: ClassVar[Dict[str, Any]]
+    __bytex_source__: ClassVar[Dict[str, str]]
+
     def __init__(self, **data: Any) -> None:
         raise NotImplementedError
 
@@ -18,24 +42,214 @@ class _Structure:
     def dump_bits(self, endianness: Endianness = Endianness.LITTLE) -> Bits:
         raise NotImplementedError
 
+    def dump_into(
+        self,
+        buffer: WritableBuffer,
+        offset: int = 0,
+        endianness: Endianness = Endianness.LITTLE,
+    ) -> int:
+        raise NotImplementedError
+
+    @classmethod
+    def dump_many(
+        cls, records: Iterable[Self], endianness: Endianness = Endianness.LITTLE
+    ) -> bytes:
+        raise NotImplementedError
+
+    def encode_into(self, writer: BitWriter, endianness: Endianness) -> None:
+        raise NotImplementedError
+
+    @overload
+    @classmethod
+    def parse(
+        cls,
+        data: bytes,
+        endianness: Endianness = ...,
+        strict: bool = ...,
+        validate: bool = ...,
+        fields: None = ...,
+    ) -> Self: ...
+
+    @overload
+    @classmethod
+    def parse(
+        cls,
+        data: bytes,
+        endianness: Endianness = ...,
+        strict: bool = ...,
+        validate: bool = ...,
+        *,
+        fields: Iterable[str],
+    ) -> Any: ...
+
     @classmethod
     def parse(
         cls,
         data: bytes,
         endianness: Endianness = Endianness.LITTLE,
         strict: bool = False,
+        validate: bool = False,
+        fields: Optional[Iterable[str]] = None,
+    ) -> Any:
+        raise NotImplementedError
+
+    @classmethod
+    def parse_prefix(
+        cls,
+        data: Buffer,
+        endianness: Endianness = Endianness.LITTLE,
+        offset: int = 0,
+        validate: bool = False,
+    ) -> Tuple[Self, int]:
+        raise NotImplementedError
+
+    @classmethod
+    def iter_parse(
+        cls,
+        data: Buffer,
+        endianness: Endianness = Endianness.LITTLE,
+        validate: bool = False,
+    ) -> Iterator[Self]:
+        raise NotImplementedError
+
+    @classmethod
+    def parse_many(
+        cls,
+        data: Buffer,
+        endianness: Endianness = Endianness.LITTLE,
+        validate: bool = False,
+    ) -> List[Self]:
+        raise NotImplementedError
+
+    @classmethod
+    async def aparse(
+        cls,
+        reader: asyncio.StreamReader,
+        endianness: Endianness = Endianness.LITTLE,
+        validate: bool = False,
+    ) -> Self:
+        raise NotImplementedError
+
+    @classmethod
+    def astream(
+        cls,
+        reader: asyncio.StreamReader,
+        endianness: Endianness = Endianness.LITTLE,
+        validate: bool = False,
+    ) -> AsyncIterator[Self]:
+        raise NotImplementedError
+
+    async def awrite(
+        self,
+        writer: asyncio.StreamWriter,
+        endianness: Endianness = Endianness.LITTLE,
+        drain: bool = True,
+    ) -> None:
+        raise NotImplementedError
+
+    @classmethod
+    async def awrite_many(
+        cls,
+        writer: asyncio.StreamWriter,
+        records: Iterable[Self],
+        endianness: Endianness = Endianness.LITTLE,
+    ) -> None:
+        raise NotImplementedError
+
+    @classmethod
+    def parse_from(
+        cls,
+        fp: BinaryFile,
+        endianness: Endianness = Endianness.LITTLE,
+        validate: bool = False,
     ) -> Self:
         raise NotImplementedError
 
+    @classmethod
+    def iter_from(
+        cls,
+        fp: BinaryFile,
+        endianness: Endianness = Endianness.LITTLE,
+        validate: bool = False,
+    ) -> Iterator[Self]:
+        raise NotImplementedError
+
+    def dump_to(
+        self, fp: BinaryFile, endianness: Endianness = Endianness.LITTLE
+    ) -> int:
+        raise NotImplementedError
+
     @classmethod
     def parse_bits(
-        cls, buffer: BitBuffer, endianness: Endianness, strict: bool = False
+        cls,
+        buffer: BitReader,
+        endianness: Endianness,
+        strict: bool = False,
+        validate: bool = False,
+    ) -> Self:
+        raise NotImplementedError
+
+    @classmethod
+    def decode_from(
+        cls, data: Buffer, bit_offset: int, endianness: Endianness
+    ) -> Tuple[Self, int]:
+        raise NotImplementedError
+
+    def pack_into(
+        self,
+        buffer: WritableBuffer,
+        offset: int = 0,
+        endianness: Endianness = Endianness.LITTLE,
+    ) -> None:
+        raise NotImplementedError
+
+    @classmethod
+    def unpack_from(
+        cls,
+        buffer: Buffer,
+        offset: int = 0,
+        endianness: Endianness = Endianness.LITTLE,
+        validate: bool = False,
     ) -> Self:
         raise NotImplementedError
 
     def validate(self) -> None:
         raise NotImplementedError
 
+    @classmethod
+    def bit_size(cls) -> Optional[int]:
+        raise NotImplementedError
+
+    @classmethod
+    def size(cls) -> int:
+        raise NotImplementedError
+
+    def dumped_bit_size(self) -> int:
+        raise NotImplementedError
+
+    def dumped_size(self) -> int:
+        raise NotImplementedError
+
+    @classmethod
+    def field_offsets(cls) -> Dict[str, int]:
+        raise NotImplementedError
+
+    @classmethod
+    def numpy_dtype(cls, endianness: Endianness = Endianness.LITTLE) -> Any:
+        raise NotImplementedError
+
+    @classmethod
+    def to_numpy(
+        cls, buffer: Buffer, endianness: Endianness = Endianness.LITTLE
+    ) -> Any:
+        raise NotImplementedError
+
+    @classmethod
+    def from_numpy(
+        cls, array: Any, endianness: Endianness = Endianness.LITTLE
+    ) -> bytes:
+        raise NotImplementedError
+
     def __len__(self) -> int:
         raise NotImplementedError
 
@@ -0,0 +1,1016 @@
+"""
+Generation of the specialized `decode_from` / `encode_into` of every structure.
+
+The generated functions are straight-line Python: every field of the fixed-size
+prefix (the fields up to the first variable-size one, with nested fixed-size
+structures expanded in place) is read or written at its statically known offset,
+and every codec, class and helper the body needs is bound as a closure variable.
+The source of each function is kept in its `__bytex_source__` attribute.
+"""
+
+import itertools
+import linecache
+import struct
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
+
+from bytex.bits.utils import ensure_available, read_int
+from bytex.codecs import (
+    BaseCodec,
+    BaseListCodec,
+    CharCodec,
+    ExactBytesCodec,
+    ExactStringCodec,
+    FixedBytesCodec,
+    FixedStringCodec,
+    FlagCodec,
+    IntegerCodec,
+    StructureCodec,
+)
+from bytex.codecs.basic.char_codec import encode_chars
+from bytex.codecs.byte_view import is_view_codec
+from bytex.codecs.integer_array import is_array_codec
+from bytex.endianness import Endianness
+from bytex.errors import InsufficientSpaceError
+from bytex.field import Field, SlotField, ValidatedList
+from bytex.sign import Sign
+from bytex.structure.types import Fields
+
+FIELDS_KEY: str = "__bytex_fields__"
+SOURCE_KEY: str = "__bytex_source__"
+
+BYTEORDERS: Dict[Endianness, str] = {
+    Endianness.BIG: "big",
+    Endianness.LITTLE: "little",
+}
+
+STRUCT_BYTEORDERS: Dict[Endianness, str] = {
+    Endianness.BIG: ">",
+    Endianness.LITTLE: "<",
+}
+
+STRUCT_INTEGER_FORMATS: Dict[int, str] = {8: "B", 16: "H", 32: "I", 64: "Q"}
+
+# Codecs whose wire format the generated code reproduces inline. Subclasses, and
+# codecs returning views, keep going through their (possibly overridden) methods.
+INLINED_CODECS: Tuple[type, ...] = (
+    IntegerCodec,
+    FlagCodec,
+    CharCodec,
+    ExactBytesCodec,
+    FixedBytesCodec,
+    ExactStringCodec,
+    FixedStringCodec,
+)
+
+_generated_counter = itertools.count()
+
+
+def _is_inlined(codec: BaseCodec) -> bool:
+    """
+    Whether the generated code reproduces `codec`'s wire format inline.
+    """
+    return type(codec) in INLINED_CODECS and not is_view_codec(codec)
+
+
+@dataclass
+class Leaf:
+    """
+    A field of the fixed-size prefix that is read and written by its own codec.
+
+    `value` is the expression that evaluates to the field's value while encoding and
+    `variable` is the local that holds it while decoding.
+    """
+
+    codec: BaseCodec
+    bit_offset: int
+    bit_size: int
+    value: str
+    variable: str
+
+
+@dataclass
+class Build:
+    """
+    A nested fixed-size structure of the prefix, expanded into its fields.
+    """
+
+    structure_class: type
+    value: str
+    variable: str
+    instance: str
+    arguments: Dict[str, str] = field(default_factory=dict)
+
+
+@dataclass
+class Prefix:
+    """
+    The flattened fixed-size prefix of a structure.
+
+    `builds` are ordered parents first, `fields` are the top level field names the
+    prefix covers and `items` are the leaves with their bit-packed runs grouped.
+    """
+
+    leaves: List[Leaf] = field(default_factory=list)
+    items: List[Union[Leaf, "BitGroup"]] = field(default_factory=list)
+    builds: List[Build] = field(default_factory=list)
+    fields: Dict[str, str] = field(default_factory=dict)
+    bit_size: int = 0
+
+
+@dataclass
+class BitGroup:
+    """
+    A run of consecutive bit-packed leaves that covers whole bytes, read and written
+    as a single integer.
+    """
+
+    leaves: List[Leaf]
+    variable: str
+
+    @property
+    def bit_offset(self) -> int:
+        return self.leaves[0].bit_offset
+
+    @property
+    def bit_size(self) -> int:
+        last = self.leaves[-1]
+        return last.bit_offset + last.bit_size - self.bit_offset
+
+    def shift(self, leaf: Leaf) -> int:
+        return self.bit_offset + self.bit_size - leaf.bit_offset - leaf.bit_size
+
+
+class Namespace:
+    """
+    Hands out the names of a generated function's locals and closure variables.
+    """
+
+    def __init__(self, **closure: Any) -> None:
+        self.closure: Dict[str, Any] = dict(closure)
+        self._counters: Dict[str, Iterator[int]] = {}
+
+    def local(self, prefix: str) -> str:
+        counter = self._counters.setdefault(prefix, itertools.count())
+        return f"{prefix}{next(counter)}"
+
+    def bind(self, prefix: str, value: Any) -> str:
+        for name, bound in self.closure.items():
+            if bound is value and name.startswith(prefix):
+                return name
+
+        name = self.local(prefix)
+        self.closure[name] = value
+        return name
+
+
+class Source:
+    def __init__(self) -> None:
+        self.lines: List[str] = []
+        self._indentation = 0
+
+    def line(self, text: str) -> None:
+        self.lines.append("    " * self._indentation + text)
+
+    def block(self, header: str) -> "Source":
+        self.line(header)
+        self._indentation += 1
+        return self
+
+    def __enter__(self) -> "Source":
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        self._indentation -= 1
+
+    def __str__(self) -> str:
+        return "\n".join(self.lines) + "\n"
+
+
+def get_fields(structure_class: type) -> Fields:
+    return structure_class.__dict__[FIELDS_KEY]
+
+
+def is_slotted(fields: Fields) -> bool:
+    return any(
+        isinstance(structure_field, SlotField) for structure_field in fields.values()
+    )
+
+
+def storage(instance: str, fields: Fields) -> str:
+    """
+    The expression whose `field_value`s are the field values of the structure
+    `instance` - its `__dict__`, or the instance itself when it uses slots.
+    """
+    return instance if is_slotted(fields) else f"{instance}.__dict__"
+
+
+def field_value(instance_storage: str, structure_field: Field) -> str:
+    if isinstance(structure_field, SlotField):
+        return f"{instance_storage}.{structure_field.slot}"
+
+    return f"{instance_storage}[{structure_field.name!r}]"
+
+
+def flatten_prefix(fields: Fields, namespace: Namespace) -> Prefix:
+    """
+    Flattens the fixed-size prefix of a structure whose field values are the items
+    of the dict named `_d0`.
+    """
+    prefix = Prefix()
+    instance = namespace.local("_d")
+
+    for name, structure_field in fields.items():
+        if structure_field.codec.get_fixed_bit_size() is None:
+            break
+
+        prefix.fields[name] = _flatten(
+            structure_field.codec,
+            field_value(instance, structure_field),
+            prefix,
+            namespace,
+        )
+
+    prefix.items = group_bit_fields(prefix.leaves, namespace)
+    return prefix
+
+
+def _flatten(codec: BaseCodec, value: str, prefix: Prefix, namespace: Namespace) -> str:
+    variable = namespace.local("_v")
+
+    if type(codec) is not StructureCodec:
+        bit_size = codec.get_fixed_bit_size()
+        assert bit_size is not None
+
+        prefix.leaves.append(
+            Leaf(
+                codec=codec,
+                bit_offset=prefix.bit_size,
+                bit_size=bit_size,
+                value=value,
+                variable=variable,
+            )
+        )
+        prefix.bit_size += bit_size
+        return variable
+
+    build = Build(
+        structure_class=codec.structure_class,
+        value=value,
+        variable=variable,
+        instance=namespace.local("_d"),
+    )
+    prefix.builds.append(build)
+
+    for name, structure_field in get_fields(codec.structure_class).items():
+        build.arguments[name] = _flatten(
+            structure_field.codec,
+            field_value(build.instance, structure_field),
+            prefix,
+            namespace,
+        )
+
+    return variable
+
+
+def group_bit_fields(
+    leaves: List[Leaf], namespace: Namespace
+) -> List[Union[Leaf, BitGroup]]:
+    """
+    Collects every maximal run of consecutive bit-packed leaves that starts and ends
+    on a byte boundary into a `BitGroup`. Leaves outside such runs are kept as is.
+    """
+    items: List[Union[Leaf, BitGroup]] = []
+    run: List[Leaf] = []
+
+    for leaf in leaves:
+        if _is_bit_packed(leaf) and (run or leaf.bit_offset % 8 == 0):
+            run.append(leaf)
+            continue
+
+        items.extend(_close_run(run, namespace))
+        run = []
+        items.append(leaf)
+
+    items.extend(_close_run(run, namespace))
+    return items
+
+
+def _close_run(run: List[Leaf], namespace: Namespace) -> List[Union[Leaf, BitGroup]]:
+    for index in reversed(range(len(run))):
+        if (run[index].bit_offset + run[index].bit_size) % 8 == 0:
+            group = BitGroup(leaves=run[: index + 1], variable=namespace.local("_g"))
+            return [group, *run[index + 1 :]]
+
+    return list(run)
+
+
+def _is_bit_packed(leaf: Leaf) -> bool:
+    """
+    Whether the leaf is an integer-like field that does not occupy whole, aligned
+    bytes of its own.
+    """
+    codec = leaf.codec
+    if not _is_inlined(codec):
+        return False
+
+    aligned = leaf.bit_offset % 8 == 0 and leaf.bit_size % 8 == 0
+    if isinstance(codec, FlagCodec):
+        return True
+    if isinstance(codec, (IntegerCodec, CharCodec)):
+        return not aligned
+
+    return False
+
+
+def compile_function(name: str, source: Source, closure: Dict[str, Any]) -> Callable:
+    """
+    Compiles the function `name` defined by `source` as a closure over `closure`.
+
+    The source is registered with `linecache` so tracebacks, debuggers and profilers
+    can show the generated lines.
+    """
+    factory = Source()
+    with factory.block(f"def __create_{name}__({', '.join(closure)}):"):
+        factory.lines.extend(f"    {line}" for line in source.lines)
+        factory.line(f"return {name}")
+
+    text = str(factory)
+    filename = f"<bytex generated {name} #{next(_generated_counter)}>"
+    linecache.cache[filename] = (len(text), None, text.splitlines(True), filename)
+
+    scope: Dict[str, Any] = {}
+    exec(compile(text, filename, "exec"), scope)  # noqa: S102
+
+    function = scope[f"__create_{name}__"](**closure)
+    function.__bytex_source__ = str(source)
+
+    return function
+
+
+def emit_construct(
+    source: Source,
+    target: str,
+    structure_class: str,
+    fields: Fields,
+    arguments: Dict[str, str],
+    namespace: Namespace,
+) -> None:
+    """
+    Emits the construction of a structure from freshly decoded values.
+
+    Decoded values are valid by construction, so the instance is created without
+    going through `__init__` and the fields' validation; lists are wrapped in a
+    `ValidatedList` the way `Field.__set__` would, integer arrays are kept as is.
+    """
+    values = {}
+    for name, variable in arguments.items():
+        codec = fields[name].codec
+        if isinstance(codec, BaseListCodec) and not is_array_codec(codec):
+            inner_codec = namespace.bind("_i", codec.get_inner_codec())
+            variable = f"_ValidatedList({inner_codec}, {variable})"
+        values[name] = variable
+
+    source.line(f"{target} = _new({structure_class})")
+
+    if is_slotted(fields):
+        for name, variable in values.items():
+            source.line(f"{field_value(target, fields[name])} = {variable}")
+    else:
+        items = ", ".join(f"{name!r}: {variable}" for name, variable in values.items())
+        source.line(f"{target}.__dict__ = {{{items}}}")
+
+
+def generate_decode_from(fields: Fields) -> Callable:
+    namespace = Namespace(
+        _LITTLE=Endianness.LITTLE,
+        _from_bytes=int.from_bytes,
+        _read_int=read_int,
+        _ensure_available=ensure_available,
+        _chr=chr,
+        _bytes=bytes,
+        _new=object.__new__,
+        _ValidatedList=ValidatedList,
+    )
+    prefix = flatten_prefix(fields, namespace)
+    structs = bind_structs(fields, prefix, namespace)
+    codecs = {
+        name: namespace.bind("_c", structure_field.codec)
+        for name, structure_field in fields.items()
+    }
+    variables = {
+        name: prefix.fields.get(name) or namespace.local("_v") for name in fields
+    }
+
+    source = Source()
+    with source.block("def decode_from(cls, data, bit_offset, endianness):"):
+        if not prefix.leaves:
+            _emit_decode_fields(
+                source, list(fields), fields, codecs, variables, namespace
+            )
+        else:
+            with source.block("if bit_offset & 7:"):
+                _emit_decode_fields(
+                    source, list(fields), fields, codecs, variables, namespace
+                )
+
+            for endianness, header in (
+                (Endianness.LITTLE, "elif endianness is _LITTLE:"),
+                (Endianness.BIG, "else:"),
+            ):
+                with source.block(header):
+                    _emit_decode_prefix(
+                        source, prefix, endianness, namespace, structs.get(endianness)
+                    )
+                    _emit_decode_fields(
+                        source,
+                        [name for name in fields if name not in prefix.fields],
+                        fields,
+                        codecs,
+                        variables,
+                        namespace,
+                    )
+
+    return compile_function("decode_from", source, namespace.closure)
+
+
+def _emit_decode_fields(
+    source: Source,
+    names: List[str],
+    fields: Fields,
+    codecs: Dict[str, str],
+    variables: Dict[str, str],
+    namespace: Namespace,
+) -> None:
+    for name in names:
+        source.line(
+            f"{variables[name]}, bit_offset = "
+            f"{codecs[name]}.decode_from(data, bit_offset, endianness)"
+        )
+
+    emit_construct(source, "_o", "cls", fields, variables, namespace)
+    source.line("return _o, bit_offset")
+
+
+def _emit_decode_prefix(
+    source: Source,
+    prefix: Prefix,
+    endianness: Endianness,
+    namespace: Namespace,
+    struct_name: Optional[str],
+) -> None:
+    source.line("_start = bit_offset >> 3")
+    with source.block(f"if (len(data) << 3) - bit_offset < {prefix.bit_size}:"):
+        source.line(f"_ensure_available(data, bit_offset, {prefix.bit_size})")
+
+    if struct_name is None:
+        for item in prefix.items:
+            if isinstance(item, BitGroup):
+                _emit_decode_group(source, item, endianness, namespace)
+            else:
+                expression = _decode_leaf(item, endianness, namespace)
+                source.line(f"{item.variable} = {expression}")
+                _emit_check_decoded(source, item, namespace)
+    else:
+        variables = ", ".join(leaf.variable for leaf in prefix.leaves)
+        source.line(f"{variables}, = {struct_name}.unpack_from(data, _start)")
+        for leaf in prefix.leaves:
+            if isinstance(leaf.codec, CharCodec):
+                source.line(f"{leaf.variable} = _chr({leaf.variable})")
+            elif isinstance(leaf.codec, (ExactStringCodec, FixedStringCodec)):
+                source.line(f"{leaf.variable} = {leaf.variable}.decode()")
+                _emit_check_decoded(source, leaf, namespace)
+
+    for build in reversed(prefix.builds):
+        emit_construct(
+            source,
+            build.variable,
+            namespace.bind("_S", build.structure_class),
+            get_fields(build.structure_class),
+            build.arguments,
+            namespace,
+        )
+
+    source.line(f"bit_offset += {prefix.bit_size}")
+
+
+def _byte_index(byte_offset: int) -> str:
+    return f"_start + {byte_offset}" if byte_offset else "_start"
+
+
+def _byte_slice(bit_offset: int, bit_size: int) -> str:
+    start = bit_offset >> 3
+    return f"data[{_byte_index(start)} : _start + {start + (bit_size >> 3)}]"
+
+
+def _emit_decode_group(
+    source: Source, group: BitGroup, endianness: Endianness, namespace: Namespace
+) -> None:
+    if group.bit_size == 8:
+        source.line(f"{group.variable} = data[{_byte_index(group.bit_offset >> 3)}]")
+    else:
+        byte_slice = _byte_slice(group.bit_offset, group.bit_size)
+        source.line(f"{group.variable} = _from_bytes({byte_slice}, 'big')")
+
+    for leaf in group.leaves:
+        wire = group.variable
+        shift = group.shift(leaf)
+        if shift:
+            wire = f"({wire} >> {shift})"
+        if leaf.bit_offset != group.bit_offset:
+            wire = f"{wire} & {(1 << leaf.bit_size) - 1:#x}"
+
+        expression = _from_wire(leaf, wire, endianness, namespace)
+        source.line(f"{leaf.variable} = {expression}")
+
+
+def _from_wire(
+    leaf: Leaf, wire: str, endianness: Endianness, namespace: Namespace
+) -> str:
+    """
+    Converts the unsigned wire integer of a bit-packed leaf to its value.
+    """
+    codec = leaf.codec
+
+    if isinstance(codec, FlagCodec):
+        return f"{wire} == 1"
+    if isinstance(codec, CharCodec):
+        return f"_chr({wire})"
+    if isinstance(codec, IntegerCodec) and (
+        codec.sign == Sign.SIGNED
+        or (endianness == Endianness.LITTLE and leaf.bit_size > 8)
+    ):
+        return f"{namespace.bind('_c', codec)}.from_wire({wire}, endianness)"
+
+    return wire
+
+
+def _to_wire(leaf: Leaf, endianness: Endianness, namespace: Namespace) -> str:
+    """
+    The inverse of `_from_wire`.
+    """
+    codec = leaf.codec
+
+    if isinstance(codec, CharCodec):
+        return f"_ord({leaf.value})"
+    if isinstance(codec, IntegerCodec) and (
+        codec.sign == Sign.SIGNED
+        or (endianness == Endianness.LITTLE and leaf.bit_size > 8)
+    ):
+        return f"{namespace.bind('_c', codec)}.to_wire({leaf.value}, endianness)"
+
+    return leaf.value
+
+
+def _decode_leaf(leaf: Leaf, endianness: Endianness, namespace: Namespace) -> str:
+    codec = leaf.codec
+    offset, size = leaf.bit_offset, leaf.bit_size
+    aligned = offset % 8 == 0
+    inlined = _is_inlined(codec)
+
+    if inlined and isinstance(codec, IntegerCodec) and aligned and size % 8 == 0:
+        if size == 8 and codec.sign == Sign.UNSIGNED:
+            return f"data[{_byte_index(offset >> 3)}]"
+
+        signed = ", signed=True" if codec.sign == Sign.SIGNED else ""
+        byteorder = BYTEORDERS[endianness]
+        return f"_from_bytes({_byte_slice(offset, size)}, {byteorder!r}{signed})"
+
+    if _is_bit_packed(leaf):
+        return _from_wire(leaf, _read_bits(offset, size), endianness, namespace)
+
+    if inlined and aligned and isinstance(codec, (ExactBytesCodec, FixedBytesCodec)):
+        return f"_bytes({_byte_slice(offset, size)})"
+
+    if inlined and aligned and isinstance(codec, (ExactStringCodec, FixedStringCodec)):
+        return f"_bytes({_byte_slice(offset, size)}).decode()"
+
+    return (
+        f"{namespace.bind('_c', codec)}"
+        f".decode_from(data, bit_offset + {offset}, endianness)[0]"
+    )
+
+
+def _emit_check_decoded(source: Source, leaf: Leaf, namespace: Namespace) -> None:
+    """
+    Emits the length check of an inlined exact string, see
+    `ExactStringCodec.check_decoded`.
+    """
+    codec = leaf.codec
+    if isinstance(codec, ExactStringCodec) and _is_inlined(codec):
+        with source.block(f"if len({leaf.variable}) != {codec.length}:"):
+            source.line(f"{namespace.bind('_c', codec)}.validate({leaf.variable})")
+
+
+def _read_bits(bit_offset: int, bit_size: int) -> str:
+    """
+    An expression reading `bit_size` bits at `bit_offset` (relative to `_start`) as
+    an unsigned integer, MSB first.
+    """
+    first, last = bit_offset >> 3, (bit_offset + bit_size - 1) >> 3
+
+    if first != last:
+        return f"_read_int(data, bit_offset + {bit_offset}, {bit_size})"
+
+    byte = f"data[{_byte_index(first)}]"
+    shift = 8 - (bit_offset & 7) - bit_size
+    if shift:
+        byte = f"({byte} >> {shift})"
+    if bit_size == 8:
+        return byte
+    return f"{byte} & {(1 << bit_size) - 1:#x}"
+
+
+def generate_decode_fields(
+    fields: Fields, names: List[str], complete: bool
+) -> Callable:
+    """
+    Generates `decode_fields(data, bit_offset, endianness)`, which decodes only the
+    fields `names` into a tuple, in declaration order, and skips over the others.
+
+    Fields after the last requested one are skipped over as well when `complete` is
+    set, otherwise they are not looked at.
+    """
+    namespace = Namespace(
+        _LITTLE=Endianness.LITTLE,
+        _from_bytes=int.from_bytes,
+        _read_int=read_int,
+        _ensure_available=ensure_available,
+        _chr=chr,
+        _bytes=bytes,
+        _new=object.__new__,
+        _ValidatedList=ValidatedList,
+    )
+    order = list(fields)
+    last = max((order.index(name) for name in names), default=-1)
+    covered = order if complete else order[: last + 1]
+
+    prefix = Prefix()
+    spans: Dict[str, Tuple[List[Leaf], List[Build]]] = {}
+    instance = namespace.local("_d")
+
+    for name in covered:
+        structure_field = fields[name]
+        if structure_field.codec.get_fixed_bit_size() is None:
+            break
+
+        leaves, builds = len(prefix.leaves), len(prefix.builds)
+        prefix.fields[name] = _flatten(
+            structure_field.codec,
+            field_value(instance, structure_field),
+            prefix,
+            namespace,
+        )
+        spans[name] = (prefix.leaves[leaves:], prefix.builds[builds:])
+
+    codecs = {name: namespace.bind("_c", fields[name].codec) for name in covered}
+    variables = {
+        name: prefix.fields.get(name) or namespace.local("_v") for name in covered
+    }
+
+    source = Source()
+    with source.block("def decode_fields(data, bit_offset, endianness):"):
+        if not prefix.leaves:
+            _emit_decode_or_skip(source, covered, names, codecs, variables)
+        else:
+            with source.block("if bit_offset & 7:"):
+                _emit_decode_or_skip(source, covered, names, codecs, variables)
+
+            rest = [name for name in covered if name not in prefix.fields]
+            for endianness, header in (
+                (Endianness.LITTLE, "elif endianness is _LITTLE:"),
+                (Endianness.BIG, "else:"),
+            ):
+                with source.block(header):
+                    _emit_decode_spans(
+                        source, prefix, spans, names, endianness, namespace
+                    )
+                    _emit_decode_or_skip(source, rest, names, codecs, variables)
+
+    return compile_function("decode_fields", source, namespace.closure)
+
+
+def _emit_decode_or_skip(
+    source: Source,
+    covered: List[str],
+    names: List[str],
+    codecs: Dict[str, str],
+    variables: Dict[str, str],
+) -> None:
+    for name in covered:
+        if name in names:
+            source.line(
+                f"{variables[name]}, bit_offset = "
+                f"{codecs[name]}.decode_from(data, bit_offset, endianness)"
+            )
+        else:
+            source.line(
+                f"bit_offset = {codecs[name]}.skip_from(data, bit_offset, endianness)"
+            )
+
+    values = ", ".join(variables[name] for name in names)
+    if len(names) == 1:
+        values += ","
+    source.line(f"return ({values}), bit_offset")
+
+
+def _emit_decode_spans(
+    source: Source,
+    prefix: Prefix,
+    spans: Dict[str, Tuple[List[Leaf], List[Build]]],
+    names: List[str],
+    endianness: Endianness,
+    namespace: Namespace,
+) -> None:
+    """
+    Emits the decoding of the requested fields of the fixed-size prefix, each read at
+    its own offset, leaving the others untouched.
+    """
+    source.line("_start = bit_offset >> 3")
+    with source.block(f"if (len(data) << 3) - bit_offset < {prefix.bit_size}:"):
+        source.line(f"_ensure_available(data, bit_offset, {prefix.bit_size})")
+
+    for name, (leaves, builds) in spans.items():
+        if name not in names:
+            continue
+
+        for leaf in leaves:
+            expression = _decode_leaf(leaf, endianness, namespace)
+            source.line(f"{leaf.variable} = {expression}")
+            _emit_check_decoded(source, leaf, namespace)
+
+        for build in reversed(builds):
+            emit_construct(
+                source,
+                build.variable,
+                namespace.bind("_S", build.structure_class),
+                get_fields(build.structure_class),
+                build.arguments,
+                namespace,
+            )
+
+    source.line(f"bit_offset += {prefix.bit_size}")
+
+
+def generate_encode_into(fields: Fields) -> Callable:
+    namespace = Namespace(
+        _LITTLE=Endianness.LITTLE,
+        _ord=ord,
+        _encode_chars=encode_chars,
+    )
+    prefix = flatten_prefix(fields, namespace)
+    structs = bind_structs(fields, prefix, namespace)
+    codecs = {
+        name: namespace.bind("_c", structure_field.codec)
+        for name, structure_field in fields.items()
+    }
+    remaining = [name for name in fields if name not in prefix.fields]
+
+    source = Source()
+    with source.block("def encode_into(self, writer, endianness):"):
+        _emit_fetch(source, fields, prefix)
+
+        if structs:
+            arguments = _struct_arguments(prefix)
+            for endianness, header in (
+                (Endianness.LITTLE, "if endianness is _LITTLE:"),
+                (Endianness.BIG, "else:"),
+            ):
+                with source.block(header):
+                    source.line(
+                        f"writer.write_bytes({structs[endianness]}.pack({arguments}))"
+                    )
+        elif prefix.leaves:
+            for endianness, header in (
+                (Endianness.LITTLE, "if endianness is _LITTLE:"),
+                (Endianness.BIG, "else:"),
+            ):
+                with source.block(header):
+                    _emit_encode_prefix(source, prefix, endianness, namespace)
+
+        for name in remaining:
+            source.line(
+                f"{codecs[name]}.encode_into("
+                f"{field_value('_d0', fields[name])}, writer, endianness)"
+            )
+
+    return compile_function("encode_into", source, namespace.closure)
+
+
+def generate_dump(fields: Fields) -> Optional[Callable]:
+    """
+    Generates a `dump` that packs the whole structure with a single `struct.Struct`,
+    or returns `None` if the structure cannot be described by one.
+    """
+    namespace = Namespace(
+        _LITTLE=Endianness.LITTLE,
+        _ord=ord,
+        _encode_chars=encode_chars,
+    )
+    prefix = flatten_prefix(fields, namespace)
+    structs = bind_structs(fields, prefix, namespace)
+    if not structs:
+        return None
+
+    arguments = _struct_arguments(prefix)
+
+    source = Source()
+    with source.block("def dump(self, endianness=_LITTLE):"):
+        _emit_fetch(source, fields, prefix)
+        with source.block("if endianness is _LITTLE:"):
+            source.line(f"return {structs[Endianness.LITTLE]}.pack({arguments})")
+        source.line(f"return {structs[Endianness.BIG]}.pack({arguments})")
+
+    return compile_function("dump", source, namespace.closure)
+
+
+def generate_pack_into(fields: Fields) -> Optional[Callable]:
+    """
+    Generates a `pack_into` that writes the whole structure into a buffer with a
+    single `struct.Struct.pack_into`, or returns `None` if the structure cannot be
+    described by one.
+    """
+    namespace = Namespace(
+        _LITTLE=Endianness.LITTLE,
+        _ord=ord,
+        _encode_chars=encode_chars,
+        _InsufficientSpaceError=InsufficientSpaceError,
+    )
+    prefix = flatten_prefix(fields, namespace)
+    structs = bind_structs(fields, prefix, namespace)
+    if not structs:
+        return None
+
+    arguments = _struct_arguments(prefix)
+    size = prefix.bit_size >> 3
+
+    source = Source()
+    with source.block("def pack_into(self, buffer, offset=0, endianness=_LITTLE):"):
+        with source.block(f"if not 0 <= offset <= len(buffer) - {size}:"):
+            source.line(
+                "raise _InsufficientSpaceError("
+                f"f'Cannot pack {size} bytes at offset {{offset}} "
+                "into a buffer of {len(buffer)} bytes')"
+            )
+        _emit_fetch(source, fields, prefix)
+        with source.block("if endianness is _LITTLE:"):
+            source.line(
+                f"{structs[Endianness.LITTLE]}.pack_into(buffer, offset, {arguments})"
+            )
+        with source.block("else:"):
+            source.line(
+                f"{structs[Endianness.BIG]}.pack_into(buffer, offset, {arguments})"
+            )
+
+    return compile_function("pack_into", source, namespace.closure)
+
+
+def _emit_fetch(source: Source, fields: Fields, prefix: Prefix) -> None:
+    """
+    Binds `_d0` to the `storage` of the structure and the `_d` of every inlined
+    nested structure to its own.
+    """
+    source.line(f"_d0 = {storage('self', fields)}")
+    for build in prefix.builds:
+        build_storage = storage(build.value, get_fields(build.structure_class))
+        source.line(f"{build.instance} = {build_storage}")
+
+
+def struct_format(fields: Fields, prefix: Prefix) -> Optional[str]:
+    """
+    Returns the `struct` format (without a byte order character) of a structure whose
+    fields all map one-to-one onto `struct` items, or `None`.
+    """
+    if len(prefix.fields) != len(fields) or not prefix.leaves:
+        return None
+
+    items = []
+    for leaf in prefix.leaves:
+        codec = leaf.codec
+
+        if not _is_inlined(codec):
+            return None
+
+        if isinstance(codec, IntegerCodec):
+            item = STRUCT_INTEGER_FORMATS.get(codec.bit_count)
+            if item is None:
+                return None
+            items.append(item.lower() if codec.sign == Sign.SIGNED else item)
+        elif isinstance(codec, CharCodec):
+            items.append("B")
+        elif isinstance(
+            codec,
+            (ExactBytesCodec, FixedBytesCodec, ExactStringCodec, FixedStringCodec),
+        ):
+            items.append(f"{codec.length}s")
+        else:
+            return None
+
+    return "".join(items)
+
+
+def bind_structs(
+    fields: Fields, prefix: Prefix, namespace: Namespace
+) -> Dict[Endianness, str]:
+    """
+    Binds a `struct.Struct` per endianness for a structure that has a `struct_format`
+    and returns their names, or returns an empty dict.
+    """
+    items = struct_format(fields, prefix)
+    if items is None:
+        return {}
+
+    return {
+        endianness: namespace.bind("_s", struct.Struct(byteorder + items))
+        for endianness, byteorder in STRUCT_BYTEORDERS.items()
+    }
+
+
+def _struct_arguments(prefix: Prefix) -> str:
+    arguments = []
+    for leaf in prefix.leaves:
+        if isinstance(leaf.codec, CharCodec):
+            arguments.append(f"_ord({leaf.value})")
+        elif isinstance(leaf.codec, (ExactStringCodec, FixedStringCodec)):
+            arguments.append(f"_encode_chars({leaf.value})")
+        else:
+            arguments.append(leaf.value)
+
+    return ", ".join(arguments)
+
+
+def _emit_encode_prefix(
+    source: Source, prefix: Prefix, endianness: Endianness, namespace: Namespace
+) -> None:
+    chunks = [
+        (
+            _encode_group(item, endianness, namespace)
+            if isinstance(item, BitGroup)
+            else _encode_leaf(item, endianness, namespace)
+        )
+        for item in prefix.items
+    ]
+
+    for kind, group in itertools.groupby(chunks, key=lambda chunk: chunk[0]):
+        items = [chunk[1:] for chunk in group]
+
+        if kind == "bytes":
+            expressions = [expression for expression, in items]
+            if len(expressions) == 1:
+                source.line(f"writer.write_bytes({expressions[0]})")
+            else:
+                source.line(
+                    f"writer.write_bytes(b''.join(({', '.join(expressions)},)))"
+                )
+        elif kind == "int":
+            for expression, bit_size in items:
+                source.line(f"writer.write_int({expression}, {bit_size})")
+        else:
+            for (statement,) in items:
+                source.line(statement)
+
+
+def _encode_group(
+    group: BitGroup, endianness: Endianness, namespace: Namespace
+) -> Tuple[Any, ...]:
+    terms = []
+    for leaf in group.leaves:
+        wire = _to_wire(leaf, endianness, namespace)
+        shift = group.shift(leaf)
+        terms.append(f"({wire} << {shift})" if shift else wire)
+
+    return ("bytes", f"({' | '.join(terms)}).to_bytes({group.bit_size >> 3}, 'big')")
+
+
+def _encode_leaf(
+    leaf: Leaf, endianness: Endianness, namespace: Namespace
+) -> Tuple[Any, ...]:
+    """
+    Returns how a leaf is written: `("bytes", expression)`, `("int", expression,
+    bit_size)` for an unsigned integer in wire order, or `("statement", statement)`.
+    """
+    codec, value, size = leaf.codec, leaf.value, leaf.bit_size
+
+    if not _is_inlined(codec):
+        codec_name = namespace.bind("_c", codec)
+        return ("statement", f"{codec_name}.encode_into({value}, writer, endianness)")
+
+    if isinstance(codec, IntegerCodec) and size % 8 == 0:
+        signed = ", signed=True" if codec.sign == Sign.SIGNED else ""
+        byteorder = BYTEORDERS[endianness]
+        return ("bytes", f"{value}.to_bytes({size >> 3}, {byteorder!r}{signed})")
+
+    if isinstance(codec, (IntegerCodec, FlagCodec, CharCodec)):
+        return ("int", _to_wire(leaf, endianness, namespace), size)
+
+    if isinstance(codec, ExactBytesCodec):
+        return ("bytes", value)
+
+    if isinstance(codec, FixedBytesCodec):
+        return ("bytes", f"{value}.ljust({codec.length}, b'\\x00')")
+
+    if isinstance(codec, ExactStringCodec):
+        return ("bytes", f"_encode_chars({value})")
+
+    assert isinstance(codec, FixedStringCodec)
+    return ("bytes", f"_encode_chars({value}).ljust({codec.length}, b'\\x00')")
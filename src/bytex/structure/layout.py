@@ -0,0 +1,35 @@
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+from bytex.structure.types import Fields
+
+
+@dataclass(frozen=True)
+class Layout:
+    """
+    The statically known part of a structure's wire layout.
+
+    `offsets` maps every field whose bit offset does not depend on the values of the
+    fields before it (i.e. every field up to and including the first variable-size
+    one) to that offset. `bit_size` is the total size in bits, or `None` if the
+    structure has a variable-size field.
+    """
+
+    offsets: Dict[str, int]
+    bit_size: Optional[int]
+
+
+def _create_layout(fields: Fields) -> Layout:
+    offsets: Dict[str, int] = {}
+    bit_offset = 0
+
+    for name, field in fields.items():
+        offsets[name] = bit_offset
+
+        bit_size = field.codec.get_fixed_bit_size()
+        if bit_size is None:
+            return Layout(offsets=offsets, bit_size=None)
+
+        bit_offset += bit_size
+
+    return Layout(offsets=offsets, bit_size=bit_offset)
@@ -1,17 +1,76 @@
+from bytex.structure.methods.async_stream import (
+    _create_aparse,
+    _create_astream,
+    _create_awrite,
+    _create_awrite_many,
+)
+from bytex.structure.methods.decode_from import _create_decode_from
 from bytex.structure.methods.dump import _create_dump
 from bytex.structure.methods.dump_bits import _create_dump_bits
+from bytex.structure.methods.dump_many import _create_dump_into, _create_dump_many
+from bytex.structure.methods.encode_into import _create_encode_into
+from bytex.structure.methods.file_io import (
+    _create_dump_to,
+    _create_iter_from,
+    _create_parse_from,
+)
 from bytex.structure.methods.init import _create_init
+from bytex.structure.methods.pack_into import _create_pack_into
 from bytex.structure.methods.parse import _create_parse
 from bytex.structure.methods.parse_bits import _create_parse_bits
+from bytex.structure.methods.parse_many import (
+    _create_iter_parse,
+    _create_parse_many,
+    _create_parse_prefix,
+)
 from bytex.structure.methods.repr import _create_repr
+from bytex.structure.methods.size import (
+    _create_bit_size,
+    _create_dumped_bit_size,
+    _create_dumped_size,
+    _create_field_offsets,
+    _create_len,
+    _create_size,
+)
+from bytex.structure.methods.to_numpy import (
+    _create_from_numpy,
+    _create_numpy_dtype,
+    _create_to_numpy,
+)
+from bytex.structure.methods.unpack_from import _create_unpack_from
 from bytex.structure.methods.validate import _create_validate
 
 __all__ = [
     "_create_init",
     "_create_repr",
+    "_create_decode_from",
     "_create_dump",
     "_create_dump_bits",
+    "_create_dump_into",
+    "_create_dump_many",
+    "_create_encode_into",
     "_create_parse",
     "_create_parse_bits",
+    "_create_parse_prefix",
+    "_create_iter_parse",
+    "_create_parse_many",
+    "_create_aparse",
+    "_create_astream",
+    "_create_awrite",
+    "_create_awrite_many",
+    "_create_parse_from",
+    "_create_iter_from",
+    "_create_dump_to",
+    "_create_pack_into",
+    "_create_unpack_from",
     "_create_validate",
+    "_create_bit_size",
+    "_create_size",
+    "_create_dumped_bit_size",
+    "_create_dumped_size",
+    "_create_field_offsets",
+    "_create_len",
+    "_create_numpy_dtype",
+    "_create_to_numpy",
+    "_create_from_numpy",
 ]
@@ -0,0 +1,99 @@
+import asyncio
+from typing import AsyncIterator, Callable, Coroutine, Iterable
+
+from bytex.endianness import Endianness
+from bytex.errors import InsufficientDataError
+from bytex.stream.async_io import iter_records, read_record
+from bytex.structure.types import Fields
+
+
+def _create_aparse(
+    fields: Fields,
+) -> Callable[
+    [object, asyncio.StreamReader, Endianness, bool], Coroutine[None, None, object]
+]:
+    @classmethod  # type: ignore[misc]
+    async def aparse(
+        cls,
+        reader: asyncio.StreamReader,
+        endianness: Endianness = Endianness.LITTLE,
+        validate: bool = False,
+    ) -> object:
+        """
+        Reads a single record from `reader`, reading only the bytes it takes up.
+        Raises `InsufficientDataError` if the stream ends first.
+        """
+        structure = await read_record(cls, reader, endianness, validate)
+        if structure is None:
+            raise InsufficientDataError(
+                f"The stream ended before a '{cls.__name__}' record"
+            )
+
+        return structure
+
+    return aparse
+
+
+def _create_astream(
+    fields: Fields,
+) -> Callable[[object, asyncio.StreamReader, Endianness, bool], AsyncIterator[object]]:
+    @classmethod  # type: ignore[misc]
+    def astream(
+        cls,
+        reader: asyncio.StreamReader,
+        endianness: Endianness = Endianness.LITTLE,
+        validate: bool = False,
+    ) -> AsyncIterator[object]:
+        """
+        Asynchronously iterates over the back to back records read from `reader`
+        until the stream ends.
+        """
+        return iter_records(cls, reader, endianness, validate)
+
+    return astream
+
+
+def _create_awrite(
+    fields: Fields,
+) -> Callable[
+    [object, asyncio.StreamWriter, Endianness, bool], Coroutine[None, None, None]
+]:
+    async def awrite(
+        self,
+        writer: asyncio.StreamWriter,
+        endianness: Endianness = Endianness.LITTLE,
+        drain: bool = True,
+    ) -> None:
+        """
+        Writes the structure to `writer`. Pass `drain=False` to write several
+        records before a single `writer.drain()`.
+        """
+        writer.write(self.dump(endianness=endianness))
+
+        if drain:
+            await writer.drain()
+
+    return awrite
+
+
+def _create_awrite_many(
+    fields: Fields,
+) -> Callable[
+    [object, asyncio.StreamWriter, Iterable[object], Endianness],
+    Coroutine[None, None, None],
+]:
+    @classmethod  # type: ignore[misc]
+    async def awrite_many(
+        cls,
+        writer: asyncio.StreamWriter,
+        records: Iterable[object],
+        endianness: Endianness = Endianness.LITTLE,
+    ) -> None:
+        """
+        Writes `records` to `writer` back to back, in a single write followed by a
+        single `writer.drain()`.
+        """
+        writer.write(cls.dump_many(records, endianness=endianness))
+        await writer.drain()
+
+    return awrite_many
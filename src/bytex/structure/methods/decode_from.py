@@ -0,0 +1,12 @@
+from typing import Callable, Tuple
+
+from bytex.bits import Buffer
+from bytex.endianness import Endianness
+from bytex.structure.codegen import generate_decode_from
+from bytex.structure.types import Fields
+
+
+def _create_decode_from(
+    fields: Fields,
+) -> Callable[[object, Buffer, int, Endianness], Tuple[object, int]]:
+    return classmethod(generate_decode_from(fields))  # type: ignore[return-value]
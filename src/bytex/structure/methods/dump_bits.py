@@ -1,18 +1,15 @@
 from typing import Callable
 
-from bytex.bits import BitBuffer, Bits
+from bytex.bits import Bits, BitWriter
 from bytex.endianness import Endianness
 from bytex.structure.types import Fields
 
 
 def _create_dump_bits(fields: Fields) -> Callable[[object, Endianness], Bits]:
     def dump_bits(self, endianness: Endianness) -> Bits:
-        buffer = BitBuffer()
+        writer = BitWriter()
+        self.encode_into(writer, endianness=endianness)
 
-        for name, field in fields.items():
-            value = getattr(self, name)
-            buffer.write(field.codec.serialize(value, endianness=endianness))
-
-        return buffer.to_bits()
+        return writer.to_bits()
 
     return dump_bits
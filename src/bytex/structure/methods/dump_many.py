@@ -0,0 +1,61 @@
+from typing import Callable, Iterable
+
+from bytex.bits import BitWriter, WritableBuffer
+from bytex.endianness import Endianness
+from bytex.errors import AlignmentError
+from bytex.structure.types import Fields
+
+
+def _create_dump_into(
+    fields: Fields,
+) -> Callable[[object, WritableBuffer, int, Endianness], int]:
+    def dump_into(
+        self,
+        buffer: WritableBuffer,
+        offset: int = 0,
+        endianness: Endianness = Endianness.LITTLE,
+    ) -> int:
+        """
+        Serializes the structure straight into `buffer` starting `offset` bytes in,
+        and returns the offset right after it. The buffer is never resized, raises
+        `InsufficientSpaceError` if the structure does not fit.
+        """
+        writer = BitWriter(buffer, offset)
+        self.encode_into(writer, endianness=endianness)
+
+        if not writer.is_aligned():
+            raise AlignmentError(
+                "Cannot dump a structure whose bit size is not a multiple of 8"
+            )
+
+        return writer.position
+
+    return dump_into
+
+
+def _create_dump_many(
+    fields: Fields,
+) -> Callable[[object, Iterable[object], Endianness], bytes]:
+    @classmethod  # type: ignore[misc]
+    def dump_many(
+        cls,
+        records: Iterable[object],
+        endianness: Endianness = Endianness.LITTLE,
+    ) -> bytes:
+        """
+        Serializes `records` back to back into a single buffer, the inverse of
+        `parse_many`.
+        """
+        writer = BitWriter()
+
+        for record in records:
+            record.encode_into(writer, endianness=endianness)  # type: ignore[attr-defined]
+
+            if not writer.is_aligned():
+                raise AlignmentError(
+                    "Cannot dump a structure whose bit size is not a multiple of 8"
+                )
+
+        return writer.to_bytes()
+
+    return dump_many
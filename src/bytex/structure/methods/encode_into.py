@@ -0,0 +1,12 @@
+from typing import Callable
+
+from bytex.bits import BitWriter
+from bytex.endianness import Endianness
+from bytex.structure.codegen import generate_encode_into
+from bytex.structure.types import Fields
+
+
+def _create_encode_into(
+    fields: Fields,
+) -> Callable[[object, BitWriter, Endianness], None]:
+    return generate_encode_into(fields)
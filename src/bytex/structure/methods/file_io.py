@@ -0,0 +1,67 @@
+from typing import Callable, Iterator
+
+from bytex.endianness import Endianness
+from bytex.errors import InsufficientDataError
+from bytex.bits import BinaryFile
+from bytex.stream.file_io import iter_records, read_record, write_record
+from bytex.stream.measure import is_delimited
+from bytex.structure.types import Fields
+
+
+def _create_parse_from(
+    fields: Fields,
+) -> Callable[[object, BinaryFile, Endianness, bool], object]:
+    @classmethod  # type: ignore[misc]
+    def parse_from(
+        cls,
+        fp: BinaryFile,
+        endianness: Endianness = Endianness.LITTLE,
+        validate: bool = False,
+    ) -> object:
+        """
+        Reads a single record from the binary file `fp`, reading only the bytes it
+        takes up. Raises `InsufficientDataError` if the file ends first.
+        """
+        structure = read_record(
+            cls, fp, bytearray(), endianness, validate, is_delimited(cls)
+        )
+        if structure is None:
+            raise InsufficientDataError(
+                f"The file ended before a '{cls.__name__}' record"
+            )
+
+        return structure
+
+    return parse_from
+
+
+def _create_iter_from(
+    fields: Fields,
+) -> Callable[[object, BinaryFile, Endianness, bool], Iterator[object]]:
+    @classmethod  # type: ignore[misc]
+    def iter_from(
+        cls,
+        fp: BinaryFile,
+        endianness: Endianness = Endianness.LITTLE,
+        validate: bool = False,
+    ) -> Iterator[object]:
+        """
+        Lazily reads the back to back records of the binary file `fp` until it ends,
+        reusing a single read buffer for all of them.
+        """
+        return iter_records(cls, fp, endianness, validate)
+
+    return iter_from
+
+
+def _create_dump_to(fields: Fields) -> Callable[[object, BinaryFile, Endianness], int]:
+    def dump_to(
+        self, fp: BinaryFile, endianness: Endianness = Endianness.LITTLE
+    ) -> int:
+        """
+        Writes the structure to the binary file `fp` straight from the buffer it is
+        encoded into, and returns the number of bytes written.
+        """
+        return write_record(self, fp, endianness)
+
+    return dump_to
@@ -0,0 +1,33 @@
+from typing import Callable
+
+from bytex.bits import WritableBuffer
+from bytex.endianness import Endianness
+from bytex.errors import InsufficientSpaceError
+from bytex.structure.codegen import generate_pack_into
+from bytex.structure.types import Fields
+
+
+def _create_pack_into(
+    fields: Fields,
+) -> Callable[[object, WritableBuffer, int, Endianness], None]:
+    generated = generate_pack_into(fields)
+    if generated is not None:
+        return generated
+
+    def pack_into(
+        self,
+        buffer: WritableBuffer,
+        offset: int = 0,
+        endianness: Endianness = Endianness.LITTLE,
+    ) -> None:
+        data = self.dump(endianness=endianness)
+
+        if not 0 <= offset <= len(buffer) - len(data):
+            raise InsufficientSpaceError(
+                f"Cannot pack {len(data)} bytes at offset {offset} "
+                f"into a buffer of {len(buffer)} bytes"
+            )
+
+        buffer[offset : offset + len(data)] = data
+
+    return pack_into
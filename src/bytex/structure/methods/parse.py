@@ -1,30 +1,47 @@
-from typing import Callable
+from typing import Callable, Dict, FrozenSet, Iterable, Optional, Tuple
 
-from bytex.bits import BitBuffer
+from bytex.bits.utils import as_byte_view
 from bytex.endianness import Endianness
 from bytex.errors import ParsingError
+from bytex.structure.projection import Projection, create_projection
 from bytex.structure.types import Fields
 
 
 def _create_parse(
     fields: Fields,
-) -> Callable[[object, bytes, Endianness, bool], object]:
+) -> Callable[[object, bytes, Endianness, bool, bool, Optional[Iterable[str]]], object]:
+    projections: Dict[Tuple[FrozenSet[str], bool], Projection] = {}
+
     @classmethod  # type: ignore[misc]
     def parse(
         cls,
         data: bytes,
         endianness: Endianness = Endianness.LITTLE,
         strict: bool = False,
+        validate: bool = False,
+        fields: Optional[Iterable[str]] = None,
     ) -> object:
-        buffer = BitBuffer.from_bytes(data)
-        values = {}
+        view = as_byte_view(data)
+
+        if fields is None:
+            structure, bit_offset = cls.decode_from(view, 0, endianness)
+        else:
+            key = (frozenset(fields), strict)
+            if key not in projections:
+                projections[key] = create_projection(
+                    cls.__name__, cls.__bytex_fields__, *key
+                )
+            structure, bit_offset = projections[key].decode_from(
+                view, 0, endianness, validate
+            )
 
-        for name, field in fields.items():
-            values[name] = field.codec.deserialize(buffer, endianness=endianness)
+        remaining = 8 * len(view) - bit_offset
+        if strict and remaining:
+            raise ParsingError(f"Unexpected trailing data: {remaining} bits left")
 
-        if strict and len(buffer):
-            raise ParsingError(f"Unexpected trailing data: {len(buffer)} bits left")
+        if validate and fields is None:
+            structure.validate()
 
-        return cls(**values)
+        return structure
 
     return parse
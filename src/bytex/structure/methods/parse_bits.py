@@ -1,6 +1,6 @@
-from typing import Callable
+from typing import Callable, Optional
 
-from bytex.bits import BitBuffer
+from bytex.bits import BitReader, Buffer
 from bytex.endianness import Endianness
 from bytex.errors import ParsingError, StructureError
 from bytex.structure.types import Fields
@@ -8,27 +8,51 @@ from bytex.structure.types import Fields
 
 def _create_parse_bits(
     fields: Fields,
-) -> Callable[[object, BitBuffer, Endianness, bool], object]:
+) -> Callable[[object, BitReader, Endianness, bool, bool], object]:
     @classmethod  # type: ignore[misc]
     def parse_bits(
         cls,
-        buffer: BitBuffer,
+        buffer: BitReader,
         endianness: Endianness,
         strict: bool = False,
+        validate: bool = False,
     ) -> object:
-        values = {}
+        data = buffer.data
+        if buffer.end < 8 * len(data):
+            data = data[: (buffer.end + 7) >> 3]
 
-        for name, field in fields.items():
-            try:
-                values[name] = field.codec.deserialize(buffer, endianness=endianness)
-            except StructureError as e:
-                raise ParsingError(
-                    f"Insufficient data while parsing field '{name}'"
-                ) from e
+        try:
+            structure, bit_offset = cls.decode_from(data, buffer.offset, endianness)
+        except StructureError as e:
+            name = _failing_field(fields, data, buffer.offset, endianness)
+            raise ParsingError(
+                f"Insufficient data while parsing field '{name}'"
+                if name is not None
+                else f"Insufficient data while parsing '{cls.__name__}'"
+            ) from e
+
+        buffer.skip(bit_offset - buffer.offset)
 
         if strict and len(buffer):
             raise ParsingError(f"Unexpected trailing data: {len(buffer)} bits left")
 
-        return cls(**values)
+        if validate:
+            structure.validate()
+
+        return structure
 
     return parse_bits
+
+
+def _failing_field(
+    fields: Fields, data: Buffer, bit_offset: int, endianness: Endianness
+) -> Optional[str]:
+    # The generated `decode_from` decodes several fields at once, so the field that
+    # failed is found by decoding them again one at a time, once decoding failed.
+    for name, field in fields.items():
+        try:
+            _, bit_offset = field.codec.decode_from(data, bit_offset, endianness)
+        except StructureError:
+            return name
+
+    return None
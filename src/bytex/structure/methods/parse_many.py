@@ -0,0 +1,84 @@
+from typing import Callable, Iterator, List, Tuple
+
+from bytex.bits import Buffer
+from bytex.bits.utils import as_byte_view
+from bytex.endianness import Endianness
+from bytex.errors import ParsingError
+from bytex.structure.types import Fields
+
+
+def _create_parse_prefix(
+    fields: Fields,
+) -> Callable[[object, Buffer, Endianness, int, bool], Tuple[object, int]]:
+    @classmethod  # type: ignore[misc]
+    def parse_prefix(
+        cls,
+        data: Buffer,
+        endianness: Endianness = Endianness.LITTLE,
+        offset: int = 0,
+        validate: bool = False,
+    ) -> Tuple[object, int]:
+        """
+        Parses a single record starting `offset` bytes into `data` and returns it
+        along with the number of bytes it takes up.
+        """
+        structure, bit_offset = cls.decode_from(
+            as_byte_view(data), 8 * offset, endianness
+        )
+
+        if validate:
+            structure.validate()
+
+        return structure, ((bit_offset + 7) >> 3) - offset
+
+    return parse_prefix
+
+
+def _create_iter_parse(
+    fields: Fields,
+) -> Callable[[object, Buffer, Endianness, bool], Iterator[object]]:
+    @classmethod  # type: ignore[misc]
+    def iter_parse(
+        cls,
+        data: Buffer,
+        endianness: Endianness = Endianness.LITTLE,
+        validate: bool = False,
+    ) -> Iterator[object]:
+        """
+        Lazily parses the back-to-back records `data` consists of. Every record starts
+        on a byte boundary.
+        """
+        view = as_byte_view(data)
+        end = 8 * len(view)
+        bit_offset = 0
+
+        while bit_offset < end:
+            structure, record_end = cls.decode_from(view, bit_offset, endianness)
+
+            if record_end == bit_offset:
+                raise ParsingError(
+                    f"Cannot iterate over '{cls.__name__}' records, they take up no data"
+                )
+
+            if validate:
+                structure.validate()
+
+            yield structure
+            bit_offset = (record_end + 7) & ~7
+
+    return iter_parse
+
+
+def _create_parse_many(
+    fields: Fields,
+) -> Callable[[object, Buffer, Endianness, bool], List[object]]:
+    @classmethod  # type: ignore[misc]
+    def parse_many(
+        cls,
+        data: Buffer,
+        endianness: Endianness = Endianness.LITTLE,
+        validate: bool = False,
+    ) -> List[object]:
+        return list(cls.iter_parse(data, endianness=endianness, validate=validate))
+
+    return parse_many
@@ -0,0 +1,87 @@
+from typing import Callable, Dict, Optional
+
+from bytex.errors import AlignmentError, StructureError
+from bytex.structure.layout import _create_layout
+from bytex.structure.types import Fields
+
+
+def _create_bit_size(fields: Fields) -> Callable[[object], Optional[int]]:
+    layout = _create_layout(fields)
+
+    @classmethod  # type: ignore[misc]
+    def bit_size(cls) -> Optional[int]:
+        return layout.bit_size
+
+    return bit_size
+
+
+def _create_size(fields: Fields) -> Callable[[object], int]:
+    layout = _create_layout(fields)
+
+    @classmethod  # type: ignore[misc]
+    def size(cls) -> int:
+        if layout.bit_size is None:
+            raise StructureError(
+                f"'{cls.__name__}' has a variable size, only fixed-size structures have a `size()`"
+            )
+
+        if layout.bit_size % 8 != 0:
+            raise AlignmentError(
+                f"'{cls.__name__}' is {layout.bit_size} bits long, which is not a whole number of bytes"
+            )
+
+        return layout.bit_size // 8
+
+    return size
+
+
+def _create_dumped_bit_size(fields: Fields) -> Callable[[object], int]:
+    layout = _create_layout(fields)
+
+    def dumped_bit_size(self) -> int:
+        """
+        Returns the number of bits `dump` would produce, without serializing.
+        """
+        if layout.bit_size is not None:
+            return layout.bit_size
+
+        return sum(
+            field.codec.get_bit_size(getattr(self, name))
+            for name, field in fields.items()
+        )
+
+    return dumped_bit_size
+
+
+def _create_dumped_size(fields: Fields) -> Callable[[object], int]:
+    def dumped_size(self) -> int:
+        """
+        Returns the number of bytes `dump` would produce, without serializing.
+        """
+        bit_size = self.dumped_bit_size()
+
+        if bit_size % 8 != 0:
+            raise AlignmentError(
+                f"This '{type(self).__name__}' is {bit_size} bits long, which is not a whole number of bytes"
+            )
+
+        return bit_size // 8
+
+    return dumped_size
+
+
+def _create_field_offsets(fields: Fields) -> Callable[[object], Dict[str, int]]:
+    layout = _create_layout(fields)
+
+    @classmethod  # type: ignore[misc]
+    def field_offsets(cls) -> Dict[str, int]:
+        return dict(layout.offsets)
+
+    return field_offsets
+
+
+def _create_len(fields: Fields) -> Callable[[object], int]:
+    def __len__(self) -> int:
+        return self.size()
+
+    return __len__
@@ -0,0 +1,49 @@
+from typing import Any, Callable
+
+from bytex.bits import Buffer
+from bytex.endianness import Endianness
+from bytex.structure import numpy_layout
+from bytex.structure.types import Fields
+
+
+def _create_numpy_dtype(fields: Fields) -> Callable[[object, Endianness], Any]:
+    @classmethod  # type: ignore[misc]
+    def numpy_dtype(cls, endianness: Endianness = Endianness.LITTLE) -> Any:
+        """
+        Returns the NumPy structured dtype of the structure's records. Sub-byte
+        fields are unpacked into fields of their own. Requires NumPy.
+        """
+        return numpy_layout.get_numpy_layout(cls, endianness).dtype
+
+    return numpy_dtype
+
+
+def _create_to_numpy(fields: Fields) -> Callable[[object, Buffer, Endianness], Any]:
+    @classmethod  # type: ignore[misc]
+    def to_numpy(
+        cls, buffer: Buffer, endianness: Endianness = Endianness.LITTLE
+    ) -> Any:
+        """
+        Decodes a buffer of back to back records into a NumPy array of
+        `numpy_dtype(endianness)`. When the structure has no sub-byte fields the
+        array is a view over `buffer`. Requires NumPy.
+        """
+        layout = numpy_layout.get_numpy_layout(cls, endianness)
+        return numpy_layout.to_numpy(layout, buffer, endianness)
+
+    return to_numpy
+
+
+def _create_from_numpy(fields: Fields) -> Callable[[object, Any, Endianness], bytes]:
+    @classmethod  # type: ignore[misc]
+    def from_numpy(
+        cls, array: Any, endianness: Endianness = Endianness.LITTLE
+    ) -> bytes:
+        """
+        Encodes a NumPy array of `numpy_dtype(endianness)` back into records, the
+        inverse of `to_numpy`. Requires NumPy.
+        """
+        layout = numpy_layout.get_numpy_layout(cls, endianness)
+        return numpy_layout.from_numpy(layout, array, endianness)
+
+    return from_numpy
@@ -0,0 +1,27 @@
+from typing import Callable
+
+from bytex.bits import Buffer
+from bytex.bits.utils import as_byte_view
+from bytex.endianness import Endianness
+from bytex.structure.types import Fields
+
+
+def _create_unpack_from(
+    fields: Fields,
+) -> Callable[[object, Buffer, int, Endianness, bool], object]:
+    @classmethod  # type: ignore[misc]
+    def unpack_from(
+        cls,
+        buffer: Buffer,
+        offset: int = 0,
+        endianness: Endianness = Endianness.LITTLE,
+        validate: bool = False,
+    ) -> object:
+        structure, _ = cls.decode_from(as_byte_view(buffer), 8 * offset, endianness)
+
+        if validate:
+            structure.validate()
+
+        return structure
+
+    return unpack_from
@@ -0,0 +1,343 @@
+import importlib
+from dataclasses import dataclass
+from typing import Any, Dict, List, Tuple, Type
+
+from bytex.codecs import (
+    BaseCodec,
+    CharCodec,
+    EnumCodec,
+    ExactBytesCodec,
+    ExactListCodec,
+    ExactStringCodec,
+    FixedBytesCodec,
+    FixedIntegersCodec,
+    FixedStringCodec,
+    FlagCodec,
+    IntegerCodec,
+    StructureCodec,
+)
+from bytex.endianness import Endianness
+from bytex.errors import StructureError
+from bytex.sign import Sign
+from bytex.structure._structure import _Structure
+
+INTEGER_WIDTHS = (8, 16, 32, 64)
+BYTES_CODECS = (ExactBytesCodec, FixedBytesCodec, ExactStringCodec, FixedStringCodec)
+
+_layouts: Dict[Tuple[type, Endianness], "NumpyLayout"] = {}
+
+
+def import_numpy() -> Any:
+    try:
+        return importlib.import_module("numpy")
+    except ImportError as e:
+        raise ImportError(
+            "NumPy support requires NumPy, install it with `pip install bytex[numpy]`"
+        ) from e
+
+
+@dataclass(frozen=True)
+class BitMember:
+    """
+    A field packed into a `BitGroup`, `shift` is the distance of its least
+    significant bit from the group's least significant bit.
+    """
+
+    name: str
+    codec: BaseCodec
+    shift: int
+
+
+@dataclass(frozen=True)
+class BitGroup:
+    """
+    A run of sub-byte fields that together fill `byte_count` whole bytes, stored on
+    the wire as a single `byte_count` bytes wide field named `name`.
+    """
+
+    name: str
+    byte_count: int
+    members: List[BitMember]
+
+
+@dataclass(frozen=True)
+class NumpyLayout:
+    """
+    How a structure maps to NumPy.
+
+    `wire` is the structured dtype describing the records' bytes exactly, `dtype`
+    is the one handed to users, in which every bit group is unpacked into its
+    fields. `plain` fields are the same in both, `nested` fields hold the layouts
+    of nested structures.
+    """
+
+    wire: Any
+    dtype: Any
+    plain: List[str]
+    nested: List[Tuple[str, "NumpyLayout"]]
+    groups: List[BitGroup]
+
+    @property
+    def is_packed(self) -> bool:
+        return not self.groups and all(layout.is_packed for _, layout in self.nested)
+
+
+def get_numpy_layout(
+    structure_class: Type[_Structure], endianness: Endianness
+) -> NumpyLayout:
+    key = (structure_class, endianness)
+    if key not in _layouts:
+        _layouts[key] = _create_numpy_layout(structure_class, endianness)
+
+    return _layouts[key]
+
+
+def _create_numpy_layout(
+    structure_class: Type[_Structure], endianness: Endianness
+) -> NumpyLayout:
+    np = import_numpy()
+    byteorder = "<" if endianness == Endianness.LITTLE else ">"
+
+    wire: List[Tuple[Any, ...]] = []
+    dtype: List[Tuple[Any, ...]] = []
+    plain: List[str] = []
+    nested: List[Tuple[str, NumpyLayout]] = []
+    groups: List[BitGroup] = []
+    run: List[Tuple[str, BaseCodec, int]] = []
+
+    offsets = structure_class.field_offsets()
+    if structure_class.size() == 0:
+        raise StructureError(f"'{structure_class.__name__}' takes up no data")
+
+    for name, field in structure_class.__bytex_fields__.items():
+        codec = _unwrap(field.codec)
+        bit_offset = offsets[name]
+        bit_size = codec.get_fixed_bit_size()
+        assert bit_size is not None
+
+        if run or bit_offset % 8 != 0 or bit_size % 8 != 0:
+            if not isinstance(codec, (FlagCodec, IntegerCodec)):
+                raise StructureError(
+                    f"'{structure_class.__name__}.{name}' is not byte aligned, only "
+                    "flags and integers can be packed into bits in a NumPy dtype"
+                )
+
+            run.append((name, codec, bit_offset))
+            end = bit_offset + bit_size
+            if end % 8 == 0:
+                group = _create_group(run, end, len(groups))
+                wire.append((group.name, "u1", (group.byte_count,)))
+                dtype.extend(
+                    (member.name, _unpacked_dtype(member.codec))
+                    for member in group.members
+                )
+                groups.append(group)
+                run = []
+            continue
+
+        if isinstance(codec, StructureCodec):
+            layout = get_numpy_layout(codec.structure_class, endianness)
+            wire.append((name, layout.wire))
+            dtype.append((name, layout.dtype))
+            nested.append((name, layout))
+            continue
+
+        wire.append((name, *_plain_dtype(structure_class, name, codec, byteorder)))
+        dtype.append(wire[-1])
+        plain.append(name)
+
+    return NumpyLayout(
+        wire=np.dtype(wire),
+        dtype=np.dtype(dtype),
+        plain=plain,
+        nested=nested,
+        groups=groups,
+    )
+
+
+def to_numpy(layout: NumpyLayout, data: Any, endianness: Endianness) -> Any:
+    np = import_numpy()
+    records = np.frombuffer(data, dtype=layout.wire)
+    if layout.is_packed:
+        return records
+
+    result = np.empty(len(records), dtype=layout.dtype)
+    _unpack(np, layout, records, result, endianness)
+
+    return result
+
+
+def from_numpy(layout: NumpyLayout, array: Any, endianness: Endianness) -> bytes:
+    np = import_numpy()
+    array = np.asarray(array)
+    if layout.is_packed:
+        return np.ascontiguousarray(array, dtype=layout.wire).tobytes()
+
+    records = np.empty(len(array), dtype=layout.wire)
+    _pack(np, layout, array, records, endianness)
+
+    return records.tobytes()
+
+
+def _unpack(
+    np: Any, layout: NumpyLayout, records: Any, result: Any, endianness: Endianness
+) -> None:
+    for name in layout.plain:
+        result[name] = records[name]
+
+    for name, nested in layout.nested:
+        _unpack(np, nested, records[name], result[name], endianness)
+
+    for group in layout.groups:
+        data = records[group.name]
+        bits = np.zeros(len(records), dtype=np.uint64)
+        for index in range(group.byte_count):
+            bits = (bits << np.uint64(8)) | data[:, index].astype(np.uint64)
+
+        for member in group.members:
+            wire = (bits >> np.uint64(member.shift)) & _mask(np, member.codec)
+            result[member.name] = _from_wire(np, member.codec, wire, endianness)
+
+
+def _pack(
+    np: Any, layout: NumpyLayout, array: Any, records: Any, endianness: Endianness
+) -> None:
+    for name in layout.plain:
+        records[name] = array[name]
+
+    for name, nested in layout.nested:
+        _pack(np, nested, array[name], records[name], endianness)
+
+    for group in layout.groups:
+        bits = np.zeros(len(array), dtype=np.uint64)
+        for member in group.members:
+            wire = _to_wire(np, member.codec, array[member.name], endianness)
+            bits |= (wire & _mask(np, member.codec)) << np.uint64(member.shift)
+
+        data = records[group.name]
+        for index in reversed(range(group.byte_count)):
+            data[:, index] = bits & np.uint64(0xFF)
+            bits = bits >> np.uint64(8)
+
+
+def _from_wire(np: Any, codec: BaseCodec, wire: Any, endianness: Endianness) -> Any:
+    """
+    A vectorized `IntegerCodec.from_wire`.
+    """
+    if isinstance(codec, FlagCodec):
+        return wire.astype(np.bool_)
+
+    assert isinstance(codec, IntegerCodec)
+    value = wire
+
+    if endianness == Endianness.LITTLE and codec.bit_count > 8:
+        remainder = codec.bit_count % 8
+        byte_count = codec.bit_count >> 3
+        low = _byteswap(np, wire >> np.uint64(remainder), byte_count)
+        high = wire & np.uint64((1 << remainder) - 1)
+        value = (high << np.uint64(8 * byte_count)) | low
+
+    if codec.sign == Sign.SIGNED:
+        value = value.astype(np.int64)
+        sign = (value >> (codec.bit_count - 1)) & 1
+        value = value - (sign << codec.bit_count)
+
+    return value
+
+
+def _to_wire(np: Any, codec: BaseCodec, value: Any, endianness: Endianness) -> Any:
+    """
+    A vectorized `IntegerCodec.to_wire`.
+    """
+    wire = np.asarray(value).astype(np.int64).astype(np.uint64) & _mask(np, codec)
+
+    if (
+        isinstance(codec, IntegerCodec)
+        and endianness == Endianness.LITTLE
+        and codec.bit_count > 8
+    ):
+        remainder = codec.bit_count % 8
+        byte_count = codec.bit_count >> 3
+        low = wire & np.uint64((1 << (8 * byte_count)) - 1)
+        swapped = _byteswap(np, low, byte_count)
+        wire = (swapped << np.uint64(remainder)) | (wire >> np.uint64(8 * byte_count))
+
+    return wire
+
+
+def _byteswap(np: Any, value: Any, byte_count: int) -> Any:
+    result = np.zeros_like(value)
+    for index in range(byte_count):
+        byte = (value >> np.uint64(8 * index)) & np.uint64(0xFF)
+        result |= byte << np.uint64(8 * (byte_count - 1 - index))
+
+    return result
+
+
+def _mask(np: Any, codec: BaseCodec) -> Any:
+    bit_size = codec.get_fixed_bit_size()
+    assert bit_size is not None
+
+    return np.uint64((1 << bit_size) - 1)
+
+
+def _create_group(
+    run: List[Tuple[str, BaseCodec, int]], end: int, index: int
+) -> BitGroup:
+    start = run[0][2] - run[0][2] % 8
+    if end - start > 64:
+        raise StructureError(
+            f"The bit fields starting at '{run[0][0]}' span more than 64 bits"
+        )
+
+    members = []
+    for name, codec, bit_offset in run:
+        bit_size = codec.get_fixed_bit_size()
+        assert bit_size is not None
+        members.append(BitMember(name, codec, end - bit_offset - bit_size))
+
+    return BitGroup(
+        name=f"_bits{index}", byte_count=(end - start) >> 3, members=members
+    )
+
+
+def _unwrap(codec: BaseCodec) -> BaseCodec:
+    if isinstance(codec, EnumCodec):
+        return codec.item_codec
+
+    return codec
+
+
+def _unpacked_dtype(codec: BaseCodec) -> str:
+    if isinstance(codec, FlagCodec):
+        return "?"
+
+    assert isinstance(codec, IntegerCodec)
+    width = next(width for width in INTEGER_WIDTHS if codec.bit_count <= width)
+    kind = "i" if codec.sign == Sign.SIGNED else "u"
+
+    return f"{kind}{width >> 3}"
+
+
+def _plain_dtype(
+    structure_class: Type[_Structure], name: str, codec: BaseCodec, byteorder: str
+) -> Tuple[Any, ...]:
+    if isinstance(codec, IntegerCodec) and codec.bit_count in INTEGER_WIDTHS:
+        kind = "i" if codec.sign == Sign.SIGNED else "u"
+        return (f"{byteorder}{kind}{codec.bit_count >> 3}",)
+
+    if isinstance(codec, CharCodec):
+        return ("S1",)
+
+    if isinstance(codec, BYTES_CODECS):
+        return (f"S{codec.length}",)
+
+    if isinstance(codec, (ExactListCodec, FixedIntegersCodec)):
+        item_codec = _unwrap(codec.get_inner_codec())
+        item = _plain_dtype(structure_class, name, item_codec, byteorder)
+        if len(item) == 1:
+            return (item[0], (codec.length,))
+
+    raise StructureError(
+        f"'{structure_class.__name__}.{name}' cannot be represented in a NumPy dtype"
+    )
@@ -0,0 +1,56 @@
+from collections import namedtuple
+from dataclasses import dataclass
+from typing import Any, Callable, FrozenSet, List, Tuple
+
+from bytex.bits import Buffer
+from bytex.codecs import BaseCodec
+from bytex.endianness import Endianness
+from bytex.errors import StructureError
+from bytex.structure.codegen import generate_decode_fields
+from bytex.structure.types import Fields
+
+
+@dataclass(frozen=True)
+class Projection:
+    """
+    Decodes only some of a structure's fields into a `record`, a named tuple of the
+    requested fields in declaration order.
+    """
+
+    record: Any
+    codecs: List[BaseCodec]
+    decode_fields: Callable[[Buffer, int, Endianness], Tuple[Tuple[Any, ...], int]]
+
+    def decode_from(
+        self, data: Buffer, bit_offset: int, endianness: Endianness, validate: bool
+    ) -> Tuple[Any, int]:
+        values, bit_offset = self.decode_fields(data, bit_offset, endianness)
+
+        if validate:
+            for codec, value in zip(self.codecs, values):
+                codec.validate(value)
+
+        return self.record._make(values), bit_offset
+
+
+def create_projection(
+    structure_name: str, fields: Fields, names: FrozenSet[str], complete: bool
+) -> Projection:
+    """
+    Creates the projection of the fields `names`. Fields after the last requested one
+    are only skipped over when `complete` is set, so the end of the structure is
+    known.
+    """
+    unknown = names - fields.keys()
+    if unknown:
+        raise StructureError(
+            f"'{structure_name}' has no fields named {', '.join(sorted(unknown))}"
+        )
+
+    ordered = [name for name in fields if name in names]
+
+    return Projection(
+        record=namedtuple(f"{structure_name}Fields", ordered),  # type: ignore[misc]
+        codecs=[fields[name].codec for name in ordered],
+        decode_fields=generate_decode_fields(fields, ordered, complete),
+    )
@@ -3,4 +3,4 @@ from bytex.structure._structure import _Structure
 
 
 class Structure(_Structure, metaclass=StructureMeta):
-    pass
+    __slots__ = ()
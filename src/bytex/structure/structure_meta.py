@@ -25,55 +25,128 @@ from bytex.codecs import (
     TerminatedListCodec,
     TerminatedStringCodec,
 )
+from bytex.codecs.integer_array import get_array_typecode
 from bytex.errors import StructureCreationError, StructureEnumCreationError
-from bytex.field import Field
+from bytex.field import Field, SlotField
 from bytex.length_encodings import BaseLengthEncoding, Exact, Fixed, Prefix, Terminator
 from bytex.structure._structure import _Structure
+from bytex.structure.codegen import FIELDS_KEY, SOURCE_KEY
 from bytex.structure.methods import (
+    _create_aparse,
+    _create_astream,
+    _create_awrite,
+    _create_awrite_many,
+    _create_bit_size,
+    _create_decode_from,
     _create_dump,
     _create_dump_bits,
+    _create_dump_into,
+    _create_dump_many,
+    _create_dump_to,
+    _create_dumped_bit_size,
+    _create_dumped_size,
+    _create_encode_into,
+    _create_field_offsets,
+    _create_from_numpy,
     _create_init,
+    _create_iter_from,
+    _create_iter_parse,
+    _create_len,
+    _create_numpy_dtype,
+    _create_pack_into,
     _create_parse,
     _create_parse_bits,
+    _create_parse_from,
+    _create_parse_many,
+    _create_parse_prefix,
     _create_repr,
+    _create_size,
+    _create_to_numpy,
+    _create_unpack_from,
     _create_validate,
 )
 from bytex.structure.types import Codecs, Fields
 from bytex.structure_enum import STRUCTURE_ENUM_CODEC_KEY, _StructureEnum
 
 ANNOTATIONS_KEY: str = "__annotations__"
+SLOTS_KEY: str = "__slots__"
 METHOD_CREATORS: Dict[str, Callable[[Fields], Callable]] = {
     "__init__": _create_init,
     "dump": _create_dump,
     "dump_bits": _create_dump_bits,
+    "dump_into": _create_dump_into,
+    "dump_many": _create_dump_many,
+    "encode_into": _create_encode_into,
     "parse": _create_parse,
     "parse_bits": _create_parse_bits,
+    "parse_prefix": _create_parse_prefix,
+    "iter_parse": _create_iter_parse,
+    "parse_many": _create_parse_many,
+    "aparse": _create_aparse,
+    "astream": _create_astream,
+    "awrite": _create_awrite,
+    "awrite_many": _create_awrite_many,
+    "parse_from": _create_parse_from,
+    "iter_from": _create_iter_from,
+    "dump_to": _create_dump_to,
+    "decode_from": _create_decode_from,
+    "pack_into": _create_pack_into,
+    "unpack_from": _create_unpack_from,
     "validate": _create_validate,
     "__repr__": _create_repr,
+    "__len__": _create_len,
+    "bit_size": _create_bit_size,
+    "size": _create_size,
+    "dumped_bit_size": _create_dumped_bit_size,
+    "dumped_size": _create_dumped_size,
+    "field_offsets": _create_field_offsets,
+    "numpy_dtype": _create_numpy_dtype,
+    "to_numpy": _create_to_numpy,
+    "from_numpy": _create_from_numpy,
 }
 
 
 class StructureMeta(type):
-    def __new__(mcs, name, bases, namespace):
+    def __new__(mcs, name, bases, namespace, slots: bool = False):
         annotations = namespace.get(ANNOTATIONS_KEY, {})
         codecs = _construct_codecs(annotations)
         _validate_codecs(codecs)
-        fields = _create_fields(namespace=namespace, codecs=codecs)
+        fields = _create_fields(namespace=namespace, codecs=codecs, slots=slots)
 
+        if slots:
+            namespace[SLOTS_KEY] = tuple(
+                field.slot for field in fields.values() if isinstance(field, SlotField)
+            )
+
+        namespace[FIELDS_KEY] = fields
         for method_name, method_creator in METHOD_CREATORS.items():
             namespace[method_name] = method_creator(fields)
+        namespace[SOURCE_KEY] = _collect_sources(namespace)
 
         return super().__new__(mcs, name, bases, namespace)
 
 
-def _create_fields(namespace, codecs: Codecs) -> Fields:
+def _collect_sources(namespace) -> Dict[str, str]:
+    sources = {}
+    for method_name in METHOD_CREATORS:
+        method = getattr(namespace[method_name], "__func__", namespace[method_name])
+        source = getattr(method, SOURCE_KEY, None)
+        if source is not None:
+            sources[method_name] = source
+
+    return sources
+
+
+def _create_fields(namespace, codecs: Codecs, slots: bool) -> Fields:
+    field_class = SlotField if slots else Field
+
     fields = {}
     for name, codec in codecs.items():
         default_value = namespace.get(name, None)
         if default_value is not None:
-            field = Field(codec=codec, name=name, default=default_value)
+            field = field_class(codec=codec, name=name, default=default_value)
         else:
-            field = Field(codec=codec, name=name)
+            field = field_class(codec=codec, name=name)
 
         fields[name] = field
         namespace[name] = field
@@ -143,6 +216,16 @@ def _construct_length_encoded_codec(
             f"Only `Sequence` types can have a length encoding, got: `{str(base_type)}`"
         )
 
+    if getattr(length_encoding, "as_array", False) and not is_list_type(base_type):
+        raise StructureCreationError(
+            f"Only lists of integers can be decoded as arrays, got: `{str(base_type)}`"
+        )
+
+    if getattr(length_encoding, "as_view", False) and base_type is not bytes:
+        raise StructureCreationError(
+            f"Only `bytes` can be decoded as views, got: `{str(base_type)}`"
+        )
+
     if base_type is str:
         return _construct_str_length_encoded_codec(length_encoding)
     elif base_type is bytes:
@@ -177,11 +260,17 @@ def _construct_bytes_length_encoded_codec(
     if isinstance(length_encoding, Terminator):
         return TerminatedBytesCodec(terminator=length_encoding.get_terminator())
     if isinstance(length_encoding, Fixed):
-        return FixedBytesCodec(length=length_encoding.length)
+        return FixedBytesCodec(
+            length=length_encoding.length, as_view=length_encoding.as_view
+        )
     if isinstance(length_encoding, Exact):
-        return ExactBytesCodec(length=length_encoding.length)
+        return ExactBytesCodec(
+            length=length_encoding.length, as_view=length_encoding.as_view
+        )
     if isinstance(length_encoding, Prefix):
-        return PrefixBytesCodec(prefix_codec=length_encoding.codec)
+        return PrefixBytesCodec(
+            prefix_codec=length_encoding.codec, as_view=length_encoding.as_view
+        )
     raise StructureCreationError(
         f"Unsupported length encoding ('{length_encoding.__class__.__name__}') for `bytes`"
     )
@@ -197,6 +286,12 @@ def _construct_list_length_encoded_codec(
         )
 
     item_codec = _resolve_list_item_codec(list_item_type)
+    as_array = getattr(length_encoding, "as_array", False)
+
+    if as_array and get_array_typecode(item_codec) is None:
+        raise StructureCreationError(
+            "Only lists of 8, 16, 32 or 64 bit integers can be decoded as arrays"
+        )
 
     if isinstance(length_encoding, Terminator):
         return TerminatedListCodec(
@@ -204,13 +299,19 @@ def _construct_list_length_encoded_codec(
         )
     if isinstance(length_encoding, Fixed) and isinstance(item_codec, IntegerCodec):
         return FixedIntegersCodec(
-            integer_codec=item_codec, length=length_encoding.length
+            integer_codec=item_codec,
+            length=length_encoding.length,
+            as_array=as_array,
         )
     if isinstance(length_encoding, Exact):
-        return ExactListCodec(item_codec=item_codec, length=length_encoding.length)
+        return ExactListCodec(
+            item_codec=item_codec, length=length_encoding.length, as_array=as_array
+        )
     if isinstance(length_encoding, Prefix):
         return PrefixListCodec(
-            item_codec=item_codec, prefix_codec=length_encoding.codec
+            item_codec=item_codec,
+            prefix_codec=length_encoding.codec,
+            as_array=as_array,
         )
 
     raise StructureCreationError("Unsupported length encoding for `List[...]`.")
@@ -36,5 +36,6 @@ I256 = Annotated[int, IntegerCodec(bit_count=256, sign=Sign.SIGNED)]
 Char = Annotated[str, CharCodec()]
 Flag = Annotated[bool, FlagCodec()]
 Data = Annotated[bytes, DataCodec()]
+DataView = Annotated[memoryview, DataCodec(as_view=True)]
 CStr = Annotated[str, TerminatedStringCodec(terminator=to_bits("\0"))]
 ByteCStr = Annotated[bytes, TerminatedBytesCodec(terminator=to_bits(b"\x00"))]
@@ -0,0 +1,104 @@
+from typing import Annotated
+
+import pytest
+
+from bytex import Endianness, Structure
+from bytex.bits import BitReader
+from bytex.codecs import (
+    BaseCodec,
+    DataCodec,
+    ExactBytesCodec,
+    FixedBytesCodec,
+    IntegerCodec,
+    PrefixBytesCodec,
+)
+from bytex.errors import StructureCreationError, ValidationError
+from bytex.length_encodings import Exact, Fixed, Prefix
+from bytex.sign import Sign
+from bytex.types import U8, U16, DataView
+
+U8_CODEC = IntegerCodec(bit_count=8, sign=Sign.UNSIGNED)
+
+CASES = [
+    (ExactBytesCodec(length=3, as_view=True), b"abc", b"abc"),
+    (FixedBytesCodec(length=4, as_view=True), b"ab", b"ab\x00\x00"),
+    (PrefixBytesCodec(prefix_codec=U8_CODEC, as_view=True), b"abc", b"\x03abc"),
+    (DataCodec(as_view=True), b"abc", b"abc"),
+]
+
+
+@pytest.mark.parametrize("codec, value, encoded", CASES)
+def test_decode_from_returns_view(
+    codec: BaseCodec, value: bytes, encoded: bytes
+) -> None:
+    data = memoryview(b"\xff" + encoded)
+
+    result, end = codec.decode_from(data, 8, Endianness.BIG)
+
+    assert isinstance(result, memoryview)
+    assert result.obj is data.obj
+    assert result == encoded[-len(result) :]
+    assert end == 8 * len(data)
+
+
+@pytest.mark.parametrize("codec, value, encoded", CASES)
+def test_unaligned_view(codec: BaseCodec, value: bytes, encoded: bytes) -> None:
+    data = bytes([0x0F]) + encoded
+    shifted = (int.from_bytes(data, "big") << 4).to_bytes(len(data) + 1, "big")
+    reader = BitReader(shifted, bit_offset=4, bit_count=8 * len(data))
+
+    reader.skip(8)
+    result = codec.deserialize(reader, Endianness.BIG)
+
+    assert isinstance(result, memoryview)
+    assert result == encoded[-len(result) :]
+
+
+@pytest.mark.parametrize("codec, value, encoded", CASES)
+def test_view_validate(codec: BaseCodec, value: bytes, encoded: bytes) -> None:
+    codec.validate(memoryview(value))
+    codec.validate(value)
+
+
+def test_validate_without_view() -> None:
+    with pytest.raises(ValidationError):
+        ExactBytesCodec(length=3).validate(memoryview(b"abc"))
+
+
+def test_data_view_little_endian() -> None:
+    result, _ = DataCodec(as_view=True).decode_from(b"abc", 0, Endianness.LITTLE)
+
+    assert isinstance(result, memoryview)
+    assert result == b"cba"
+
+
+class Packet(Structure):
+    kind: U8
+    name: Annotated[bytes, Exact(2, as_view=True)]
+    tag: Annotated[bytes, Fixed(3, as_view=True)]
+    body: Annotated[bytes, Prefix(U16, as_view=True)]
+    rest: DataView
+
+
+def test_structure_views() -> None:
+    packet = Packet(kind=1, name=b"ab", tag=b"x", body=b"hello", rest=memoryview(b"!"))
+    data = packet.dump(endianness=Endianness.BIG)
+
+    parsed = Packet.parse(data, endianness=Endianness.BIG)
+
+    for value in (parsed.name, parsed.tag, parsed.body, parsed.rest):
+        assert isinstance(value, memoryview)
+        assert value.obj is data
+
+    assert parsed.name == b"ab"
+    assert parsed.tag == b"x\x00\x00"
+    assert parsed.body == b"hello"
+    assert parsed.rest == b"!"
+    assert parsed.dump(endianness=Endianness.BIG) == data
+
+
+def test_view_on_non_bytes() -> None:
+    with pytest.raises(StructureCreationError):
+
+        class Name(Structure):
+            name: Annotated[str, Exact(2, as_view=True)]
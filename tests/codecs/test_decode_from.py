@@ -0,0 +1,163 @@
+from dataclasses import dataclass
+from typing import Annotated, Any
+
+import pytest
+
+from bytex import BitBuffer, Sign, Structure
+from bytex.bits import BitReader, BitWriter, Bits, to_bits
+from bytex.codecs import (
+    BaseCodec,
+    CharCodec,
+    DataCodec,
+    ExactBytesCodec,
+    ExactListCodec,
+    ExactStringCodec,
+    FixedBytesCodec,
+    FixedIntegersCodec,
+    FixedStringCodec,
+    FlagCodec,
+    IntegerCodec,
+    PrefixBytesCodec,
+    PrefixListCodec,
+    PrefixStringCodec,
+    TerminatedBytesCodec,
+    TerminatedListCodec,
+    TerminatedStringCodec,
+)
+from bytex.endianness import Endianness
+from bytex.errors import InsufficientDataError
+from bytex.types import U8
+
+U8_CODEC = IntegerCodec(bit_count=8, sign=Sign.UNSIGNED)
+U16_CODEC = IntegerCodec(bit_count=16, sign=Sign.UNSIGNED)
+I12_CODEC = IntegerCodec(bit_count=12, sign=Sign.SIGNED)
+TERMINATOR = to_bits(b"\x00")
+
+CODECS_AND_VALUES = [
+    (IntegerCodec(bit_count=3, sign=Sign.UNSIGNED), 5),
+    (U16_CODEC, 0x1234),
+    (IntegerCodec(bit_count=64, sign=Sign.SIGNED), -(1 << 63)),
+    (FlagCodec(), True),
+    (CharCodec(), "x"),
+    (ExactBytesCodec(length=2), b"ab"),
+    (FixedBytesCodec(length=4), b"ab\x00\x00"),
+    (ExactStringCodec(length=3), "abc"),
+    (FixedStringCodec(length=3), "abc"),
+    (PrefixBytesCodec(prefix_codec=U8_CODEC), b"abc"),
+    (PrefixStringCodec(prefix_codec=U16_CODEC), "abc"),
+    (PrefixListCodec(prefix_codec=U8_CODEC, item_codec=U16_CODEC), [1, 2, 3]),
+    (ExactListCodec(item_codec=U16_CODEC, length=2), [1, 2]),
+    (FixedIntegersCodec(integer_codec=U16_CODEC, length=3), [7, 0, 0]),
+    (TerminatedBytesCodec(terminator=TERMINATOR), b"abc"),
+    (TerminatedStringCodec(terminator=TERMINATOR), "abc"),
+    (TerminatedListCodec(item_codec=U8_CODEC, terminator=TERMINATOR), [1, 2]),
+]
+
+
+@pytest.mark.parametrize("codec, value", CODECS_AND_VALUES)
+@pytest.mark.parametrize("bit_offset", [0, 3, 8])
+def test_decode_from_matches_deserialize(
+    codec: BaseCodec, value: Any, bit_offset: int
+) -> None:
+    for endianness in (Endianness.BIG, Endianness.LITTLE):
+        writer = BitWriter()
+        writer.write_int(0, bit_offset)
+        codec.encode_into(value, writer, endianness=endianness)
+        writer.write_int(0, -len(writer) % 8)
+        data = writer.to_bytes()
+
+        result, new_offset = codec.decode_from(data, bit_offset, endianness)
+
+        reader = BitReader(data, bit_offset=bit_offset)
+        assert result == value
+        assert result == codec.deserialize(reader, endianness=endianness)
+        assert new_offset == reader.offset
+
+
+@pytest.mark.parametrize(
+    "codec, value",
+    CODECS_AND_VALUES
+    + [
+        (
+            ExactListCodec(
+                item_codec=PrefixBytesCodec(prefix_codec=U8_CODEC), length=2
+            ),
+            [b"a", b"bc"],
+        ),
+        (
+            TerminatedListCodec(
+                item_codec=TerminatedStringCodec(terminator=TERMINATOR),
+                terminator=to_bits(b"\xff"),
+            ),
+            ["ab", "c"],
+        ),
+    ],
+)
+@pytest.mark.parametrize("bit_offset", [0, 3, 8])
+def test_skip_from_matches_decode_from(
+    codec: BaseCodec, value: Any, bit_offset: int
+) -> None:
+    writer = BitWriter()
+    writer.write_int(0, bit_offset)
+    codec.encode_into(value, writer, endianness=Endianness.BIG)
+    writer.write_int(0, -len(writer) % 8)
+    writer.write_bytes(b"\x00\xff")
+    data = writer.to_bytes()
+
+    _, new_offset = codec.decode_from(data, bit_offset, Endianness.BIG)
+
+    assert codec.skip_from(data, bit_offset, Endianness.BIG) == new_offset
+
+
+@pytest.mark.parametrize("codec, value", CODECS_AND_VALUES)
+def test_decode_from_insufficient_data(codec: BaseCodec, value: Any) -> None:
+    writer = BitWriter()
+    codec.encode_into(value, writer, endianness=Endianness.BIG)
+    bit_count = len(writer)
+    writer.write_int(0, -len(writer) % 8)
+    data = writer.to_bytes()
+
+    with pytest.raises(InsufficientDataError):
+        codec.decode_from(data, 8 * len(data) - bit_count + 1, Endianness.BIG)
+
+
+def test_decode_from_data_codec_consumes_rest() -> None:
+    codec = DataCodec()
+
+    assert codec.decode_from(b"\x00abc", 8, Endianness.BIG) == (b"abc", 32)
+    assert codec.decode_from(b"\x00abc", 8, Endianness.LITTLE) == (b"cba", 32)
+
+
+@dataclass(frozen=True)
+class InvertedByteCodec(BaseCodec[int]):
+    """
+    A codec that only implements the bit protocol.
+    """
+
+    def serialize(self, value: int, endianness: Endianness) -> Bits:
+        return [not bit for bit in U8_CODEC.serialize(value, endianness=endianness)]
+
+    def deserialize(self, bit_buffer: BitReader, endianness: Endianness) -> int:
+        bits = [not bit for bit in bit_buffer.read(8)]
+        buffer = BitBuffer()
+        buffer.write(bits)
+        return U8_CODEC.deserialize(buffer, endianness=endianness)
+
+    def validate(self, value: int) -> None:
+        U8_CODEC.validate(value)
+
+
+def test_bit_protocol_codec_is_adapted() -> None:
+    class Inverted(Structure):
+        head: U8
+        inverted: Annotated[int, InvertedByteCodec()]
+        tail: U8
+
+    codec = InvertedByteCodec()
+    assert codec.decode_from(b"\xff\xf0", 8, Endianness.BIG) == (0x0F, 16)
+
+    data = b"\x01\xfe\x03"
+    structure = Inverted.parse(data, endianness=Endianness.BIG)
+
+    assert (structure.head, structure.inverted, structure.tail) == (1, 1, 3)
+    assert structure.dump(endianness=Endianness.BIG) == data
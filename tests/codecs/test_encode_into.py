@@ -0,0 +1,71 @@
+from typing import Any
+
+import pytest
+
+from bytex import Sign
+from bytex.bits import BitWriter, to_bits
+from bytex.codecs import (
+    BaseCodec,
+    CharCodec,
+    DataCodec,
+    ExactBytesCodec,
+    ExactListCodec,
+    ExactStringCodec,
+    FixedBytesCodec,
+    FixedIntegersCodec,
+    FixedStringCodec,
+    FlagCodec,
+    IntegerCodec,
+    PrefixBytesCodec,
+    PrefixListCodec,
+    PrefixStringCodec,
+    TerminatedBytesCodec,
+    TerminatedListCodec,
+    TerminatedStringCodec,
+)
+from bytex.endianness import Endianness
+
+U8_CODEC = IntegerCodec(bit_count=8, sign=Sign.UNSIGNED)
+U16_CODEC = IntegerCodec(bit_count=16, sign=Sign.UNSIGNED)
+I12_CODEC = IntegerCodec(bit_count=12, sign=Sign.SIGNED)
+TERMINATOR = to_bits(b"\x00")
+
+CASES = [
+    (IntegerCodec(bit_count=3, sign=Sign.UNSIGNED), 5),
+    (U16_CODEC, 0x1234),
+    (I12_CODEC, -7),
+    (IntegerCodec(bit_count=64, sign=Sign.SIGNED), -(1 << 63)),
+    (FlagCodec(), True),
+    (CharCodec(), "x"),
+    (DataCodec(), b"\x01\x02\x03"),
+    (ExactBytesCodec(length=2), b"ab"),
+    (FixedBytesCodec(length=4), b"ab"),
+    (ExactStringCodec(length=3), "abc"),
+    (FixedStringCodec(length=5), "abc"),
+    (PrefixBytesCodec(prefix_codec=U8_CODEC), b"abc"),
+    (PrefixStringCodec(prefix_codec=U16_CODEC), "abc"),
+    (PrefixListCodec(prefix_codec=U8_CODEC, item_codec=I12_CODEC), [1, -1, 3]),
+    (ExactListCodec(item_codec=U16_CODEC, length=2), [1, 2]),
+    (FixedIntegersCodec(integer_codec=U16_CODEC, length=3), [7]),
+    (TerminatedBytesCodec(terminator=TERMINATOR), b"abc"),
+    (TerminatedStringCodec(terminator=TERMINATOR), "abc"),
+    (TerminatedListCodec(item_codec=U8_CODEC, terminator=TERMINATOR), [1, 2]),
+]
+
+
+@pytest.mark.parametrize("codec, value", CASES)
+def test_encode_into_matches_serialize(codec: BaseCodec, value: Any) -> None:
+    for endianness in (Endianness.BIG, Endianness.LITTLE):
+        writer = BitWriter()
+        writer.write_int(0b1, 1)
+        codec.encode_into(value, writer, endianness=endianness)
+
+        expected = [True] + codec.serialize(value, endianness=endianness)
+        assert writer.to_bits() == expected
+
+
+@pytest.mark.parametrize("codec, value", CASES)
+def test_get_bit_size_matches_serialize(codec: BaseCodec, value: Any) -> None:
+    assert codec.get_bit_size(value) == len(
+        codec.serialize(value, endianness=Endianness.BIG)
+    )
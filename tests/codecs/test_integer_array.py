@@ -0,0 +1,150 @@
+import array
+from typing import Annotated, List
+
+import pytest
+
+from bytex import Endianness, Sign, Structure
+from bytex.bits import BitReader, BitWriter
+from bytex.codecs import (
+    BaseCodec,
+    ExactListCodec,
+    FixedIntegersCodec,
+    IntegerCodec,
+    PrefixListCodec,
+)
+from bytex.errors import StructureCreationError, ValidationError
+from bytex.length_encodings import Exact, Fixed, Prefix
+from bytex.types import U4, U8, U16
+
+U8_CODEC = IntegerCodec(bit_count=8, sign=Sign.UNSIGNED)
+U16_CODEC = IntegerCodec(bit_count=16, sign=Sign.UNSIGNED)
+I32_CODEC = IntegerCodec(bit_count=32, sign=Sign.SIGNED)
+U24_CODEC = IntegerCodec(bit_count=24, sign=Sign.UNSIGNED)
+I64_CODEC = IntegerCodec(bit_count=64, sign=Sign.SIGNED)
+
+CASES = [
+    (FixedIntegersCodec(integer_codec=U16_CODEC, length=4), U16_CODEC, [1, 0xABCD]),
+    (ExactListCodec(item_codec=I32_CODEC, length=3), I32_CODEC, [-1, 2, -(1 << 31)]),
+    (ExactListCodec(item_codec=U24_CODEC, length=2), U24_CODEC, [0x123456, 7]),
+    (
+        PrefixListCodec(prefix_codec=U8_CODEC, item_codec=I64_CODEC),
+        I64_CODEC,
+        [-5, 1 << 62],
+    ),
+    (PrefixListCodec(prefix_codec=U8_CODEC, item_codec=U8_CODEC), U8_CODEC, [1, 255]),
+]
+
+
+def _expected_bits(
+    codec: BaseCodec, item_codec: IntegerCodec, value: List[int], endianness: Endianness
+) -> list:
+    bits: list = []
+    if isinstance(codec, PrefixListCodec):
+        bits += codec.prefix_codec.serialize(len(value), endianness)
+
+    padded = value + [0] * (getattr(codec, "length", len(value)) - len(value))
+    for item in padded:
+        bits += item_codec.serialize(item, endianness)
+
+    return bits
+
+
+@pytest.mark.parametrize("endianness", [Endianness.BIG, Endianness.LITTLE])
+@pytest.mark.parametrize("codec, item_codec, value", CASES)
+@pytest.mark.parametrize("bit_offset", [0, 3])
+def test_bulk_matches_items(
+    endianness: Endianness,
+    codec: BaseCodec,
+    item_codec: IntegerCodec,
+    value: List[int],
+    bit_offset: int,
+) -> None:
+    expected = _expected_bits(codec, item_codec, value, endianness)
+    padded = value + [0] * (getattr(codec, "length", len(value)) - len(value))
+
+    assert codec.serialize(value, endianness) == expected
+
+    writer = BitWriter()
+    writer.write_int(0, bit_offset)
+    codec.encode_into(value, writer, endianness)
+    writer.write_int(0, -len(writer) % 8)
+    assert writer.to_bits()[bit_offset : bit_offset + len(expected)] == expected
+
+    data = writer.to_bytes()
+    decoded, end = codec.decode_from(data, bit_offset, endianness)
+    assert list(decoded) == padded
+    assert end == bit_offset + len(expected)
+
+    reader = BitReader(data, bit_offset=bit_offset)
+    assert list(codec.deserialize(reader, endianness)) == padded
+
+
+@pytest.mark.parametrize("endianness", [Endianness.BIG, Endianness.LITTLE])
+def test_as_array(endianness: Endianness) -> None:
+    codec = ExactListCodec(item_codec=U16_CODEC, length=3, as_array=True)
+    data = codec.serialize(array.array("H", [1, 2, 3]), endianness)
+
+    writer = BitWriter()
+    writer.write(data)
+    decoded, _ = codec.decode_from(writer.to_bytes(), 0, endianness)
+
+    assert decoded == array.array("H", [1, 2, 3])
+
+    writer = BitWriter()
+    writer.write_int(0, 1)
+    writer.write(data)
+    writer.write_int(0, 7)
+    decoded, _ = codec.decode_from(writer.to_bytes(), 1, endianness)
+
+    assert decoded == array.array("H", [1, 2, 3])
+
+
+def test_as_array_requires_array_width() -> None:
+    with pytest.raises(ValidationError):
+        ExactListCodec(item_codec=U24_CODEC, length=2, as_array=True)
+
+
+class Samples(Structure):
+    count: U8
+    values: Annotated[List[U16], Prefix(U8, as_array=True)]
+    fixed: Annotated[List[U8], Fixed(4, as_array=True)]
+    exact: Annotated[List[U16], Exact(2)]
+
+
+def test_structure_as_array() -> None:
+    samples = Samples(count=2, values=[1, 0xFFFF], fixed=[7], exact=[3, 4])
+
+    assert samples.values == array.array("H", [1, 0xFFFF])
+    assert samples.fixed == array.array("B", [7])
+
+    parsed = Samples.parse(samples.dump(endianness=Endianness.BIG), Endianness.BIG)
+    assert parsed.values == array.array("H", [1, 0xFFFF])
+    assert parsed.fixed == array.array("B", [7, 0, 0, 0])
+    assert parsed.exact == [3, 4]
+
+    with pytest.raises(ValidationError):
+        samples.values = [1 << 16]
+
+
+def test_out_of_range_items() -> None:
+    samples = Samples(count=0, values=[], fixed=[], exact=[1, 1 << 16])
+
+    with pytest.raises(ValidationError):
+        samples.dump()
+
+    with pytest.raises(ValidationError):
+        ExactListCodec(item_codec=U24_CODEC, length=1).serialize(
+            [1 << 24], Endianness.BIG
+        )
+
+
+def test_structure_as_array_unsupported() -> None:
+    with pytest.raises(StructureCreationError):
+
+        class Nibbles(Structure):
+            values: Annotated[List[U4], Exact(2, as_array=True)]
+
+    with pytest.raises(StructureCreationError):
+
+        class Name(Structure):
+            name: Annotated[str, Exact(2, as_array=True)]
@@ -1,6 +1,6 @@
 import pytest
 
-from bytex import BitBuffer, Sign
+from bytex import BitBuffer, BitWriter, Sign
 from bytex.codecs import IntegerCodec
 from bytex.endianness import Endianness
 from bytex.errors import ValidationError
@@ -133,3 +133,58 @@ def test_serialize_deserialize_roundtrip(bit_count, sign, value):
     buffer.write(bits)
     result = codec.deserialize(buffer, endianness=Endianness.BIG)
     assert result == value
+
+
+@pytest.mark.parametrize(
+    "bit_count, sign, value, endianness, expected",
+    [
+        (16, Sign.UNSIGNED, 0x1234, Endianness.BIG, b"\x12\x34"),
+        (16, Sign.UNSIGNED, 0x1234, Endianness.LITTLE, b"\x34\x12"),
+        (32, Sign.SIGNED, -2, Endianness.BIG, b"\xff\xff\xff\xfe"),
+        (32, Sign.SIGNED, -2, Endianness.LITTLE, b"\xfe\xff\xff\xff"),
+        (256, Sign.UNSIGNED, 1, Endianness.LITTLE, b"\x01" + bytes(31)),
+        (256, Sign.SIGNED, -1, Endianness.BIG, b"\xff" * 32),
+        (12, Sign.UNSIGNED, 0xABC, Endianness.BIG, bytes([0xAB, 0xC0])),
+        (12, Sign.UNSIGNED, 0xABC, Endianness.LITTLE, bytes([0xBC, 0xA0])),
+    ],
+)
+def test_serialize_to_bytes(bit_count, sign, value, endianness, expected):
+    codec = IntegerCodec(bit_count=bit_count, sign=sign)
+    writer = BitWriter()
+    codec.encode_into(value, writer, endianness=endianness)
+    writer.write_int(0, -len(writer) % 8)
+
+    assert writer.to_bytes() == expected
+    assert codec.serialize(value, endianness=endianness) == writer.to_bits()[:bit_count]
+
+
+@pytest.mark.parametrize(
+    "bit_count, sign, value",
+    [
+        (12, Sign.UNSIGNED, 0xABC),
+        (12, Sign.SIGNED, -(1 << 11)),
+        (20, Sign.SIGNED, -12345),
+        (24, Sign.UNSIGNED, 0x123456),
+        (64, Sign.SIGNED, -(1 << 63)),
+        (128, Sign.UNSIGNED, (1 << 128) - 1),
+        (256, Sign.SIGNED, -(1 << 200)),
+    ],
+)
+@pytest.mark.parametrize("endianness", [Endianness.BIG, Endianness.LITTLE])
+@pytest.mark.parametrize("bit_offset", [0, 5])
+def test_roundtrip_at_offset(bit_count, sign, value, endianness, bit_offset):
+    codec = IntegerCodec(bit_count=bit_count, sign=sign)
+    writer = BitWriter()
+    writer.write_int(0, bit_offset)
+    codec.encode_into(value, writer, endianness=endianness)
+    writer.write_int(0, -len(writer) % 8)
+    data = writer.to_bytes()
+
+    assert codec.decode_from(data, bit_offset, endianness) == (
+        value,
+        bit_offset + bit_count,
+    )
+
+    buffer = BitBuffer()
+    buffer.write(codec.serialize(value, endianness=endianness))
+    assert codec.deserialize(buffer, endianness=endianness) == value
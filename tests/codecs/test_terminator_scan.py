@@ -0,0 +1,141 @@
+from typing import Any, List
+
+import pytest
+
+from bytex import Endianness
+from bytex.bits import BitReader, BitWriter, string_to_bits, to_bits
+from bytex.bits.utils import FIND_WINDOW, contains_terminator, find_terminator
+from bytex.codecs import (
+    BaseCodec,
+    IntegerCodec,
+    StructureCodec,
+    TerminatedBytesCodec,
+    TerminatedListCodec,
+    TerminatedStringCodec,
+)
+from bytex.errors import InsufficientDataError, ValidationError
+from bytex.sign import Sign
+from bytex.structure import Structure
+from bytex.types import U8
+
+CRLF = to_bits(b"\r\n")
+U16_CODEC = IntegerCodec(bit_count=16, sign=Sign.UNSIGNED)
+U24_CODEC = IntegerCodec(bit_count=24, sign=Sign.UNSIGNED)
+
+
+class Pair(Structure):
+    first: U8
+    second: U8
+
+
+@pytest.mark.parametrize("position", [0, 1, FIND_WINDOW - 1, FIND_WINDOW, 5000])
+@pytest.mark.parametrize("bit_offset", [0, 8, 3])
+def test_find_terminator(position: int, bit_offset: int) -> None:
+    writer = BitWriter()
+    writer.write_int(0, bit_offset)
+    writer.write_bytes(b"\r" * position + b"\r\n" + b"x" * 10)
+    writer.write_int(0, -len(writer) % 8)
+    data = writer.to_bytes()
+
+    found = find_terminator(data, bit_offset, 8 * len(data), CRLF)
+
+    assert found == bit_offset + 8 * position
+
+
+def test_find_terminator_step() -> None:
+    data = b"\x00\r\n\x00\r\n"
+
+    assert find_terminator(data, 0, 8 * len(data), CRLF, step=8) == 8
+    assert find_terminator(data, 0, 8 * len(data), CRLF, step=16) == 32
+
+    with pytest.raises(InsufficientDataError):
+        find_terminator(data, 0, 8 * len(data), CRLF, step=24)
+
+
+def test_find_terminator_bits() -> None:
+    terminator = string_to_bits("101")
+    data = bytes([0b01000000, 0b10100000])
+
+    assert find_terminator(data, 0, 16, terminator) == 8
+    assert find_terminator(data, 1, 16, terminator, step=1) == 8
+
+
+@pytest.mark.parametrize("terminator", [CRLF, string_to_bits("101")])
+def test_find_terminator_missing(terminator: List[bool]) -> None:
+    data = b"\x00" * (3 * FIND_WINDOW)
+
+    with pytest.raises(InsufficientDataError):
+        find_terminator(data, 0, 8 * len(data), terminator)
+
+    with pytest.raises(InsufficientDataError):
+        find_terminator(b"ab\r\n", 0, 24, CRLF)
+
+
+def test_contains_terminator() -> None:
+    assert contains_terminator(b"a\r\nb", CRLF)
+    assert not contains_terminator(b"a\r", CRLF)
+    assert not contains_terminator(bytes([0x00, 0xD0]), to_bits(b"\x0d"))
+    assert contains_terminator(bytes([0b00010100]), string_to_bits("101"))
+
+
+CODECS: List[Any] = [
+    (TerminatedBytesCodec(terminator=CRLF), b"GET / HTTP/1.1" * 100),
+    (TerminatedStringCodec(terminator=CRLF), "Host: example.com\r" * 50),
+    (TerminatedStringCodec(terminator=string_to_bits("0101")), "abc"),
+    (TerminatedListCodec(item_codec=U16_CODEC, terminator=CRLF), [0x000D, 0x0A00, 7]),
+    (TerminatedListCodec(item_codec=U24_CODEC, terminator=CRLF), [0x000D0A, 0x0D]),
+    (
+        TerminatedListCodec(
+            item_codec=StructureCodec(structure_class=Pair), terminator=CRLF
+        ),
+        [Pair(first=0x0A, second=0x0D), Pair(first=0, second=0x0D)],
+    ),
+    (
+        TerminatedListCodec(
+            item_codec=TerminatedBytesCodec(terminator=to_bits(b"\x00")),
+            terminator=CRLF,
+        ),
+        [b"ab", b"\r"],
+    ),
+]
+
+
+@pytest.mark.parametrize("endianness", [Endianness.BIG, Endianness.LITTLE])
+@pytest.mark.parametrize("codec, value", CODECS)
+@pytest.mark.parametrize("bit_offset", [0, 5])
+def test_terminated_roundtrip(
+    codec: BaseCodec, value: Any, endianness: Endianness, bit_offset: int
+) -> None:
+    writer = BitWriter()
+    writer.write_int(0, bit_offset)
+    codec.encode_into(value, writer, endianness)
+    size = len(writer) - bit_offset
+    writer.write_bytes(b"\r\n\xff")
+    writer.write_int(0, -len(writer) % 8)
+    data = writer.to_bytes()
+
+    decoded, end = codec.decode_from(data, bit_offset, endianness)
+    assert end == bit_offset + size
+    assert repr(decoded) == repr(value)
+
+    reader = BitReader(data, bit_offset=bit_offset)
+    assert repr(codec.deserialize(reader, endianness)) == repr(value)
+    assert reader.offset == bit_offset + size
+
+
+def test_deserialize_respects_reader_end() -> None:
+    codec = TerminatedBytesCodec(terminator=CRLF)
+    reader = BitReader(b"abc\r\n", bit_count=32)
+
+    with pytest.raises(InsufficientDataError):
+        codec.deserialize(reader, Endianness.BIG)
+
+
+def test_validate_contains_terminator() -> None:
+    with pytest.raises(ValidationError):
+        TerminatedBytesCodec(terminator=CRLF).validate(b"x" * 10_000 + b"\r\n")
+
+    with pytest.raises(ValidationError):
+        TerminatedStringCodec(terminator=CRLF).validate("a\r\nb")
+
+    TerminatedStringCodec(terminator=CRLF).validate("a\n\rb")
@@ -0,0 +1,199 @@
+import asyncio
+from dataclasses import dataclass
+from typing import Annotated, Any, List
+
+import pytest
+
+from bytex import BitReader, Endianness, Structure
+from bytex.bits import Bits, from_bits, to_bits
+from bytex.codecs import BaseCodec
+from bytex.errors import InsufficientDataError, ParsingError
+from bytex.length_encodings import Prefix, Terminator
+from bytex.types import U8, U16, U32, Data
+
+
+class Header(Structure):
+    key: Annotated[str, Terminator(": ")]
+    value: Annotated[str, Terminator("\r\n")]
+
+
+class Message(Structure):
+    kind: U8
+    length: U32
+    headers: Annotated[List[Header], Terminator("\r\n")]
+    payload: Annotated[bytes, Prefix(U16)]
+
+
+class Response(Structure):
+    status: Annotated[str, Terminator("\r\n")]
+    body: Data
+
+
+class Empty(Structure):
+    pass
+
+
+@dataclass(frozen=True)
+class PascalStringCodec(BaseCodec[str]):
+    """
+    A codec that only implements the bit protocol, so it is measured by retrying.
+    """
+
+    def serialize(self, value: str, endianness: Endianness) -> Bits:
+        data = value.encode()
+        return to_bits(bytes([len(data)]) + data)
+
+    def deserialize(self, bit_buffer: BitReader, endianness: Endianness) -> str:
+        length = from_bits(bit_buffer.read(8))[0]
+        return bytes(bit_buffer.read_bytes(length)).decode()
+
+    def validate(self, value: str) -> None:
+        pass
+
+
+class Named(Structure):
+    kind: U8
+    name: Annotated[str, PascalStringCodec()]
+
+
+MESSAGES = [
+    Message(
+        kind=index,
+        length=index * 1000,
+        headers=[Header(key=f"key{i}", value="v" * i) for i in range(index)],
+        payload=bytes(range(index * 10)),
+    )
+    for index in range(4)
+]
+
+
+class CountingReader(asyncio.StreamReader):
+    def __init__(self, data: bytes, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self.calls = 0
+        self.feed_data(data)
+        self.feed_eof()
+
+    async def readexactly(self, n: int) -> bytes:
+        self.calls += 1
+        return await super().readexactly(n)
+
+    async def readuntil(self, separator: Any = b"\n") -> bytes:
+        self.calls += 1
+        return await super().readuntil(separator)
+
+
+class RecordingWriter:
+    def __init__(self) -> None:
+        self.writes: List[bytes] = []
+        self.drains = 0
+
+    def write(self, data: bytes) -> None:
+        self.writes.append(data)
+
+    async def drain(self) -> None:
+        self.drains += 1
+
+
+def run(coroutine):
+    return asyncio.run(coroutine)
+
+
+@pytest.mark.parametrize("endianness", [Endianness.BIG, Endianness.LITTLE])
+def test_aparse_reads_only_the_record(endianness: Endianness) -> None:
+    trailing = b"trailing data"
+
+    async def parse():
+        reader = CountingReader(MESSAGES[3].dump(endianness=endianness) + trailing)
+        message = await Message.aparse(reader, endianness=endianness)
+        return message, reader.calls, await reader.read()
+
+    message, calls, rest = run(parse())
+
+    assert repr(message) == repr(MESSAGES[3])
+    assert rest == trailing
+    # One read for every terminator and length prefix, none per byte.
+    assert calls < 16
+
+
+def test_aparse_at_end_of_stream() -> None:
+    async def parse(data: bytes) -> Message:
+        return await Message.aparse(CountingReader(data))
+
+    with pytest.raises(InsufficientDataError):
+        run(parse(b""))
+
+    with pytest.raises(InsufficientDataError):
+        run(parse(MESSAGES[2].dump()[:-1]))
+
+
+def test_aparse_terminator_past_reader_limit() -> None:
+    header = Header(key="k" * 1000, value="v" * 1000)
+
+    async def parse() -> Header:
+        return await Header.aparse(CountingReader(header.dump(), limit=64))
+
+    assert repr(run(parse())) == repr(header)
+
+
+def test_aparse_data_reads_until_end_of_stream() -> None:
+    response = Response(status="200 OK", body=b"hello")
+
+    async def parse() -> Response:
+        return await Response.aparse(CountingReader(response.dump()))
+
+    assert repr(run(parse())) == repr(response)
+
+
+def test_astream() -> None:
+    async def stream() -> List[Message]:
+        reader = CountingReader(Message.dump_many(MESSAGES))
+        return [message async for message in Message.astream(reader)]
+
+    assert [repr(message) for message in run(stream())] == [
+        repr(message) for message in MESSAGES
+    ]
+
+
+def test_astream_empty_structure() -> None:
+    async def stream() -> List[Empty]:
+        return [empty async for empty in Empty.astream(CountingReader(b"\x00"))]
+
+    with pytest.raises(ParsingError):
+        run(stream())
+
+
+def test_awrite() -> None:
+    writer = RecordingWriter()
+
+    async def write() -> None:
+        for message in MESSAGES:
+            await message.awrite(writer, drain=False)  # type: ignore[arg-type]
+
+        await MESSAGES[0].awrite(writer)  # type: ignore[arg-type]
+
+    run(write())
+
+    assert writer.writes == [message.dump() for message in MESSAGES + MESSAGES[:1]]
+    assert writer.drains == 1
+
+
+def test_awrite_many() -> None:
+    writer = RecordingWriter()
+
+    run(Message.awrite_many(writer, MESSAGES, Endianness.BIG))  # type: ignore[arg-type]
+
+    assert writer.writes == [Message.dump_many(MESSAGES, Endianness.BIG)]
+    assert writer.drains == 1
+
+
+def test_aparse_bit_protocol_codec() -> None:
+    named = [Named(kind=index, name="n" * index * 40) for index in range(4)]
+
+    async def parse() -> List[Named]:
+        reader = CountingReader(Named.dump_many(named))
+        return [await Named.aparse(reader) for _ in named]
+
+    assert [repr(record) for record in run(parse())] == [
+        repr(record) for record in named
+    ]
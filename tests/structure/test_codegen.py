@@ -0,0 +1,144 @@
+import traceback
+from typing import Annotated, List
+
+import pytest
+
+from bytex import BitReader, BitWriter, Endianness, Sign, Structure
+from bytex.bits import Bits, from_bits
+from bytex.codecs import IntegerCodec
+from bytex.errors import InsufficientDataError, ParsingError
+from bytex.length_encodings import Exact, Fixed, Prefix
+from bytex.types import I4, I16, U3, U4, U8, U16, U32, Char, Flag
+
+
+U12 = Annotated[int, IntegerCodec(bit_count=12, sign=Sign.UNSIGNED)]
+
+
+class Flags(Structure):
+    a: Flag
+    b: Flag
+    c: U3
+    d: I4
+    e: Flag
+
+
+class Record(Structure):
+    source: U16
+    signed: I16
+    odd: U12
+    nibble: U4
+    sequence: U32
+    flags: Flags
+    padding: U3
+    kind: Char
+    spare: U3
+    name: Annotated[str, Exact(3)]
+    padded: Annotated[bytes, Fixed(4)]
+    values: Annotated[List[U8], Fixed(2)]
+    text: Annotated[str, Prefix(U8)]
+    trailer: U16
+
+
+RECORD = Record(
+    source=0x1234,
+    signed=-2,
+    odd=0xABC,
+    nibble=5,
+    sequence=0xDEADBEEF,
+    flags=Flags(a=True, b=False, c=5, d=-3, e=True),
+    padding=2,
+    kind="k",
+    spare=7,
+    name="abc",
+    padded=b"xy\x00\x00",
+    values=[1, 2],
+    text="variable",
+    trailer=0xBEEF,
+)
+
+
+def _serialize_fields(structure: Structure, endianness: Endianness) -> Bits:
+    bits: Bits = []
+    for name, field in type(structure).__bytex_fields__.items():
+        bits += field.codec.serialize(getattr(structure, name), endianness)
+
+    return bits
+
+
+@pytest.mark.parametrize("endianness", [Endianness.BIG, Endianness.LITTLE])
+def test_generated_dump_matches_codecs(endianness: Endianness) -> None:
+    expected = from_bits(_serialize_fields(RECORD, endianness))
+
+    assert RECORD.dump(endianness=endianness) == expected
+    assert repr(Record.parse(expected, endianness=endianness)) == repr(RECORD)
+
+
+@pytest.mark.parametrize("endianness", [Endianness.BIG, Endianness.LITTLE])
+@pytest.mark.parametrize("bit_offset", [0, 1, 5, 8, 13])
+def test_generated_decode_from_offset(endianness: Endianness, bit_offset: int) -> None:
+    writer = BitWriter()
+    writer.write_int(0, bit_offset)
+    RECORD.encode_into(writer, endianness)
+    end = len(writer)
+    writer.write_int(0, -end % 8)
+
+    record, offset = Record.decode_from(writer.to_bytes(), bit_offset, endianness)
+
+    assert repr(record) == repr(RECORD)
+    assert offset == end
+
+
+def test_generated_decode_from_insufficient_data() -> None:
+    data = RECORD.dump(endianness=Endianness.BIG)
+
+    with pytest.raises(InsufficientDataError):
+        Record.decode_from(data[:10], 0, Endianness.BIG)
+
+
+@pytest.mark.parametrize("length, name", [(10, "flags"), (-1, "trailer")])
+def test_parse_bits_names_failing_field(length: int, name: str) -> None:
+    data = RECORD.dump(endianness=Endianness.BIG)[:length]
+
+    with pytest.raises(ParsingError, match=f"field '{name}'"):
+        Record.parse_bits(BitReader(data), Endianness.BIG)
+
+
+def test_generated_source_is_inspectable() -> None:
+    sources = Record.__bytex_source__
+
+    assert set(sources) == {"decode_from", "encode_into"}
+    assert (
+        Record.__dict__["decode_from"].__func__.__bytex_source__
+        == sources["decode_from"]
+    )
+    assert sources["decode_from"].startswith("def decode_from(")
+    assert sources["encode_into"].startswith("def encode_into(")
+
+
+def test_generated_source_inlines_nested_structures() -> None:
+    source = Record.__bytex_source__["decode_from"]
+
+    assert "Flags" not in source
+    assert ".decode_from(data, bit_offset, endianness)" in source
+    assert "_new(_S0)" in source
+
+
+def test_generated_source_groups_bit_fields() -> None:
+    decode_from = Record.__bytex_source__["decode_from"]
+    encode_into = Record.__bytex_source__["encode_into"]
+
+    assert "_g1 = _from_bytes(data[_start + 10 : _start + 13], 'big')" in decode_from
+    assert "_read_int" not in decode_from
+    assert "write_int" not in encode_into
+
+
+def test_generated_source_in_tracebacks() -> None:
+    record = Record.parse(RECORD.dump())
+    record.__dict__["padded"] = None
+
+    with pytest.raises(AttributeError) as info:
+        record.dump()
+
+    formatted = "".join(traceback.format_tb(info.tb))
+    assert "<bytex generated encode_into" in formatted
+    assert "ljust" in formatted
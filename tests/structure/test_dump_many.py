@@ -0,0 +1,102 @@
+from typing import Annotated, List
+
+import pytest
+
+from bytex import Endianness, Structure
+from bytex.errors import AlignmentError, InsufficientSpaceError, StructureError
+from bytex.length_encodings import Prefix, Terminator
+from bytex.types import U4, U8, U16
+
+
+class Point(Structure):
+    x: U8
+    y: U16
+
+
+class Message(Structure):
+    kind: U8
+    text: Annotated[str, Prefix(U8)]
+    values: Annotated[List[U16], Prefix(U8)]
+    name: Annotated[bytes, Terminator(b"\x00")]
+    points: Annotated[List[Point], Prefix(U8)]
+
+
+class Nibble(Structure):
+    value: U4
+
+
+MESSAGES = [
+    Message(kind=1, text="", values=[], name=b"", points=[]),
+    Message(
+        kind=2,
+        text="hello",
+        values=[1, 2, 3],
+        name=b"abc",
+        points=[Point(x=1, y=2), Point(x=3, y=4)],
+    ),
+]
+
+
+@pytest.mark.parametrize("message", MESSAGES)
+def test_dumped_size(message: Message) -> None:
+    assert message.dumped_size() == len(message.dump())
+    assert message.dumped_bit_size() == 8 * len(message.dump())
+    assert Point(x=1, y=2).dumped_size() == Point.size()
+
+
+def test_dumped_size_unaligned() -> None:
+    assert Nibble(value=1).dumped_bit_size() == 4
+
+    with pytest.raises(AlignmentError):
+        Nibble(value=1).dumped_size()
+
+
+@pytest.mark.parametrize("endianness", [Endianness.BIG, Endianness.LITTLE])
+def test_dump_into(endianness: Endianness) -> None:
+    first, second = MESSAGES
+    buffer = bytearray(2 + first.dumped_size() + second.dumped_size())
+
+    offset = first.dump_into(buffer, 2, endianness=endianness)
+    offset = second.dump_into(buffer, offset, endianness=endianness)
+
+    assert offset == len(buffer)
+    assert bytes(buffer) == b"\x00\x00" + first.dump(endianness) + second.dump(
+        endianness
+    )
+
+
+def test_dump_into_insufficient_space() -> None:
+    message = MESSAGES[1]
+    buffer = bytearray(message.dumped_size() - 1)
+
+    with pytest.raises(InsufficientSpaceError):
+        message.dump_into(buffer)
+
+    with pytest.raises(StructureError):
+        Point(x=1, y=2).dump_into(bytearray(3), 1)
+
+
+def test_dump_into_unaligned() -> None:
+    with pytest.raises(AlignmentError):
+        Nibble(value=1).dump_into(bytearray(1))
+
+
+@pytest.mark.parametrize("endianness", [Endianness.BIG, Endianness.LITTLE])
+def test_dump_many(endianness: Endianness) -> None:
+    data = Message.dump_many(MESSAGES, endianness=endianness)
+
+    assert data == b"".join(message.dump(endianness) for message in MESSAGES)
+
+    parsed = Message.parse_many(data, endianness=endianness)
+    assert [repr(message) for message in parsed] == [
+        repr(message) for message in MESSAGES
+    ]
+
+
+def test_dump_many_empty() -> None:
+    assert Point.dump_many([]) == b""
+
+
+def test_dump_many_unaligned() -> None:
+    with pytest.raises(AlignmentError):
+        Nibble.dump_many([Nibble(value=1), Nibble(value=2)])
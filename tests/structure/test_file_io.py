@@ -0,0 +1,157 @@
+import io
+import os
+from dataclasses import dataclass
+from typing import Annotated, List, Set
+
+import pytest
+
+from bytex import BitReader, Endianness, Structure
+from bytex.bits import Bits, from_bits, to_bits
+from bytex.codecs import BaseCodec
+from bytex.errors import InsufficientDataError
+from bytex.length_encodings import Prefix, Terminator
+from bytex.types import U8, U16, U32, Data
+
+
+class Point(Structure):
+    x: U16
+    y: U32
+
+
+class Header(Structure):
+    key: Annotated[str, Terminator(": ")]
+    value: Annotated[str, Terminator("\r\n")]
+
+
+class Message(Structure):
+    kind: U8
+    headers: Annotated[List[Header], Terminator("\r\n")]
+    payload: Annotated[bytes, Prefix(U16)]
+
+
+class Response(Structure):
+    status: Annotated[str, Terminator("\r\n")]
+    body: Data
+
+
+@dataclass(frozen=True)
+class PascalStringCodec(BaseCodec[str]):
+    """
+    A codec that only implements the bit protocol, so it is measured by retrying.
+    """
+
+    def serialize(self, value: str, endianness: Endianness) -> Bits:
+        data = value.encode()
+        return to_bits(bytes([len(data)]) + data)
+
+    def deserialize(self, bit_buffer: BitReader, endianness: Endianness) -> str:
+        length = from_bits(bit_buffer.read(8))[0]
+        return bytes(bit_buffer.read_bytes(length)).decode()
+
+    def validate(self, value: str) -> None:
+        pass
+
+
+class Named(Structure):
+    kind: U8
+    name: Annotated[str, PascalStringCodec()]
+
+
+POINTS = [Point(x=index, y=index * 1000) for index in range(10)]
+MESSAGES = [
+    Message(
+        kind=index,
+        headers=[Header(key=f"key{i}", value="v" * i) for i in range(index)],
+        payload=bytes(range(index * 10)),
+    )
+    for index in range(5)
+]
+
+
+def reprs(records) -> List[str]:
+    return [repr(record) for record in records]
+
+
+@pytest.mark.parametrize("endianness", [Endianness.BIG, Endianness.LITTLE])
+def test_parse_from_reads_only_the_record(endianness: Endianness) -> None:
+    for structure in (POINTS[3], MESSAGES[3]):
+        data = structure.dump(endianness=endianness)
+        fp = io.BytesIO(data + b"trailing data")
+
+        parsed = type(structure).parse_from(fp, endianness=endianness)
+
+        assert repr(parsed) == repr(structure)
+        assert fp.tell() == len(data)
+
+
+def test_parse_from_at_end_of_file() -> None:
+    with pytest.raises(InsufficientDataError):
+        Point.parse_from(io.BytesIO(b""))
+
+    with pytest.raises(InsufficientDataError):
+        Point.parse_from(io.BytesIO(POINTS[1].dump()[:-1]))
+
+    with pytest.raises(InsufficientDataError):
+        Message.parse_from(io.BytesIO(MESSAGES[2].dump()[:-1]))
+
+
+def test_parse_from_data_reads_until_end_of_file() -> None:
+    response = Response(status="200 OK", body=b"hello")
+
+    assert repr(Response.parse_from(io.BytesIO(response.dump()))) == repr(response)
+
+
+def test_iter_from_file(tmp_path) -> None:
+    path = tmp_path / "records"
+    path.write_bytes(Point.dump_many(POINTS) + Message.dump_many(MESSAGES))
+
+    with open(path, "rb") as fp:
+        points = [next(Point.iter_from(fp)) for _ in POINTS]
+        messages = list(Message.iter_from(fp))
+
+    assert reprs(points) == reprs(POINTS)
+    assert reprs(messages) == reprs(MESSAGES)
+
+
+def test_iter_from_pipe() -> None:
+    read_fd, write_fd = os.pipe()
+    with open(write_fd, "wb") as fp:
+        fp.write(Message.dump_many(MESSAGES))
+
+    with open(read_fd, "rb", buffering=0) as fp:
+        assert reprs(Message.iter_from(fp)) == reprs(MESSAGES)
+
+
+def test_iter_from_reuses_the_buffer() -> None:
+    class Recorder(io.BytesIO):
+        def __init__(self, data: bytes) -> None:
+            super().__init__(data)
+            self.buffers: Set[int] = set()
+
+        def readinto(self, buffer) -> int:
+            self.buffers.add(id(buffer.obj))
+            return super().readinto(buffer)
+
+    fp = Recorder(Point.dump_many(POINTS))
+
+    assert reprs(Point.iter_from(fp)) == reprs(POINTS)
+    assert len(fp.buffers) == 1
+
+
+def test_dump_to() -> None:
+    fp = io.BytesIO()
+
+    sizes = [message.dump_to(fp, Endianness.BIG) for message in MESSAGES]
+
+    assert fp.getvalue() == Message.dump_many(MESSAGES, Endianness.BIG)
+    assert sizes == [message.dumped_size() for message in MESSAGES]
+
+
+def test_iter_from_pipe_bit_protocol_codec() -> None:
+    named = [Named(kind=index, name="n" * index * 40) for index in range(4)]
+    read_fd, write_fd = os.pipe()
+    with open(write_fd, "wb") as fp:
+        fp.write(Named.dump_many(named))
+
+    with open(read_fd, "rb", buffering=0) as fp:
+        assert reprs(Named.iter_from(fp)) == reprs(named)
@@ -0,0 +1,99 @@
+from typing import Annotated, List
+
+import pytest
+
+from bytex import Endianness, Structure
+from bytex.errors import AlignmentError, StructureError
+from bytex.length_encodings import Exact, Fixed, Prefix
+from bytex.types import U3, U4, U8, U16, U32, Char, Data, Flag
+
+
+class Flags(Structure):
+    a: Flag
+    b: Flag
+    c: U3
+    d: U3
+
+
+class Header(Structure):
+    source: U16
+    destination: U16
+    sequence: U32
+    offset: U4
+    reserved: U3
+    ns: Flag
+    flags: Flags
+    name: Annotated[str, Exact(3)]
+    padded: Annotated[bytes, Fixed(5)]
+    values: Annotated[List[U16], Fixed(2)]
+    exact_values: Annotated[List[Flags], Exact(2)]
+    kind: Char
+
+
+class Message(Structure):
+    length: U8
+    text: Annotated[str, Prefix(U8)]
+    trailer: U8
+    data: Data
+
+
+class Unaligned(Structure):
+    a: U3
+
+
+def test_fixed_structure_size() -> None:
+    header = Header(
+        source=1,
+        destination=2,
+        sequence=3,
+        offset=4,
+        reserved=5,
+        ns=True,
+        flags=Flags(a=True, b=False, c=1, d=2),
+        name="abc",
+        padded=b"ab",
+        values=[1],
+        exact_values=[Flags(a=True, b=True, c=0, d=0)] * 2,
+        kind="k",
+    )
+
+    assert Flags.bit_size() == 8
+    assert Header.bit_size() == 8 * 25
+    assert Header.size() == 25
+    assert len(header) == 25
+    assert len(header.dump(endianness=Endianness.BIG)) == Header.size()
+
+
+def test_fixed_structure_field_offsets() -> None:
+    assert Header.field_offsets() == {
+        "source": 0,
+        "destination": 16,
+        "sequence": 32,
+        "offset": 64,
+        "reserved": 68,
+        "ns": 71,
+        "flags": 72,
+        "name": 80,
+        "padded": 104,
+        "values": 144,
+        "exact_values": 176,
+        "kind": 192,
+    }
+
+
+def test_variable_structure_offsets_stop_at_first_variable_field() -> None:
+    assert Message.bit_size() is None
+    assert Message.field_offsets() == {"length": 0, "text": 8}
+
+    with pytest.raises(StructureError):
+        Message.size()
+
+    with pytest.raises(StructureError):
+        len(Message(length=1, text="a", trailer=2, data=b""))
+
+
+def test_unaligned_structure_size() -> None:
+    assert Unaligned.bit_size() == 3
+
+    with pytest.raises(AlignmentError):
+        Unaligned.size()
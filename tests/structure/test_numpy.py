@@ -0,0 +1,123 @@
+from typing import Annotated, List
+
+import pytest
+
+from bytex import Endianness, Structure, StructureEnum
+from bytex.codecs import IntegerCodec
+from bytex.errors import StructureError
+from bytex.length_encodings import Exact, Fixed, Prefix
+from bytex.sign import Sign
+from bytex.types import I4, I16, U2, U3, U4, U8, U16, U32, Char, Flag
+
+np = pytest.importorskip("numpy")
+
+I12 = Annotated[int, IntegerCodec(bit_count=12, sign=Sign.SIGNED)]
+
+
+class Kind(StructureEnum(U8)):  # type: ignore[misc]
+    A = 1
+    B = 2
+
+
+class Point(Structure):
+    x: I16
+    y: U16
+
+
+class Flags(Structure):
+    urgent: Flag
+    ack: Flag
+    reserved: U2
+    offset: I4
+
+
+class Record(Structure):
+    identifier: U32
+    point: Point
+    kind: Kind
+    letter: Char
+    values: Annotated[List[U16], Fixed(3)]
+    tag: Annotated[bytes, Exact(2)]
+    flags: Flags
+    odd: I12
+    nibble: U4
+
+
+class Packed(Structure):
+    a: U8
+    b: U16
+    point: Point
+
+
+RECORDS = [
+    Record(
+        identifier=i,
+        point=Point(x=-i, y=2 * i),
+        kind=Kind.A if i % 2 else Kind.B,
+        letter="k",
+        values=[i, i + 1, 0xFFFF],
+        tag=b"ab",
+        flags=Flags(urgent=bool(i % 2), ack=True, reserved=i % 4, offset=-i % 8 - 4),
+        odd=-i * 100,
+        nibble=i % 16,
+    )
+    for i in range(8)
+]
+
+
+@pytest.mark.parametrize("endianness", [Endianness.BIG, Endianness.LITTLE])
+def test_to_numpy(endianness: Endianness) -> None:
+    data = Record.dump_many(RECORDS, endianness=endianness)
+    array = Record.to_numpy(data, endianness=endianness)
+
+    assert array.dtype == Record.numpy_dtype(endianness)
+    assert len(array) == len(RECORDS)
+
+    for row, record in zip(array, RECORDS):
+        assert row["identifier"] == record.identifier
+        assert row["point"]["x"] == record.point.x
+        assert row["kind"] == record.kind.value
+        assert row["letter"] == b"k"
+        assert list(row["values"]) == record.values
+        assert row["tag"] == record.tag
+        assert row["flags"]["urgent"] == record.flags.urgent
+        assert row["flags"]["reserved"] == record.flags.reserved
+        assert row["flags"]["offset"] == record.flags.offset
+        assert row["odd"] == record.odd
+        assert row["nibble"] == record.nibble
+
+
+@pytest.mark.parametrize("endianness", [Endianness.BIG, Endianness.LITTLE])
+def test_from_numpy_round_trip(endianness: Endianness) -> None:
+    data = Record.dump_many(RECORDS, endianness=endianness)
+
+    assert Record.from_numpy(Record.to_numpy(data, endianness), endianness) == data
+
+
+def test_packed_structure_is_a_view() -> None:
+    data = bytearray(Packed.dump_many([Packed(a=1, b=2, point=Point(x=-3, y=4))]))
+    array = Packed.to_numpy(data)
+
+    assert array.dtype == Packed.numpy_dtype()
+    assert Packed.numpy_dtype(Endianness.BIG)["b"].str == ">u2"
+
+    data[1] = 7
+    assert array[0]["b"] == 7
+    assert Packed.from_numpy(array) == bytes(data)
+
+
+def test_unsupported_structures() -> None:
+    class Message(Structure):
+        text: Annotated[str, Prefix(U8)]
+
+    class Unaligned(Structure):
+        flag: Flag
+        letter: Char
+        spare: U4
+        more: U3
+
+    with pytest.raises(StructureError):
+        Message.numpy_dtype()
+
+    with pytest.raises(StructureError):
+        Unaligned.numpy_dtype()
@@ -0,0 +1,130 @@
+from typing import Annotated, Any, List
+
+import pytest
+
+from bytex import Endianness, Structure
+from bytex.codecs import ExactBytesCodec
+from bytex.errors import InsufficientDataError, ParsingError, StructureError
+from bytex.length_encodings import Exact, Prefix, Terminator
+from bytex.types import U4, U8, U16, U32, Data, Flag
+
+
+class Header(Structure):
+    source_port: U16
+    dest_port: U16
+    sequence: U32
+    offset: U4
+    reserved: U4
+    syn: Flag
+    ack: Flag
+    flags: U4
+    fin: Flag
+    rst: Flag
+    window: U16
+
+
+class Message(Structure):
+    header: Header
+    name: Annotated[str, Terminator("\0")]
+    tags: Annotated[List[U16], Prefix(U8)]
+    checksum: U16
+    body: Data
+
+
+HEADER = Header(
+    source_port=443,
+    dest_port=51000,
+    sequence=7,
+    offset=5,
+    reserved=0,
+    syn=True,
+    ack=False,
+    flags=0,
+    fin=True,
+    rst=False,
+    window=9,
+)
+MESSAGE = Message(
+    header=HEADER,
+    name="hello",
+    tags=[1, 2, 3],
+    checksum=0xBEEF,
+    body=b"x" * 1000,
+)
+
+
+@pytest.mark.parametrize("endianness", [Endianness.BIG, Endianness.LITTLE])
+def test_parse_fields(endianness: Endianness) -> None:
+    data = MESSAGE.dump(endianness=endianness)
+
+    record = Message.parse(data, endianness, fields={"checksum", "header"})
+
+    assert record._fields == ("header", "checksum")
+    assert record.checksum == 0xBEEF
+    assert repr(record.header) == repr(HEADER)
+
+    header = Header.parse(
+        HEADER.dump(endianness=endianness),
+        endianness,
+        fields=["dest_port", "source_port", "syn"],
+    )
+    assert tuple(header) == (443, 51000, True)
+
+
+def test_parse_fields_skips_unrequested(monkeypatch: pytest.MonkeyPatch) -> None:
+    data = MESSAGE.dump()
+    decoded = []
+
+    def decode_from(self: ExactBytesCodec, *args: Any) -> Any:
+        decoded.append(self)
+        return original(self, *args)
+
+    original = ExactBytesCodec.decode_from
+    monkeypatch.setattr(ExactBytesCodec, "decode_from", decode_from)
+
+    class Padded(Structure):
+        padding: Annotated[bytes, Exact(4)]
+        value: U8
+
+    assert Padded.parse(b"abcd\x07", fields={"value"}).value == 7
+    assert decoded == []
+
+    record = Message.parse(data, fields={"tags"})
+    assert record.tags == [1, 2, 3]
+
+
+def test_parse_fields_strict() -> None:
+    data = HEADER.dump()
+
+    assert Header.parse(data + b"\0", fields={"dest_port"}).dest_port == 51000
+
+    with pytest.raises(ParsingError):
+        Header.parse(data + b"\0", strict=True, fields={"dest_port"})
+
+    with pytest.raises(InsufficientDataError):
+        Header.parse(data[:-1], strict=True, fields={"dest_port"})
+
+
+def test_parse_fields_unknown() -> None:
+    with pytest.raises(StructureError):
+        Header.parse(HEADER.dump(), fields={"destination"})
+
+
+def test_parse_no_fields() -> None:
+    assert Header.parse(b"", fields=()) == ()
+
+
+class Named(Structure):
+    name: Annotated[str, Terminator("\0")]
+    tags: Annotated[List[U16], Prefix(U8)]
+
+
+class Envelope(Structure):
+    named: Named
+    kind: U8
+
+
+def test_parse_fields_skips_nested_structure() -> None:
+    envelope = Envelope(named=Named(name="abc", tags=[1, 2]), kind=3)
+
+    assert Envelope.parse(envelope.dump(), fields={"kind"}).kind == 3
@@ -0,0 +1,74 @@
+from typing import Annotated
+
+import pytest
+
+from bytex import Endianness, Structure
+from bytex.errors import InsufficientDataError, ParsingError, ValidationError
+from bytex.length_encodings import Exact, Prefix
+from bytex.types import U8, U16
+
+
+class Record(Structure):
+    identifier: U16
+    text: Annotated[str, Prefix(U8)]
+
+
+class Tag(Structure):
+    name: Annotated[str, Exact(2)]
+
+
+class Empty(Structure):
+    pass
+
+
+RECORDS = [Record(identifier=i, text="x" * i) for i in range(5)]
+
+
+@pytest.mark.parametrize("endianness", [Endianness.BIG, Endianness.LITTLE])
+def test_parse_many(endianness: Endianness) -> None:
+    data = b"".join(record.dump(endianness=endianness) for record in RECORDS)
+
+    records = Record.parse_many(data, endianness=endianness)
+
+    assert [repr(record) for record in records] == [repr(r) for r in RECORDS]
+
+
+def test_iter_parse_is_lazy() -> None:
+    data = b"".join(record.dump() for record in RECORDS) + b"\x00"
+
+    records = Record.iter_parse(data)
+
+    for record in RECORDS:
+        assert repr(next(records)) == repr(record)
+
+    with pytest.raises(InsufficientDataError):
+        next(records)
+
+
+def test_iter_parse_empty_structure() -> None:
+    assert Record.parse_many(b"") == []
+
+    with pytest.raises(ParsingError):
+        Empty.parse_many(b"\x00")
+
+
+def test_parse_prefix() -> None:
+    tag = Tag(name="ab")
+    record = Record(identifier=7, text="hello")
+    data = tag.dump() + record.dump() + tag.dump()
+
+    parsed_tag, offset = Tag.parse_prefix(data)
+    parsed_record, consumed = Record.parse_prefix(data, offset=offset)
+    offset += consumed
+    last_tag, consumed = Tag.parse_prefix(data, offset=offset)
+
+    assert parsed_tag.name == "ab"
+    assert repr(parsed_record) == repr(record)
+    assert last_tag.name == "ab"
+    assert offset + consumed == len(data)
+
+
+@pytest.mark.parametrize("validate", [False, True])
+def test_parse_prefix_validate(validate: bool) -> None:
+    with pytest.raises(ValidationError):
+        Tag.parse_prefix("é".encode(), validate=validate)
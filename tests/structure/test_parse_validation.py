@@ -0,0 +1,99 @@
+from typing import Annotated, List
+
+import pytest
+
+from bytex import BitReader, Endianness, Structure, from_bits, to_bits
+from bytex.codecs import IntegerCodec
+from bytex.errors import ParsingError, ValidationError
+from bytex.field import ValidatedList
+from bytex.length_encodings import Exact, Prefix
+from bytex.types import U3, U4, U8, U16, Flag
+
+
+class Inner(Structure):
+    flag: Flag
+    kind: U3
+    value: U4
+
+
+class Message(Structure):
+    identifier: U16
+    inner: Inner
+    name: Annotated[str, Exact(2)]
+    values: Annotated[List[U8], Prefix(U8)]
+
+
+MESSAGE = Message(
+    identifier=1,
+    inner=Inner(flag=True, kind=1, value=2),
+    name="ab",
+    values=[3, 4],
+)
+
+
+def test_parse_does_not_validate(monkeypatch: pytest.MonkeyPatch) -> None:
+    data = MESSAGE.dump()
+    calls = []
+    monkeypatch.setattr(IntegerCodec, "validate", lambda self, value: calls.append(1))
+
+    message = Message.parse(data)
+
+    assert calls == []
+    assert repr(message) == repr(MESSAGE)
+
+
+def test_parse_with_validate(monkeypatch: pytest.MonkeyPatch) -> None:
+    data = MESSAGE.dump()
+    calls = []
+    monkeypatch.setattr(IntegerCodec, "validate", lambda self, value: calls.append(1))
+
+    Message.parse(data, validate=True)
+
+    assert len(calls) > 0
+
+
+class Named(Structure):
+    name: Annotated[str, Exact(4)]
+    kind: U8
+
+
+class ShiftedName(Structure):
+    flag: Flag
+    name: Annotated[str, Exact(4)]
+    kind: U3
+    value: U4
+
+
+@pytest.mark.parametrize("validate", [False, True])
+def test_parse_rejects_multibyte_exact_string(validate: bool) -> None:
+    data = "é".encode() + b"ab\x07"
+
+    with pytest.raises(ValidationError):
+        Named.parse(data, validate=validate)
+
+    with pytest.raises(ValidationError):
+        Named.parse(data, fields=["name"])
+
+    with pytest.raises(ValidationError):
+        Message.parse(b"\x01\x00\x80" + "é".encode() + b"\x00", validate=validate)
+
+    with pytest.raises(ValidationError):
+        ShiftedName.parse(bytes(from_bits([False, *to_bits(data[:4]), *[False] * 7])))
+
+    with pytest.raises(ParsingError):
+        Named.parse_bits(BitReader(data), Endianness.LITTLE)
+
+
+def test_parsed_structure_validates_on_assignment() -> None:
+    message = Message.parse(MESSAGE.dump(endianness=Endianness.BIG), Endianness.BIG)
+
+    assert isinstance(message.values, ValidatedList)
+
+    with pytest.raises(ValidationError):
+        message.values[0] = 256
+
+    with pytest.raises(ValidationError):
+        message.inner.value = 16
+
+    message.identifier = 7
+    assert message.identifier == 7
@@ -0,0 +1,78 @@
+from typing import Annotated, List
+
+import pytest
+
+from bytex import Endianness, Structure
+from bytex.errors import UninitializedAccessError, ValidationError
+from bytex.field import ValidatedList
+from bytex.length_encodings import Prefix
+from bytex.types import U3, U8, U16, Flag
+
+
+class Flags(Structure, slots=True):
+    a: Flag
+    b: Flag
+    c: U3
+    d: U3
+
+
+class Header(Structure):
+    length: U16
+    flags: Flags
+
+
+class Message(Structure, slots=True):
+    header: Header
+    kind: U8 = 7
+    values: Annotated[List[U8], Prefix(U8)]
+
+
+MESSAGE = Message(
+    header=Header(length=1, flags=Flags(a=True, b=False, c=1, d=2)),
+    values=[1, 2, 3],
+)
+
+
+def test_slots_have_no_instance_dict() -> None:
+    assert not hasattr(MESSAGE, "__dict__")
+    assert not hasattr(MESSAGE.header.flags, "__dict__")
+    assert hasattr(MESSAGE.header, "__dict__")
+
+
+@pytest.mark.parametrize("endianness", [Endianness.BIG, Endianness.LITTLE])
+def test_slots_roundtrip(endianness: Endianness) -> None:
+    data = MESSAGE.dump(endianness=endianness)
+    message = Message.parse(data, endianness=endianness)
+
+    assert repr(message) == repr(MESSAGE)
+    assert message.kind == 7
+    assert message.dump(endianness=endianness) == data
+    assert not hasattr(message, "__dict__")
+
+
+def test_slots_validate_on_assignment() -> None:
+    message = Message.parse(MESSAGE.dump())
+
+    assert isinstance(message.values, ValidatedList)
+
+    with pytest.raises(ValidationError):
+        message.kind = 256
+
+    with pytest.raises(ValidationError):
+        message.values[0] = -1
+
+    with pytest.raises(ValidationError):
+        message.header.flags.c = 8
+
+    with pytest.raises(AttributeError):
+        message.unknown = 1  # type: ignore[attr-defined]
+
+    message.kind = 1
+    assert message.kind == 1
+
+
+def test_slots_uninitialized_access() -> None:
+    flags = Flags.__new__(Flags)
+
+    with pytest.raises(UninitializedAccessError):
+        flags.a
@@ -0,0 +1,118 @@
+import struct
+from typing import Annotated
+
+import pytest
+
+from bytex import Endianness, Structure
+from bytex.errors import InsufficientDataError, StructureError
+from bytex.length_encodings import Exact, Fixed, Prefix
+from bytex.types import I8, I64, U4, U8, U16, U32, U64, Char
+
+
+class Point(Structure):
+    x: I8
+    y: U16
+
+
+class Record(Structure):
+    identifier: U32
+    balance: I64
+    counter: U64
+    point: Point
+    kind: Char
+    tag: Annotated[bytes, Exact(2)]
+    name: Annotated[str, Fixed(5)]
+
+
+class Packed(Structure):
+    low: U4
+    high: U4
+
+
+class Message(Structure):
+    length: U8
+    text: Annotated[str, Prefix(U8)]
+
+
+RECORD = Record(
+    identifier=0xDEADBEEF,
+    balance=-42,
+    counter=1 << 40,
+    point=Point(x=-1, y=0x1234),
+    kind="k",
+    tag=b"\x01\x02",
+    name="abc\x00\x00",
+)
+
+
+@pytest.mark.parametrize(
+    "endianness, byteorder", [(Endianness.BIG, ">"), (Endianness.LITTLE, "<")]
+)
+def test_dump_matches_struct(endianness: Endianness, byteorder: str) -> None:
+    expected = struct.pack(
+        f"{byteorder}IqQbHB2s5s",
+        0xDEADBEEF,
+        -42,
+        1 << 40,
+        -1,
+        0x1234,
+        ord("k"),
+        b"\x01\x02",
+        b"abc",
+    )
+
+    assert RECORD.dump(endianness=endianness) == expected
+    assert repr(Record.parse(expected, endianness=endianness)) == repr(RECORD)
+
+
+def test_struct_backed_source() -> None:
+    assert "pack(" in Record.__bytex_source__["dump"]
+    assert "unpack_from(" in Record.__bytex_source__["decode_from"]
+    assert "dump" not in Packed.__bytex_source__
+    assert "dump" not in Message.__bytex_source__
+
+
+@pytest.mark.parametrize("endianness", [Endianness.BIG, Endianness.LITTLE])
+def test_pack_into_and_unpack_from(endianness: Endianness) -> None:
+    size = Record.size()
+    buffer = bytearray(3 + 2 * size)
+
+    RECORD.pack_into(buffer, 3, endianness=endianness)
+    RECORD.pack_into(buffer, 3 + size, endianness=endianness)
+
+    assert buffer[:3] == b"\x00\x00\x00"
+    assert bytes(buffer[3 : 3 + size]) == RECORD.dump(endianness=endianness)
+
+    for offset in (3, 3 + size):
+        record = Record.unpack_from(buffer, offset, endianness=endianness)
+        assert repr(record) == repr(RECORD)
+
+
+@pytest.mark.parametrize("structure", [RECORD, Message(length=3, text="abc")])
+def test_pack_into_out_of_bounds(structure: Structure) -> None:
+    buffer = bytearray(len(structure.dump()))
+
+    with pytest.raises(StructureError):
+        structure.pack_into(buffer, 1)
+
+    with pytest.raises(StructureError):
+        structure.pack_into(buffer, -1)
+
+    assert buffer == bytearray(len(buffer))
+
+
+def test_pack_into_variable_size() -> None:
+    message = Message(length=3, text="abc")
+    buffer = bytearray(8)
+
+    message.pack_into(buffer, 2, endianness=Endianness.BIG)
+
+    assert buffer == bytearray(b"\x00\x00\x03\x03abc\x00")
+    assert Message.unpack_from(buffer, 2, endianness=Endianness.BIG).text == "abc"
+
+
+def test_unpack_from_insufficient_data() -> None:
+    data = RECORD.dump()
+
+    with pytest.raises(InsufficientDataError):
+        Record.unpack_from(data, 1)
@@ -0,0 +1,181 @@
+import asyncio
+from typing import Annotated, Any, List
+
+import pytest
+
+from bytex import Structure
+from bytex.aio import RecordProtocol, connect, serve
+from bytex.length_encodings import Terminator
+from bytex.types import U8, U32, Data
+
+
+class Message(Structure):
+    kind: U8
+    sequence: U32
+    text: Annotated[str, Terminator("\0")]
+
+
+class Upload(Structure):
+    name: Annotated[str, Terminator("\0")]
+    body: Data
+
+
+MESSAGES = [
+    Message(kind=index % 3, sequence=index, text="x" * index) for index in range(200)
+]
+
+
+def reprs(records) -> List[str]:
+    return [repr(record) for record in records]
+
+
+def echo(message: Message, protocol: RecordProtocol[Message]) -> None:
+    protocol.send(message)
+
+
+async def start(handler: Any, structure_class: Any = Message) -> asyncio.Server:
+    return await serve(handler, structure_class, "127.0.0.1", 0)
+
+
+def port_of(server: asyncio.Server) -> int:
+    return server.sockets[0].getsockname()[1]
+
+
+async def receive(protocol: RecordProtocol[Message], count: int) -> List[Message]:
+    return [await protocol.receive() for _ in range(count)]
+
+
+def test_echo() -> None:
+    async def exchange() -> List[Message]:
+        server = await start(echo)
+        async with server:
+            client = await connect(None, Message, "127.0.0.1", port_of(server))
+            client.send_many(MESSAGES[:100])
+            for message in MESSAGES[100:]:
+                client.send(message)
+
+            received = await receive(client, len(MESSAGES))
+            client.close()
+            await client.wait_closed()
+
+            return received
+
+    assert reprs(asyncio.run(exchange())) == reprs(MESSAGES)
+
+
+def test_sends_are_coalesced() -> None:
+    async def exchange() -> List[int]:
+        server = await start(echo)
+        async with server:
+            client = await connect(None, Message, "127.0.0.1", port_of(server))
+            assert client.transport is not None
+            writes: List[int] = []
+            write = client.transport.write
+
+            def recording_write(data: Any) -> None:
+                writes.append(len(data))
+                write(data)
+
+            client.transport.write = recording_write  # type: ignore[method-assign]
+
+            for message in MESSAGES:
+                client.send(message)
+            await client.drain()
+
+            await receive(client, len(MESSAGES))
+            client.close()
+
+            return writes
+
+    assert asyncio.run(exchange()) == [len(Message.dump_many(MESSAGES))]
+
+
+def test_async_handler() -> None:
+    async def delayed_echo(message: Message, protocol: RecordProtocol[Message]) -> None:
+        await asyncio.sleep(0.001 * (message.sequence % 2))
+        protocol.send(message)
+
+    async def exchange() -> List[Message]:
+        server = await start(delayed_echo)
+        async with server:
+            client = await connect(None, Message, "127.0.0.1", port_of(server))
+            client.send_many(MESSAGES[:10])
+            received = await receive(client, 10)
+            client.close()
+
+            return received
+
+    received = asyncio.run(exchange())
+
+    assert sorted(reprs(received)) == sorted(reprs(MESSAGES[:10]))
+
+
+def test_client_handler() -> None:
+    async def exchange() -> List[Message]:
+        received: List[Message] = []
+        done = asyncio.get_running_loop().create_future()
+
+        def collect(message: Message, protocol: RecordProtocol[Message]) -> None:
+            received.append(message)
+            if len(received) == len(MESSAGES):
+                done.set_result(None)
+
+        server = await start(echo)
+        async with server:
+            client = await connect(collect, Message, "127.0.0.1", port_of(server))
+            client.send_many(MESSAGES)
+            await done
+            client.close()
+
+            with pytest.raises(RuntimeError):
+                await client.receive()
+
+        return received
+
+    assert reprs(asyncio.run(exchange())) == reprs(MESSAGES)
+
+
+def test_handler_error_aborts_connection() -> None:
+    async def exchange() -> None:
+        server_protocols: List[RecordProtocol[Message]] = []
+
+        def failing(message: Message, protocol: RecordProtocol[Message]) -> None:
+            server_protocols.append(protocol)
+            raise ValueError(message.sequence)
+
+        server = await start(failing)
+        async with server:
+            client = await connect(None, Message, "127.0.0.1", port_of(server))
+            client.send(MESSAGES[7])
+
+            with pytest.raises(ConnectionError):
+                await client.receive()
+            with pytest.raises(ConnectionError):
+                client.send(MESSAGES[0])
+
+            with pytest.raises(ValueError, match="7"):
+                await server_protocols[0].wait_closed()
+
+    asyncio.run(exchange())
+
+
+def test_records_ending_with_the_connection() -> None:
+    uploads = [Upload(name="a.txt", body=b"hello"), Upload(name="b.txt", body=b"")]
+
+    async def exchange(upload: Upload) -> Upload:
+        received = asyncio.get_running_loop().create_future()
+
+        def store(upload: Upload, protocol: RecordProtocol[Upload]) -> None:
+            received.set_result(upload)
+
+        server = await start(store, Upload)
+        async with server:
+            client = await connect(None, Upload, "127.0.0.1", port_of(server))
+            client.send(upload)
+            client.close()
+            await client.wait_closed()
+
+            return await received
+
+    for upload in uploads:
+        assert repr(asyncio.run(exchange(upload))) == repr(upload)
@@ -85,3 +85,13 @@ def test_read_too_many_bits(initial_bits: Bits, read_count: int) -> None:
 
     with pytest.raises(InsufficientDataError):
         buffer.read(read_count)
+
+
+def test_write_unaligned_chunks() -> None:
+    buffer = BitBuffer()
+    buffer.write(string_to_bits("101"))
+    buffer.write(string_to_bits("0" * 8))
+    buffer.write(string_to_bits("11111"))
+
+    assert buffer.to_bytes() == bytes([0b10100000, 0b00011111])
+    assert buffer.read_int(3) == 0b101
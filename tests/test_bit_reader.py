@@ -0,0 +1,119 @@
+import pytest
+
+from bytex.bits import BitReader, Bits, bits_to_string, string_to_bits
+from bytex.errors import AlignmentError, InsufficientDataError
+
+
+@pytest.mark.parametrize(
+    "data, expected_bits",
+    [
+        (bytes([0b10101010]), string_to_bits("10101010")),
+        (bytes([0xFF, 0x00]), string_to_bits("11111111" "00000000")),
+        (bytearray([0b11001100]), string_to_bits("11001100")),
+        (memoryview(bytes([0b00000001])), string_to_bits("00000001")),
+    ],
+)
+def test_read(data: bytes, expected_bits: Bits) -> None:
+    reader = BitReader(data)
+
+    bits = reader.read(len(expected_bits))
+
+    assert (
+        bits == expected_bits
+    ), f"{bits_to_string(bits)} != {bits_to_string(expected_bits)}"
+    assert len(reader) == 0
+
+
+@pytest.mark.parametrize(
+    "data, counts, expected_values",
+    [
+        (bytes([0b10110011]), [1, 3, 4], [0b1, 0b011, 0b0011]),
+        (bytes([0x12, 0x34, 0x56]), [4, 16, 4], [0x1, 0x2345, 0x6]),
+        (bytes([0xFF, 0x00]), [7, 2, 7], [0x7F, 0b10, 0]),
+    ],
+)
+def test_read_int(data: bytes, counts: list, expected_values: list) -> None:
+    reader = BitReader(data)
+
+    assert [reader.read_int(count) for count in counts] == expected_values
+    assert reader.offset == sum(counts)
+
+
+def test_peek_does_not_consume() -> None:
+    reader = BitReader(bytes([0b10100000]))
+
+    assert reader.peek(3) == string_to_bits("101")
+    assert reader.peek_int(3) == 0b101
+    assert reader.offset == 0
+    assert len(reader) == 8
+
+
+def test_skip() -> None:
+    reader = BitReader(bytes([0x00, 0xAB]))
+
+    reader.skip(8)
+
+    assert reader.read_int(8) == 0xAB
+
+
+def test_read_bytes_aligned_does_not_copy() -> None:
+    data = bytearray(b"\x01\x02\x03\x04")
+    reader = BitReader(data)
+    reader.skip(8)
+
+    result = reader.read_bytes(2)
+    data[1] = 0xFF
+
+    assert isinstance(result, memoryview)
+    assert bytes(result) == b"\xff\x03"
+    assert len(reader) == 8
+
+
+def test_read_bytes_unaligned() -> None:
+    reader = BitReader(bytes([0x0A, 0xBC, 0xD0]))
+    reader.skip(4)
+
+    assert bytes(reader.read_bytes(2)) == b"\xab\xcd"
+    assert len(reader) == 4
+
+
+def test_bit_range() -> None:
+    reader = BitReader(bytes([0x12, 0x34, 0x56]), bit_offset=8, bit_count=8)
+
+    assert len(reader) == 8
+    assert reader.to_bytes() == b"\x34"
+
+    with pytest.raises(InsufficientDataError):
+        reader.read(9)
+
+
+@pytest.mark.parametrize("count", [1, 4, 8])
+def test_to_bytes_raises_on_unaligned_length(count: int) -> None:
+    reader = BitReader(bytes([0x00, 0x00]))
+    reader.skip(count)
+
+    if count % 8 != 0:
+        with pytest.raises(AlignmentError):
+            reader.to_bytes()
+    else:
+        assert reader.to_bytes() == b"\x00"
+
+
+@pytest.mark.parametrize(
+    "data, read_count",
+    [
+        (b"", 1),
+        (b"\x00", 9),
+        (b"\x00\x00", 17),
+    ],
+)
+def test_read_too_many_bits(data: bytes, read_count: int) -> None:
+    reader = BitReader(data)
+
+    with pytest.raises(InsufficientDataError):
+        reader.read(read_count)
+
+    with pytest.raises(InsufficientDataError):
+        reader.skip(read_count)
+
+    assert reader.offset == 0
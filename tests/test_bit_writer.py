@@ -0,0 +1,116 @@
+import pytest
+
+from bytex.bits import BitWriter, Bits, string_to_bits
+from bytex.errors import AlignmentError, InsufficientSpaceError
+
+
+@pytest.mark.parametrize(
+    "bits, expected_bytes",
+    [
+        (string_to_bits("10101010"), bytes([0b10101010])),
+        (string_to_bits("11111111" "00000000"), bytes([0xFF, 0x00])),
+        (string_to_bits(""), b""),
+    ],
+)
+def test_write_bits(bits: Bits, expected_bytes: bytes) -> None:
+    writer = BitWriter()
+    writer.write(bits)
+
+    assert writer.to_bytes() == expected_bytes
+    assert len(writer) == len(bits)
+
+
+@pytest.mark.parametrize(
+    "values, expected_bytes",
+    [
+        ([(0x1234, 16)], b"\x12\x34"),
+        ([(0b101, 3), (0b00001, 5)], bytes([0b10100001])),
+        ([(0x1, 4), (0x234, 12)], b"\x12\x34"),
+        ([(1, 1), (0xFFFF, 16), (0, 7)], bytes([0xFF, 0xFF, 0x80])),
+    ],
+)
+def test_write_int(values: list, expected_bytes: bytes) -> None:
+    writer = BitWriter()
+
+    for value, count in values:
+        writer.write_int(value, count)
+
+    assert writer.to_bytes() == expected_bytes
+
+
+def test_write_bytes_unaligned() -> None:
+    writer = BitWriter()
+    writer.write_int(0xA, 4)
+    writer.write_bytes(b"\xbc\xde")
+    writer.write_int(0xF, 4)
+
+    assert writer.to_bytes() == b"\xab\xcd\xef"
+
+
+def test_to_bits_includes_pending_bits() -> None:
+    writer = BitWriter()
+    writer.write_int(0xFF, 8)
+    writer.write_int(0b01, 2)
+
+    assert writer.to_bits() == string_to_bits("11111111" "01")
+    assert not writer.is_aligned()
+
+
+def test_to_bytes_raises_on_unaligned() -> None:
+    writer = BitWriter()
+    writer.write_int(0b1, 1)
+
+    with pytest.raises(AlignmentError):
+        writer.to_bytes()
+
+
+def test_write_into_buffer() -> None:
+    buffer = bytearray(b"\xff" * 5)
+    writer = BitWriter(buffer, 1)
+    writer.write_int(0xA, 4)
+    writer.write_bytes(b"\xbc")
+    writer.write_int(0xD, 4)
+
+    assert buffer == bytearray(b"\xff\xab\xcd\xff\xff")
+    assert writer.position == 3
+    assert writer.to_bytes() == b"\xab\xcd"
+    assert len(writer) == 16
+
+
+def test_write_into_memoryview() -> None:
+    buffer = bytearray(4)
+    writer = BitWriter(memoryview(buffer), 2)
+    writer.write_bytes(b"ab")
+
+    assert buffer == bytearray(b"\x00\x00ab")
+
+
+def test_write_into_buffer_overflow() -> None:
+    buffer = bytearray(2)
+    writer = BitWriter(buffer, 1)
+    writer.write_int(0xAB, 8)
+
+    with pytest.raises(InsufficientSpaceError):
+        writer.write_int(0xCD, 8)
+
+    assert buffer == bytearray(b"\x00\xab")
+
+
+@pytest.mark.parametrize("offset", [-1, 3])
+def test_write_into_buffer_invalid_offset(offset: int) -> None:
+    with pytest.raises(InsufficientSpaceError):
+        BitWriter(bytearray(2), offset)
+
+
+def test_getbuffer() -> None:
+    buffer = bytearray(4)
+    writer = BitWriter(buffer, 1)
+    writer.write_bytes(b"ab")
+
+    with writer.getbuffer() as view:
+        assert view.obj is buffer
+        assert bytes(view) == b"ab"
+
+    writer.write(string_to_bits("1"))
+    with pytest.raises(AlignmentError):
+        writer.getbuffer()
@@ -0,0 +1,124 @@
+import array
+from pathlib import Path
+
+import pytest
+
+from bytex import (
+    Endianness,
+    StructArray,
+    Structure,
+    column,
+    column_histogram,
+    column_max,
+    column_min,
+    column_sum,
+    open_records,
+)
+from bytex.errors import StructureError, ValidationError
+from bytex.types import I8, I32, U4, U8, U16, U64
+
+
+class Ports(Structure):
+    source: U16
+    destination: U16
+
+
+class Segment(Structure):
+    ports: Ports
+    window: U16
+    offset: I32
+    flags: U8
+    unaligned: U16
+    low: U4
+    high: U4
+    delta: I8
+    total: U64
+
+
+SEGMENTS = [
+    Segment(
+        ports=Ports(source=1000 + i, destination=80),
+        window=i * 100,
+        offset=-i,
+        flags=i % 3,
+        unaligned=0xABCD + i,
+        low=1,
+        high=2,
+        delta=-i,
+        total=(1 << 40) + i,
+    )
+    for i in range(10)
+]
+
+FIELDS = [
+    ("ports.source", lambda s: s.ports.source),
+    ("window", lambda s: s.window),
+    ("offset", lambda s: s.offset),
+    ("flags", lambda s: s.flags),
+    ("unaligned", lambda s: s.unaligned),
+    ("delta", lambda s: s.delta),
+    ("total", lambda s: s.total),
+]
+
+
+@pytest.mark.parametrize("endianness", [Endianness.BIG, Endianness.LITTLE])
+@pytest.mark.parametrize("field, getter", FIELDS)
+def test_column(endianness: Endianness, field: str, getter) -> None:
+    data = Segment.dump_many(SEGMENTS, endianness=endianness)
+    expected = [getter(segment) for segment in SEGMENTS]
+
+    assert list(column(data, Segment, field, endianness)) == expected
+    assert column_sum(data, Segment, field, endianness) == sum(expected)
+    assert column_min(data, Segment, field, endianness) == min(expected)
+    assert column_max(data, Segment, field, endianness) == max(expected)
+
+
+def test_column_result_types() -> None:
+    data = bytearray(Segment.dump_many(SEGMENTS, endianness=Endianness.BIG))
+
+    assert isinstance(column(data, Segment, "flags", Endianness.BIG), memoryview)
+    assert isinstance(column(data, Segment, "window", Endianness.BIG), array.array)
+
+
+def test_column_histogram() -> None:
+    data = Segment.dump_many(SEGMENTS)
+
+    assert column_histogram(data, Segment, "flags") == {0: 4, 1: 3, 2: 3}
+    assert column_histogram(data, Segment, "window", bin_width=500) == {0: 5, 500: 5}
+
+    with pytest.raises(ValidationError):
+        column_histogram(data, Segment, "window", bin_width=0)
+
+
+def test_column_empty() -> None:
+    assert list(column(b"", Segment, "window")) == []
+    assert column_sum(b"", Segment, "window") == 0
+
+    with pytest.raises(ValueError):
+        column_min(b"", Segment, "window")
+
+
+@pytest.mark.parametrize("field", ["low", "ports", "missing", "window.x"])
+def test_column_invalid_field(field: str) -> None:
+    with pytest.raises(StructureError):
+        column(b"", Segment, field)
+
+
+def test_column_truncated_buffer() -> None:
+    with pytest.raises(StructureError):
+        column(Segment.dump_many(SEGMENTS)[:-1], Segment, "window")
+
+
+def test_struct_array_column() -> None:
+    segments = StructArray(Segment, SEGMENTS, endianness=Endianness.BIG)
+
+    assert list(segments.column("window")) == [s.window for s in SEGMENTS]
+    assert list(segments[2:4].column("flags")) == [2, 0]
+
+
+def test_record_file_column(tmp_path: Path) -> None:
+    path = tmp_path / "segments.bin"
+    path.write_bytes(Segment.dump_many(SEGMENTS))
+
+    with open_records(path, Segment) as segments:
+        assert sum(segments.column("window")) == sum(s.window for s in SEGMENTS)
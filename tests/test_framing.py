@@ -0,0 +1,159 @@
+from typing import Annotated, List
+
+import pytest
+
+from bytex import Endianness, Structure
+from bytex.errors import (
+    FrameSizeError,
+    InsufficientDataError,
+    ParsingError,
+    StructureCreationError,
+)
+from bytex.framing import FrameParser, Framing, Varint, decode_varint, encode_varint
+from bytex.length_encodings import Prefix, Terminator
+from bytex.types import I16, U4, U8, U16, U32, DataView
+
+
+class Message(Structure):
+    kind: U8
+    text: Annotated[str, Terminator("\0")]
+
+
+class Blob(Structure):
+    kind: U8
+    data: DataView
+
+
+MESSAGES = [Message(kind=index, text="x" * index * 30) for index in range(8)]
+PREFIXES = [Prefix(U8), Prefix(U16), Prefix(U32), Varint()]
+
+
+def reprs(records) -> List[str]:
+    return [repr(record) for record in records]
+
+
+@pytest.mark.parametrize(
+    "value, encoded",
+    [(0, b"\x00"), (127, b"\x7f"), (128, b"\x80\x01"), (300, b"\xac\x02")],
+)
+def test_varint(value: int, encoded: bytes) -> None:
+    assert encode_varint(value) == encoded
+    assert decode_varint(b"\xff" + encoded, 1, 1 << 32) == (value, len(encoded) + 1)
+    assert decode_varint(encoded[:-1], 0, 1 << 32) is None
+
+
+@pytest.mark.parametrize("prefix", PREFIXES)
+@pytest.mark.parametrize("endianness", [Endianness.BIG, Endianness.LITTLE])
+def test_dump_many_and_parse_many(prefix, endianness: Endianness) -> None:
+    framing = Framing(Message, prefix, endianness=endianness)
+    data = framing.dump_many(MESSAGES)
+
+    assert data == b"".join(framing.dump(message) for message in MESSAGES)
+
+    records, consumed = framing.parse_many(data + framing.dump(MESSAGES[7])[:-1])
+
+    assert reprs(records) == reprs(MESSAGES)
+    assert consumed == len(data)
+
+
+def test_split_returns_views() -> None:
+    framing = Framing(Message, Prefix(U16), endianness=Endianness.BIG)
+    buffer = bytearray(framing.dump_many(MESSAGES[:2]))
+
+    payloads, consumed = framing.split(buffer)
+
+    assert consumed == len(buffer)
+    assert [bytes(payload) for payload in payloads] == [
+        message.dump(endianness=Endianness.BIG) for message in MESSAGES[:2]
+    ]
+    assert all(payload.obj is buffer for payload in payloads)
+
+
+@pytest.mark.parametrize("prefix", PREFIXES)
+@pytest.mark.parametrize("chunk_size", [1, 5, 1 << 16])
+def test_frame_parser(prefix, chunk_size: int) -> None:
+    framing = Framing(Message, prefix)
+    data = framing.dump_many(MESSAGES)
+    parser = FrameParser(framing)
+
+    records = []
+    for index in range(0, len(data), chunk_size):
+        records += parser.feed(data[index : index + chunk_size])
+
+    assert reprs(records) == reprs(MESSAGES)
+    assert parser.pending == 0
+    parser.close()
+
+
+def test_frame_parser_keeps_views_valid() -> None:
+    framing = Framing(Blob, Varint())
+    blobs = [
+        Blob(kind=index, data=memoryview(bytes([index]) * 10)) for index in range(4)
+    ]
+    data = framing.dump_many(blobs)
+    parser = FrameParser(framing)
+
+    records = []
+    for index in range(0, len(data), 7):
+        records += parser.feed(data[index : index + 7])
+
+    assert [bytes(record.data) for record in records] == [
+        bytes(blob.data) for blob in blobs
+    ]
+
+
+def test_close_in_the_middle_of_a_frame() -> None:
+    parser = FrameParser(Framing(Message))
+    parser.feed(Framing(Message).dump(MESSAGES[1])[:-1])
+
+    with pytest.raises(InsufficientDataError):
+        parser.close()
+
+
+@pytest.mark.parametrize("prefix", PREFIXES)
+def test_max_frame_size(prefix) -> None:
+    framing = Framing(Message, prefix, max_frame_size=100)
+
+    with pytest.raises(FrameSizeError):
+        framing.dump(MESSAGES[5])
+
+    oversized = Framing(Message, prefix).dump(MESSAGES[5])
+    parser = FrameParser(framing)
+
+    # Rejected from the prefix alone, before the frame is buffered.
+    with pytest.raises(FrameSizeError):
+        parser.feed(oversized[:4])
+
+
+@pytest.mark.parametrize("prefix", [b"\x80" * 100, b"\x81" + b"\x80" * 8 + b"\x00"])
+def test_overlong_varint(prefix: bytes) -> None:
+    parser = FrameParser(Framing(Message, Varint()))
+
+    # The default maximum takes 4 bytes, a longer prefix is rejected as soon as it
+    # is, not buffered for good.
+    with pytest.raises(FrameSizeError):
+        for index in range(len(prefix)):
+            parser.feed(prefix[index : index + 1])
+
+    assert index == 3
+    assert decode_varint(b"\x80" * 3, 0, 1 << 24) is None
+
+    with pytest.raises(FrameSizeError):
+        decode_varint(b"\x80" * 10, 0, 1 << 100)
+
+
+def test_prefix_limits_max_frame_size() -> None:
+    assert Framing(Message, Prefix(U8)).max_frame_size == 255
+
+
+def test_trailing_data_in_frame() -> None:
+    framing = Framing(Message, Varint())
+
+    with pytest.raises(ParsingError):
+        framing.parse_many(encode_varint(4) + b"\x01a\0b")
+
+
+@pytest.mark.parametrize("prefix", [Prefix(I16), Prefix(U4), "U32"])
+def test_invalid_prefix(prefix) -> None:
+    with pytest.raises(StructureCreationError):
+        Framing(Message, prefix)
@@ -0,0 +1,62 @@
+from pathlib import Path
+
+import pytest
+
+from bytex import Endianness, Structure, open_records
+from bytex.errors import StructureError
+from bytex.types import U16, U32
+
+
+class Entry(Structure):
+    identifier: U32
+    value: U16
+
+
+ENTRIES = [Entry(identifier=i, value=3 * i) for i in range(100)]
+
+
+@pytest.mark.parametrize("endianness", [Endianness.BIG, Endianness.LITTLE])
+def test_open_records(tmp_path: Path, endianness: Endianness) -> None:
+    path = tmp_path / "entries.bin"
+    path.write_bytes(Entry.dump_many(ENTRIES, endianness=endianness))
+
+    with open_records(path, Entry, endianness=endianness) as records:
+        assert len(records) == 100
+        assert records.endianness is endianness
+        assert repr(records[42]) == repr(ENTRIES[42])
+        assert repr(records[-1]) == repr(ENTRIES[-1])
+        assert [entry.value for entry in records[10:13]] == [30, 33, 36]
+        assert [repr(entry) for entry in records] == [repr(e) for e in ENTRIES]
+
+        with pytest.raises(IndexError):
+            records[100]
+
+
+def test_open_records_is_read_only(tmp_path: Path) -> None:
+    path = tmp_path / "entries.bin"
+    path.write_bytes(Entry.dump_many(ENTRIES[:2]))
+
+    with open_records(path, Entry) as records:
+        view = records[:]
+
+        with pytest.raises(TypeError):
+            view[0] = ENTRIES[1]
+
+        del view
+
+
+def test_open_empty_file(tmp_path: Path) -> None:
+    path = tmp_path / "empty.bin"
+    path.write_bytes(b"")
+
+    with open_records(path, Entry) as records:
+        assert len(records) == 0
+        assert list(records) == []
+
+
+def test_open_truncated_file(tmp_path: Path) -> None:
+    path = tmp_path / "truncated.bin"
+    path.write_bytes(Entry.dump_many(ENTRIES[:2])[:-1])
+
+    with pytest.raises(StructureError):
+        open_records(path, Entry)
@@ -0,0 +1,185 @@
+from dataclasses import dataclass
+from typing import Annotated, List
+
+import pytest
+
+from bytex import BitReader, Endianness, StreamParser, Structure
+from bytex.bits import Bits, from_bits, to_bits
+from bytex.codecs import BaseCodec, IntegerCodec
+from bytex.errors import InsufficientDataError, ParsingError, ValidationError
+from bytex.length_encodings import Exact, Prefix, Terminator
+from bytex.types import U8, U16, U32, Data
+
+
+class Header(Structure):
+    key: Annotated[str, Terminator(": ")]
+    value: Annotated[str, Terminator("\r\n")]
+
+
+class Message(Structure):
+    kind: U8
+    headers: Annotated[List[Header], Terminator("\r\n")]
+    payload: Annotated[bytes, Prefix(U16)]
+    checksums: Annotated[List[U32], Exact(2)]
+    tags: Annotated[List[U16], Terminator(b"\xff\xff")]
+
+
+class Point(Structure):
+    x: U16
+    y: U16
+
+
+class Response(Structure):
+    status: Annotated[str, Terminator("\r\n")]
+    body: Data
+
+
+class Empty(Structure):
+    pass
+
+
+@dataclass(frozen=True)
+class PascalStringCodec(BaseCodec[str]):
+    """
+    A codec that only implements the bit protocol, so it is measured by retrying.
+    """
+
+    def serialize(self, value: str, endianness: Endianness) -> Bits:
+        data = value.encode()
+        return to_bits(bytes([len(data)]) + data)
+
+    def deserialize(self, bit_buffer: BitReader, endianness: Endianness) -> str:
+        length = from_bits(bit_buffer.read(8))[0]
+        return bytes(bit_buffer.read_bytes(length)).decode()
+
+    def validate(self, value: str) -> None:
+        pass
+
+
+class Named(Structure):
+    kind: U8
+    name: Annotated[str, PascalStringCodec()]
+
+
+MESSAGES = [
+    Message(
+        kind=index,
+        headers=[Header(key=f"key{i}", value="v" * i) for i in range(index)],
+        payload=bytes(range(index * 10)),
+        checksums=[index, index * 1000],
+        tags=list(range(index)),
+    )
+    for index in range(6)
+]
+
+
+def split(data: bytes, size: int) -> List[bytes]:
+    return [data[index : index + size] for index in range(0, len(data), size)]
+
+
+@pytest.mark.parametrize("endianness", [Endianness.BIG, Endianness.LITTLE])
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 7, 64, 1 << 16])
+def test_feed(endianness: Endianness, chunk_size: int) -> None:
+    data = b"".join(message.dump(endianness=endianness) for message in MESSAGES)
+    parser = StreamParser(Message, endianness=endianness)
+
+    records = []
+    for chunk in split(data, chunk_size):
+        records += parser.feed(chunk)
+
+    assert [repr(record) for record in records] == [repr(m) for m in MESSAGES]
+    assert parser.pending == 0
+    assert parser.close() == []
+
+
+def test_feed_returns_completed_records() -> None:
+    point = Point(x=1, y=2).dump()
+    parser = StreamParser(Point)
+
+    assert parser.feed(point[:3]) == []
+    assert parser.pending == 3
+
+    records = parser.feed(point[3:] + point + point[:1])
+
+    assert [repr(record) for record in records] == [repr(Point(x=1, y=2))] * 2
+    assert parser.pending == 1
+
+
+class ScanCountingBuffer(bytearray):
+    scanned = 0
+
+    def find(self, sub, start=0, *args) -> int:  # type: ignore[override]
+        self.scanned += len(self) - start
+        return super().find(sub, start, *args)
+
+
+def test_feed_scans_every_byte_once() -> None:
+    header = Header(key="k" * 5000, value="v" * 5000)
+    data = header.dump()
+    parser = StreamParser(Header)
+    buffer = parser._buffer = ScanCountingBuffer()
+
+    records = []
+    for chunk in split(data, 1):
+        records += parser.feed(chunk)
+
+    assert [repr(record) for record in records] == [repr(header)]
+    assert 0 < buffer.scanned <= 2 * len(data)
+
+
+def test_close_returns_record_ending_with_data() -> None:
+    response = Response(status="200 OK", body=b"hello, world")
+    parser = StreamParser(Response, endianness=Endianness.BIG)
+
+    for chunk in split(response.dump(endianness=Endianness.BIG), 4):
+        assert parser.feed(chunk) == []
+
+    (record,) = parser.close()
+
+    assert repr(record) == repr(response)
+
+
+def test_close_in_the_middle_of_a_record() -> None:
+    parser = StreamParser(Point)
+    parser.feed(b"\x00\x01\x02")
+
+    with pytest.raises(InsufficientDataError):
+        parser.close()
+
+    with pytest.raises(ParsingError):
+        parser.feed(b"\x03")
+
+
+def test_feed_validate(monkeypatch: pytest.MonkeyPatch) -> None:
+    data = Point(x=1, y=2).dump()
+
+    def fail(self: IntegerCodec, value: int) -> None:
+        raise ValidationError("invalid")
+
+    monkeypatch.setattr(IntegerCodec, "validate", fail)
+
+    assert len(StreamParser(Point).feed(data)) == 1
+
+    with pytest.raises(ValidationError):
+        StreamParser(Point, validate=True).feed(data)
+
+
+def test_feed_empty_structure() -> None:
+    assert StreamParser(Empty).feed(b"") == []
+
+    with pytest.raises(ParsingError):
+        StreamParser(Empty).feed(b"\x00")
+
+
+def test_feed_bit_protocol_codec_byte_by_byte() -> None:
+    named = [Named(kind=index, name="n" * index * 40) for index in range(4)]
+    data = Named.dump_many(named)
+    parser = StreamParser(Named)
+
+    records = [
+        record
+        for index in range(len(data))
+        for record in parser.feed(data[index : index + 1])
+    ]
+
+    assert [repr(record) for record in records] == [repr(record) for record in named]
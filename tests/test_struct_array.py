@@ -0,0 +1,126 @@
+import pytest
+
+from bytex import Endianness, StructArray, Structure
+from bytex.errors import StructureError, ValidationError
+from bytex.types import I64, U8, U16, U32
+
+
+class Point(Structure):
+    x: U16
+    y: U16
+
+
+class Record(Structure):
+    identifier: U32
+    balance: I64
+    counter: I64
+    kind: U8
+    flags: U8
+    code: U16
+
+
+class Other(Structure):
+    x: U16
+    y: U16
+
+
+POINTS = [Point(x=i, y=2 * i) for i in range(5)]
+
+
+def _reprs(records: object) -> list:
+    return [repr(record) for record in records]  # type: ignore[attr-defined]
+
+
+@pytest.mark.parametrize("endianness", [Endianness.BIG, Endianness.LITTLE])
+def test_struct_array(endianness: Endianness) -> None:
+    array = StructArray(Point, POINTS, endianness=endianness)
+
+    assert len(array) == 5
+    assert bytes(array) == b"".join(point.dump(endianness) for point in POINTS)
+    assert repr(array[1]) == repr(POINTS[1])
+    assert repr(array[-1]) == repr(POINTS[-1])
+    assert _reprs(array) == _reprs(POINTS)
+
+
+def test_append_and_extend() -> None:
+    array = StructArray(Point)
+    array.append(POINTS[0])
+    array.extend(POINTS[1:3])
+    array.extend(point for point in POINTS[3:])
+    array.extend(StructArray(Point, POINTS[:1]))
+
+    assert _reprs(array) == _reprs(POINTS + POINTS[:1])
+    assert array.buffer == bytearray(Point.dump_many(POINTS + POINTS[:1]))
+
+
+def test_setitem() -> None:
+    array = StructArray(Point, POINTS)
+    array[2] = Point(x=7, y=8)
+
+    assert array[2].x == 7
+    assert repr(array[3]) == repr(POINTS[3])
+
+
+def test_index_out_of_range() -> None:
+    array = StructArray(Point, POINTS)
+
+    with pytest.raises(IndexError):
+        array[5]
+
+    with pytest.raises(IndexError):
+        array[-6] = POINTS[0]
+
+
+def test_slices_are_views() -> None:
+    array = StructArray(Point, POINTS)
+    view = array[1:3]
+
+    assert _reprs(view) == _reprs(POINTS[1:3])
+
+    view[0] = Point(x=9, y=9)
+    assert array[1].x == 9
+
+    with pytest.raises(StructureError):
+        view.append(POINTS[0])
+
+    assert _reprs(array[::2]) == _reprs([array[0], array[2], array[4]])
+    assert len(array[3:1]) == 0
+
+
+def test_from_buffer() -> None:
+    data = Point.dump_many(POINTS, endianness=Endianness.BIG)
+    array = StructArray.from_buffer(Point, data, endianness=Endianness.BIG)
+
+    assert _reprs(array) == _reprs(POINTS)
+
+    with pytest.raises(StructureError):
+        StructArray.from_buffer(Point, data[:-1])
+
+
+def test_from_bytearray_shares_buffer() -> None:
+    buffer = bytearray()
+    array = StructArray.from_buffer(Point, buffer)
+    array.append(POINTS[1])
+
+    assert buffer == bytearray(POINTS[1].dump())
+
+
+def test_rejects_other_structures() -> None:
+    array = StructArray(Point)
+
+    with pytest.raises(ValidationError):
+        array.append(Other(x=1, y=2))  # type: ignore[arg-type]
+
+    with pytest.raises(ValidationError):
+        array.extend([POINTS[0], Other(x=1, y=2)])  # type: ignore[list-item]
+
+    assert len(array) == 0
+
+
+def test_memory_is_one_buffer() -> None:
+    record = Record(identifier=1, balance=-1, counter=2, kind=3, flags=4, code=5)
+    array = StructArray(Record, [record] * 1000)
+
+    assert Record.size() == 24
+    assert len(array.buffer) == 24 * 1000
+    assert repr(array[999]) == repr(record)